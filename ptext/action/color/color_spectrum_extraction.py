@@ -1,3 +1,4 @@
+import typing
 from typing import Optional
 
 from ptext.pdf.canvas.color.color import RGBColor
@@ -19,16 +20,29 @@ class ColorSpectrumExtraction(EventListener):
         self.colors_per_page = {}
         self.current_page = -1
 
+    def get_event_types(self) -> typing.List[typing.Type[Event]]:
+        return [BeginPageEvent, TextRenderEvent, ImageRenderEvent]
+
     def event_occurred(self, event: "Event") -> None:
         if isinstance(event, BeginPageEvent):
+            self.current_page = event.get_page_number()
             self._begin_page(event.get_page())
         if isinstance(event, TextRenderEvent):
             self._render_text(event)
         if isinstance(event, ImageRenderEvent):
             self._render_image(event)
 
+    can_be_merged = True
+
+    def merge(self, other: "EventListener", page_offset: int) -> "EventListener":
+        assert isinstance(other, ColorSpectrumExtraction)
+        for k, v in other.colors_per_page.items():
+            if k >= page_offset:
+                self.colors_per_page[k] = v
+        self.current_page = max(self.current_page, other.current_page)
+        return self
+
     def _begin_page(self, page: "Page"):
-        self.current_page += 1
         self.colors_per_page[self.current_page] = {}
 
     def _render_text(self, event: "TextRenderEvent"):
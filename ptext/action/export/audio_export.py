@@ -1,4 +1,4 @@
-from decimal import Decimal
+import typing
 from typing import Tuple
 
 from gtts import gTTS
@@ -35,15 +35,18 @@ class AudioExport(EventListener):
         self.current_page_size = None
         self.default_page_size = default_page_size
 
+    def get_event_types(self) -> typing.List[typing.Type[Event]]:
+        return [BeginPageEvent, ParagraphRenderEvent]
+
     def event_occurred(self, event: "Event") -> None:
         if isinstance(event, BeginPageEvent):
+            self.current_page = event.get_page_number()
             self._begin_page(event.get_page())
         if isinstance(event, ParagraphRenderEvent):
             self._speak_paragraph(event)
 
     def _begin_page(self, page: "Page"):
-        self.current_page += 1
-        self.current_page = 0
+        self.text_to_speak_for_page.pop(self.current_page, None)
         self.current_page_size = (
             page.get_page_info().get_size() or self.default_page_size
         )
@@ -57,13 +60,8 @@ class AudioExport(EventListener):
         # position
         assert self.current_page_size is not None
         if self.include_position:
-            mid_x = (
-                event.get_bounding_box().x
-                + event.get_bounding_box().height / Decimal(2)
-            )
-            mid_y = (
-                event.get_bounding_box().y + event.get_bounding_box().width / Decimal(2)
-            )
+            mid_x = event.get_bounding_box().x + event.get_bounding_box().height / 2
+            mid_y = event.get_bounding_box().y + event.get_bounding_box().width / 2
 
             xs = [
                 0,
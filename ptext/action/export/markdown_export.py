@@ -1,3 +1,5 @@
+import typing
+
 from ptext.action.structure.list.bullet_list_render_event import BulletListRenderEvent
 from ptext.action.structure.list.ordered_list_render_event import OrderedListRenderEvent
 from ptext.action.structure.paragraph.paragraph_render_event import ParagraphRenderEvent
@@ -11,8 +13,18 @@ class MarkdownExport(EventListener):
         self.current_page = -1
         self.markdown_per_page = {}
 
+    def get_event_types(self) -> typing.List[typing.Type[Event]]:
+        return [
+            BeginPageEvent,
+            TitleRenderEvent,
+            BulletListRenderEvent,
+            OrderedListRenderEvent,
+            ParagraphRenderEvent,
+        ]
+
     def event_occurred(self, event: Event) -> None:
         if isinstance(event, BeginPageEvent):
+            self.current_page = event.get_page_number()
             self._begin_page(event.get_page())
         elif isinstance(event, TitleRenderEvent):
             self._render_title(event)
@@ -24,7 +36,6 @@ class MarkdownExport(EventListener):
             self._render_paragraph(event)
 
     def _begin_page(self, page: "Page"):
-        self.current_page += 1
         self.markdown_per_page[self.current_page] = ""
 
     def _render_title(self, event: "TitleRenderEvent"):
@@ -1,3 +1,4 @@
+import typing
 import xml.etree.ElementTree as ET
 from typing import Optional, Tuple
 
@@ -34,11 +35,21 @@ class SVGExport(EventListener):
         self.current_page_svg_element = None
         self.current_page = -1
 
+    def get_event_types(self) -> typing.List[typing.Type[Event]]:
+        return [
+            BeginPageEvent,
+            EndPageEvent,
+            LineRenderEvent,
+            TextRenderEvent,
+            ImageRenderEvent,
+        ]
+
     def event_occurred(self, event: "Event") -> None:
         if isinstance(event, LineRenderEvent):
             self._render_text_line(event)
             return
         if isinstance(event, BeginPageEvent):
+            self.current_page = event.get_page_number()
             self._begin_page(event.get_page())
         if isinstance(event, EndPageEvent):
             self._end_page(event.get_page())
@@ -49,9 +60,6 @@ class SVGExport(EventListener):
 
     def _begin_page(self, page: "Page"):
 
-        # get page nr
-        self.current_page += 1
-
         # get page size
         page_size = page.get_page_info().get_size()
         if page_size is None and self.default_page_size is None:
@@ -1,3 +1,4 @@
+import typing
 from typing import List
 
 from ptext.pdf.canvas.event.begin_page_event import BeginPageEvent
@@ -11,12 +12,26 @@ class SimpleImageExtraction(EventListener):
         self.image_render_info_per_page = {}
         self.current_page = -1
 
+    def get_event_types(self) -> typing.List[typing.Type[Event]]:
+        return [BeginPageEvent, ImageRenderEvent]
+
     def event_occurred(self, event: "Event") -> None:
         if isinstance(event, BeginPageEvent):
+            self.current_page = event.get_page_number()
             self._begin_page(event.get_page())
         if isinstance(event, ImageRenderEvent):
             self._render_image(event)
 
+    can_be_merged = True
+
+    def merge(self, other: "EventListener", page_offset: int) -> "EventListener":
+        assert isinstance(other, SimpleImageExtraction)
+        for k, v in other.image_render_info_per_page.items():
+            if k >= page_offset:
+                self.image_render_info_per_page[k] = v
+        self.current_page = max(self.current_page, other.current_page)
+        return self
+
     def get_images_per_page(self, page_nr: int) -> List["PIL.Image.Image"]:
         return (
             self.image_render_info_per_page[page_nr]
@@ -36,4 +51,5 @@ class SimpleImageExtraction(EventListener):
         )
 
     def _begin_page(self, page: Page):
-        self.current_page += 1
+        # a page that is processed again (e.g. after it was released) starts over
+        self.image_render_info_per_page.pop(self.current_page, None)
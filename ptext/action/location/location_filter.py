@@ -1,3 +1,5 @@
+import typing
+
 from ptext.pdf.canvas.event.event_listener import EventListener, Event
 from ptext.pdf.canvas.event.image_render_event import ImageRenderEvent
 from ptext.pdf.canvas.event.text_render_event import TextRenderEvent
@@ -19,6 +21,13 @@ class LocationFilter(EventListener):
         self.listeners.append(listener)
         return self
 
+    def get_event_types(self) -> typing.List[typing.Type[Event]]:
+        # this EventListener consumes whatever the EventListener(s) it filters for consume
+        event_types: typing.List[typing.Type[Event]] = []
+        for l in self.listeners:
+            event_types += [x for x in l.get_event_types() if x not in event_types]
+        return event_types
+
     def event_occurred(self, event: "Event") -> None:
         # filter TextRenderEvent
         if isinstance(event, TextRenderEvent):
@@ -37,7 +37,9 @@ class LineRenderEvent(TextRenderEvent):
             delta = abs(right - e.get_baseline().x0)
             space_width = round(e.get_space_character_width_in_text_space(), 1)
             right = max(e.get_baseline().x0, e.get_baseline().x1)
-            text += " " if (space_width * Decimal(0.90) < delta) else ""
+            # (events hold floats when a Document is read using fast math)
+            ratio = 0.90 if isinstance(space_width, float) else Decimal(0.90)
+            text += " " if (space_width * ratio < delta) else ""
             text += e.get_text()
         return text
 
@@ -60,7 +62,9 @@ class LineRenderEvent(TextRenderEvent):
         ls = self.get_baseline()
         max_ascent = max(
             [
-                x.get_font_ascent() * Decimal(0.001) * x.get_font_size()
+                x.get_font_ascent()
+                * (0.001 if isinstance(x.get_font_size(), float) else Decimal(0.001))
+                * x.get_font_size()
                 for x in self.contained_events
             ]
         )
@@ -1,3 +1,5 @@
+import typing
+
 from ptext.action.structure.line.simple_line_render_event_factory import (
     SimpleLineRenderEventFactory,
 )
@@ -25,10 +27,14 @@ class SimpleStructureExtraction(EventListener):
         self.text_render_info_per_page = {}
         self.current_page = -1
 
+    def get_event_types(self) -> typing.List[typing.Type[Event]]:
+        return [BeginPageEvent, EndPageEvent, TextRenderEvent]
+
     def event_occurred(self, event: Event) -> None:
         if isinstance(event, TextRenderEvent):
             self.render_text(event)
         if isinstance(event, BeginPageEvent):
+            self.current_page = event.get_page_number()
             self.begin_page(event.get_page())
         if isinstance(event, EndPageEvent):
             self.end_page(event.get_page())
@@ -43,7 +49,8 @@ class SimpleStructureExtraction(EventListener):
         self.text_render_info_per_page[self.current_page].append(text_render_info)
 
     def begin_page(self, page: Page):
-        self.current_page += 1
+        # a page that is processed again (e.g. after it was released) starts over
+        self.text_render_info_per_page[self.current_page] = []
 
     def end_page(self, page: Page):
 
@@ -1,3 +1,5 @@
+import typing
+
 from ptext.pdf.canvas.event.event_listener import EventListener, Event
 from ptext.pdf.canvas.event.text_render_event import TextRenderEvent
 
@@ -6,6 +8,9 @@ class SimpleTableExtraction(EventListener):
     def __init__(self):
         pass
 
+    def get_event_types(self) -> typing.List[typing.Type[Event]]:
+        return [TextRenderEvent]
+
     def event_occurred(self, event: Event) -> None:
         if isinstance(event, TextRenderEvent):
             self.render_text(event)
@@ -1,3 +1,4 @@
+import typing
 from typing import List
 
 from ptext.pdf.canvas.event.begin_page_event import BeginPageEvent
@@ -9,6 +10,9 @@ class FontExtraction(EventListener):
         self.fonts_per_page = {}
         self.current_page = -1
 
+    def get_event_types(self) -> typing.List[typing.Type[Event]]:
+        return [BeginPageEvent]
+
     def event_occurred(self, event: "Event") -> None:
         if isinstance(event, BeginPageEvent):
             self._begin_page(event)
@@ -16,7 +20,7 @@ class FontExtraction(EventListener):
     def _begin_page(self, event: "BeginPageEvent"):
 
         # update page number
-        self.current_page += 1
+        self.current_page = event.get_page_number()
         self.fonts_per_page[self.current_page] = []
 
         # get page
@@ -1,4 +1,5 @@
 import re
+import typing
 from decimal import Decimal
 from functools import cmp_to_key
 from typing import List
@@ -21,10 +22,14 @@ class RegularExpressionTextExtraction(EventListener):
         self.text_per_page = {}
         self.current_page = -1
 
+    def get_event_types(self) -> typing.List[typing.Type[Event]]:
+        return [BeginPageEvent, EndPageEvent, TextRenderEvent]
+
     def event_occurred(self, event: Event) -> None:
         if isinstance(event, TextRenderEvent):
             self._render_text(event)
         if isinstance(event, BeginPageEvent):
+            self.current_page = event.get_page_number()
             self._begin_page(event.get_page())
         if isinstance(event, EndPageEvent):
             self._end_page(event.get_page())
@@ -44,7 +49,9 @@ class RegularExpressionTextExtraction(EventListener):
         )
 
     def _begin_page(self, page: Page):
-        self.current_page += 1
+        # a page that is processed again (e.g. after it was released) starts over
+        self.text_render_info_events_per_page[self.current_page] = []
+        self.matched_text_render_info_events_per_page.pop(self.current_page, None)
 
     def _end_page(self, page: Page):
 
@@ -94,7 +101,9 @@ class RegularExpressionTextExtraction(EventListener):
             # add space if needed
             delta = abs(last_baseline_right - t.get_baseline().x0)
             space_width = round(t.get_space_character_width_in_text_space(), 1)
-            text += " " if (space_width * Decimal(0.90) < delta) else ""
+            # (events hold floats when a Document is read using fast math)
+            ratio = 0.90 if isinstance(space_width, float) else Decimal(0.90)
+            text += " " if (space_width * ratio < delta) else ""
 
             # normal append
             text += t.get_text_per_page()
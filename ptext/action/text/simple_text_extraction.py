@@ -1,3 +1,4 @@
+import typing
 from decimal import Decimal
 from functools import cmp_to_key
 
@@ -17,14 +18,34 @@ class SimpleTextExtraction(EventListener):
         self.text_per_page = {}
         self.current_page = -1
 
+    def get_event_types(self) -> typing.List[typing.Type[Event]]:
+        return [BeginPageEvent, EndPageEvent, TextRenderEvent]
+
     def event_occurred(self, event: Event) -> None:
         if isinstance(event, TextRenderEvent):
             self.render_text(event)
         if isinstance(event, BeginPageEvent):
+            self.current_page = event.get_page_number()
             self.begin_page(event.get_page())
         if isinstance(event, EndPageEvent):
             self.end_page(event.get_page())
 
+    can_be_merged = True
+
+    def merge(self, other: "EventListener", page_offset: int) -> "EventListener":
+        assert isinstance(other, SimpleTextExtraction)
+        for k, v in other.text_per_page.items():
+            if k >= page_offset:
+                self.text_per_page[k] = v
+        self.current_page = max(self.current_page, other.current_page)
+        return self
+
+    def __getstate__(self):
+        # TextRenderEvent objects are only needed while their page is being processed
+        state = self.__dict__.copy()
+        state["text_render_info_per_page"] = {}
+        return state
+
     def get_text(self, page_nr: int) -> str:
         return self.text_per_page[page_nr] if page_nr in self.text_per_page else ""
 
@@ -38,7 +59,8 @@ class SimpleTextExtraction(EventListener):
         self.text_render_info_per_page[self.current_page].append(text_render_info)
 
     def begin_page(self, page: Page):
-        self.current_page += 1
+        # a page that is processed again (e.g. after it was released) starts over
+        self.text_render_info_per_page[self.current_page] = []
 
     def end_page(self, page: Page):
 
@@ -85,7 +107,9 @@ class SimpleTextExtraction(EventListener):
             # add space if needed
             delta = abs(last_baseline_right - t.get_baseline().x0)
             space_width = round(t.get_space_character_width_in_text_space(), 1)
-            text += " " if (space_width * Decimal(0.90) < delta) else ""
+            # (events hold floats when a Document is read using fast math)
+            ratio = 0.90 if isinstance(space_width, float) else Decimal(0.90)
+            text += " " if (space_width * ratio < delta) else ""
 
             # normal append
             text += t.get_text()
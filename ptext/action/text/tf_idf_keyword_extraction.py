@@ -29,13 +29,16 @@ class TFIDFKeyword:
         return (tf + 0.001) * (idf + 0.001)
 
     def __str__(self):
-        return "TFIDFKeyword(number_of_pages=%d, occurs_on_pages=%s, term_frequency=%d, text='%s', words_on_page=%d, tf_idf=%10.10f)" % (
-            self.number_of_pages,
-            str(self.occurs_on_pages),
-            self.term_frequency,
-            self.text,
-            self.words_on_page,
-            self.get_tf_idf_score(),
+        return (
+            "TFIDFKeyword(number_of_pages=%d, occurs_on_pages=%s, term_frequency=%d, text='%s', words_on_page=%d, tf_idf=%10.10f)"
+            % (
+                self.number_of_pages,
+                str(self.occurs_on_pages),
+                self.term_frequency,
+                self.text,
+                self.words_on_page,
+                self.get_tf_idf_score(),
+            )
         )
 
 
@@ -69,12 +72,23 @@ class TFIDFKeywordExtraction(SimpleTextExtraction):
         self.stopwords = [x.upper() for x in stopwords]
         self.number_of_pages = 0
         self.minimum_term_frequency = minimum_term_frequency
+        self._page_numbers: typing.Set[int] = set()
+
+    # keywords (and their frequencies) depend on all pages processed so far
+    can_be_merged = False
+
+    def begin_page(self, page: Page):
+        super().begin_page(page)
+
+        # a page that is processed again (e.g. after it was released) starts over
+        self.keywords = [x for x in self.keywords if x.page_number != self.current_page]
 
     def end_page(self, page: Page):
         super().end_page(page)
 
         # update number of pages
-        self.number_of_pages += 1
+        self._page_numbers.add(self.current_page)
+        self.number_of_pages = len(self._page_numbers)
 
         # get words
         words = [
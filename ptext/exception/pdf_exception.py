@@ -128,3 +128,16 @@ class IllegalGraphicsStateError(PDFException):
         super(IllegalGraphicsStateError, self).__init__(
             byte_offset=byte_offset, message=message
         )
+
+
+class DecodeBudgetExceededError(PDFException):
+    """
+    DecodeBudgetExceededError is thrown when a stream decodes to more bytes than its DecodeBudget allows.
+    """
+
+    def __init__(
+        self, byte_offset: Optional[int] = None, message: Optional[str] = None
+    ):
+        super(DecodeBudgetExceededError, self).__init__(
+            byte_offset=byte_offset, message=message
+        )
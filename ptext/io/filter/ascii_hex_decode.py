@@ -0,0 +1,39 @@
+import string
+
+from ptext.exception.pdf_exception import PDFSyntaxError
+
+
+class ASCIIHexDecode:
+    """
+    Decodes data encoded in an ASCII hexadecimal representation,
+    reproducing the original binary data.
+    """
+
+    WHITE_SPACE: bytes = string.whitespace.encode("latin1") + b"\x00"
+
+    @staticmethod
+    def decode(bytes_in: bytes) -> bytes:
+        """
+        Decodes data encoded in an ASCII hexadecimal representation.
+        White-space characters are ignored. A GREATER-THAN SIGN (3Eh) indicates EOD.
+        If the final digit is missing (there is an odd number of digits), it is assumed to be 0.
+        """
+
+        # trivial case
+        if len(bytes_in) == 0:
+            return bytes_in
+
+        # EOD
+        end_of_data = bytes_in.find(b">")
+        if end_of_data != -1:
+            bytes_in = bytes_in[0:end_of_data]
+
+        # strip white-space
+        bytes_in = bytes_in.translate(None, ASCIIHexDecode.WHITE_SPACE)
+        if len(bytes_in) % 2 == 1:
+            bytes_in += b"0"
+
+        try:
+            return bytes.fromhex(bytes_in.decode("latin1"))
+        except ValueError:
+            raise PDFSyntaxError("malformed ascii hex byte stream")
@@ -0,0 +1,297 @@
+import io
+import threading
+import zlib
+from typing import Callable, Iterator, List, Optional, Union
+
+from ptext.exception.pdf_exception import DecodeBudgetExceededError
+from ptext.io.filter.lzw_decode import LZWDecoder
+from ptext.io.filter.predictor import Predictor
+
+
+class DecodeBudget:
+    """
+    A DecodeBudget limits the number of bytes a single stream may decode to,
+    and the number of bytes all streams of a Document (together) may decode to.
+    A stream that exceeds either limit raises a DecodeBudgetExceededError (as soon as it does),
+    rather than exhausting memory. A limit of None means no limit.
+    A DecodeBudget may be spent by several threads at once (e.g. when streams are prefetched).
+    """
+
+    DEFAULT_MAXIMUM_STREAM_SIZE: Optional[int] = 1 << 30
+    DEFAULT_MAXIMUM_DOCUMENT_SIZE: Optional[int] = None
+
+    def __init__(
+        self,
+        maximum_stream_size: Optional[int] = DEFAULT_MAXIMUM_STREAM_SIZE,
+        maximum_document_size: Optional[int] = DEFAULT_MAXIMUM_DOCUMENT_SIZE,
+    ):
+        self.maximum_stream_size = maximum_stream_size
+        self.maximum_document_size = maximum_document_size
+        self.document_size = 0
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def spend(self, number_of_bytes: int, stream_size: int) -> None:
+        """
+        This function accounts for number_of_bytes (more) decoded bytes,
+        of a stream that has (now) decoded to stream_size bytes
+        """
+        if (
+            self.maximum_stream_size is not None
+            and stream_size > self.maximum_stream_size
+        ):
+            raise DecodeBudgetExceededError(
+                message="stream decodes to more than %d bytes"
+                % self.maximum_stream_size
+            )
+        with self._lock:
+            self.document_size += number_of_bytes
+            document_size = self.document_size
+        if (
+            self.maximum_document_size is not None
+            and document_size > self.maximum_document_size
+        ):
+            raise DecodeBudgetExceededError(
+                message="streams decode to more than %d bytes"
+                % self.maximum_document_size
+            )
+
+
+class FilterStage:
+    """
+    A FilterStage decodes (the output of the previous FilterStage of) a stream, a chunk at a time.
+    """
+
+    def decode(self, chunk: Union[bytes, memoryview]) -> Iterator[bytes]:
+        """
+        This function decodes a chunk, yielding any decoded bytes that are ready
+        """
+        raise NotImplementedError()
+
+    def flush(self) -> Iterator[bytes]:
+        """
+        This function yields all remaining decoded bytes, after the last chunk has been decoded
+        """
+        raise NotImplementedError()
+
+
+class BufferedFilterStage(FilterStage):
+    """
+    This FilterStage collects all chunks, and decodes them at once (using a decode function) when it is flushed.
+    It is used for filters that can not (yet) decode incrementally.
+    """
+
+    def __init__(self, decode_function: Callable[[bytes], bytes]):
+        self._decode_function = decode_function
+        self._chunks: List[bytes] = []
+
+    def decode(self, chunk: Union[bytes, memoryview]) -> Iterator[bytes]:
+        self._chunks.append(bytes(chunk))
+        yield from ()
+
+    def flush(self) -> Iterator[bytes]:
+        bytes_out = self._decode_function(b"".join(self._chunks))
+        self._chunks = []
+        if len(bytes_out) > 0:
+            yield bytes_out
+
+
+class FlateDecodeStage(FilterStage):
+    """
+    This FilterStage decompresses data encoded using the zlib/deflate compression method.
+    It never yields more than chunk_size bytes at once, no matter how well the data was compressed.
+    """
+
+    def __init__(self, chunk_size: int):
+        self._decompressor = zlib.decompressobj()
+        self._chunk_size = chunk_size
+
+    def decode(self, chunk: Union[bytes, memoryview]) -> Iterator[bytes]:
+        while not self._decompressor.eof:
+            bytes_out = self._decompressor.decompress(chunk, self._chunk_size)
+            if len(bytes_out) > 0:
+                yield bytes_out
+            chunk = self._decompressor.unconsumed_tail
+            if len(chunk) == 0 and len(bytes_out) < self._chunk_size:
+                break
+
+    def flush(self) -> Iterator[bytes]:
+        bytes_out = self._decompressor.flush()
+        if len(bytes_out) > 0:
+            yield bytes_out
+
+
+class LZWDecodeStage(FilterStage):
+    """
+    This FilterStage decompresses data encoded using the LZW (Lempel-Ziv-Welch) adaptive compression method.
+    Chunks are decoded in slices of (at most) SLICE_SIZE bytes, which bounds the number of bytes yielded at once.
+    """
+
+    SLICE_SIZE: int = 1 << 12
+
+    def __init__(self, early_change: int = 1):
+        self._decoder = LZWDecoder(early_change)
+
+    def decode(self, chunk: Union[bytes, memoryview]) -> Iterator[bytes]:
+        for i in range(0, len(chunk), LZWDecodeStage.SLICE_SIZE):
+            bytes_out = self._decoder.decode(chunk[i : i + LZWDecodeStage.SLICE_SIZE])
+            if len(bytes_out) > 0:
+                yield bytes_out
+
+    def flush(self) -> Iterator[bytes]:
+        yield from ()
+
+
+class PredictorStage(FilterStage):
+    """
+    This FilterStage undoes the (TIFF, or PNG) predictor applied to the output of a FlateDecode (or LZWDecode) filter.
+    It undoes the predictor for as many (whole) rows as are available,
+    keeping the last of those rows (for PNG predictors that refer to the row above).
+    Rows are collected in batches of (about) BATCH_SIZE bytes, as predictors are undone faster on many rows at once.
+    """
+
+    BATCH_SIZE: int = 1 << 22
+
+    def __init__(
+        self,
+        predictor: int = 1,
+        colors: int = 1,
+        bits_per_component: int = 8,
+        columns: int = 1,
+    ):
+        # check parameters
+        Predictor.decode(b"", predictor, colors, bits_per_component, columns)
+        self._predictor = predictor
+        self._colors = colors
+        self._bits_per_component = bits_per_component
+        self._columns = columns
+        self._bytes_per_row = (colors * bits_per_component * columns + 7) // 8
+        self._bytes_per_encoded_row = self._bytes_per_row + (
+            1 if predictor >= 10 else 0
+        )
+        self._prior_row = bytes(self._bytes_per_row)
+        self._pending_bytes = bytearray()
+
+    def decode(self, chunk: Union[bytes, memoryview]) -> Iterator[bytes]:
+        self._pending_bytes += chunk
+        if len(self._pending_bytes) >= PredictorStage.BATCH_SIZE:
+            yield from self._decode_pending_rows()
+
+    def flush(self) -> Iterator[bytes]:
+        yield from self._decode_pending_rows()
+        # an incomplete (last) row is dropped
+        self._pending_bytes = bytearray()
+
+    def _decode_pending_rows(self) -> Iterator[bytes]:
+        n = len(self._pending_bytes) // self._bytes_per_encoded_row
+        if n == 0:
+            return
+        rows = bytes(self._pending_bytes[0 : n * self._bytes_per_encoded_row])
+        del self._pending_bytes[0 : n * self._bytes_per_encoded_row]
+
+        # a PNG row refers to the row above, so the (decoded) row above is prepended (without predictor)
+        if self._predictor >= 10:
+            rows = b"\x00" + self._prior_row + rows
+        bytes_out = Predictor.decode(
+            rows,
+            self._predictor,
+            self._colors,
+            self._bits_per_component,
+            self._columns,
+        )
+        if self._predictor >= 10:
+            bytes_out = bytes_out[self._bytes_per_row :]
+        self._prior_row = bytes_out[-self._bytes_per_row :]
+        yield bytes_out
+
+
+class DecodePipeline:
+    """
+    A DecodePipeline passes the bytes of a stream through a sequence of FilterStage(s), a chunk at a time.
+    Every stage yields its output (in chunks) as soon as it is ready, so no stage needs to hold
+    the (decoded) stream in its entirety. Decoded bytes are accounted for by a DecodeBudget.
+    """
+
+    DEFAULT_CHUNK_SIZE: int = 1 << 16
+
+    def __init__(
+        self,
+        stages: List[FilterStage],
+        decode_budget: Optional[DecodeBudget] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        self.stages = stages
+        self.decode_budget = decode_budget or DecodeBudget()
+        self.chunk_size = chunk_size
+
+    def decode(self, bytes_in: Union[bytes, memoryview]) -> Iterator[bytes]:
+        """
+        This function yields the decoded bytes of a stream, a chunk at a time
+        """
+        chunks: Iterator[Union[bytes, memoryview]] = iter([bytes_in])
+        if len(self.stages) > 0:
+            view = memoryview(bytes_in)
+            chunks = (
+                view[i : i + self.chunk_size]
+                for i in range(0, len(view), self.chunk_size)
+            )
+        for stage in self.stages:
+            chunks = DecodePipeline._apply_stage(stage, chunks)
+
+        stream_size = 0
+        for chunk in chunks:
+            stream_size += len(chunk)
+            self.decode_budget.spend(len(chunk), stream_size)
+            yield chunk
+
+    @staticmethod
+    def _apply_stage(
+        stage: FilterStage, chunks: Iterator[Union[bytes, memoryview]]
+    ) -> Iterator[bytes]:
+        for chunk in chunks:
+            yield from stage.decode(chunk)
+        yield from stage.flush()
+
+
+class DecodedBytesReader(io.RawIOBase):
+    """
+    This class offers the (decoded) chunks of a DecodePipeline as a (read-only) io source,
+    allowing consumers to read decoded bytes without holding the entire stream in memory.
+    """
+
+    def __init__(self, chunks: Iterator[Union[bytes, memoryview]]):
+        super().__init__()
+        self._chunks = chunks
+        self._chunk: Union[bytes, memoryview] = b""
+        self._position_in_chunk = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while self._position_in_chunk >= len(self._chunk):
+            self._chunk = next(self._chunks, None)
+            self._position_in_chunk = 0
+            if self._chunk is None:
+                self._chunk = b""
+                return 0
+        n = min(len(buffer), len(self._chunk) - self._position_in_chunk)
+        buffer[0:n] = self._chunk[self._position_in_chunk : self._position_in_chunk + n]
+        self._position_in_chunk += n
+        return n
+
+    def readall(self) -> bytes:
+        # the remaining chunks are joined once (a single remaining bytes chunk is returned as is)
+        chunks = [self._chunk[self._position_in_chunk :]] if self._chunk else []
+        chunks += [c for c in self._chunks]
+        self._chunk = b""
+        self._position_in_chunk = 0
+        return b"".join([c for c in chunks if len(c) > 0])
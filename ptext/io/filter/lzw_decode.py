@@ -1,6 +1,122 @@
-import copy
+import typing
 
 from ptext.exception.pdf_exception import PDFSyntaxError
+from ptext.io.filter.predictor import Predictor
+
+
+class LZWDecoder:
+    """
+    This class decodes LZW codes (of 9 to 12 bits) incrementally, a chunk of bytes at a time.
+    Codes are read (most significant bit first) from a bit buffer, that carries over from one chunk to the next.
+    Every entry of the code table is an existing entry (its prefix) followed by one more byte,
+    the table holds (per code) the code of that prefix, that last byte, and the first byte of the entry.
+    An entry is written to the output by walking its prefixes (from its last byte to its first byte).
+    """
+
+    CLEAR_TABLE: int = 256
+    END_OF_DATA: int = 257
+
+    def __init__(self, early_change: int = 1):
+        self._early_change = early_change
+        self._bit_buffer = 0
+        self._number_of_bits = 0
+        self._is_done = False
+        self._previous_code: typing.Optional[int] = None
+        self._clear_table()
+
+    def _clear_table(self) -> None:
+        # ClearTable and EOD do not have an entry
+        self._prefixes: typing.List[int] = [-1] * 258
+        self._last_bytes: typing.List[int] = list(range(0, 256)) + [0, 0]
+        self._first_bytes: typing.List[int] = list(range(0, 256)) + [0, 0]
+        self._code_length = 9
+        self._previous_code = None
+
+    def decode(self, bytes_in: bytes) -> bytes:
+        """
+        This function decodes a chunk of bytes, returning the decoded bytes
+        """
+        if self._is_done:
+            return b""
+
+        bytes_out = bytearray()
+        prefixes = self._prefixes
+        last_bytes = self._last_bytes
+        first_bytes = self._first_bytes
+        bit_buffer = self._bit_buffer
+        number_of_bits = self._number_of_bits
+        code_length = self._code_length
+        previous_code = self._previous_code
+        early_change = self._early_change
+
+        for b in bytes_in:
+            bit_buffer = ((bit_buffer << 8) | b) & 0xFFFFFF
+            number_of_bits += 8
+            if number_of_bits < code_length:
+                continue
+
+            # read code
+            number_of_bits -= code_length
+            code = (bit_buffer >> number_of_bits) & ((1 << code_length) - 1)
+
+            # ClearTable
+            if code == LZWDecoder.CLEAR_TABLE:
+                self._clear_table()
+                prefixes = self._prefixes
+                last_bytes = self._last_bytes
+                first_bytes = self._first_bytes
+                code_length = 9
+                previous_code = None
+                continue
+
+            # EOD
+            if code == LZWDecoder.END_OF_DATA:
+                self._is_done = True
+                break
+
+            # look up code
+            # (a code that is not in the table yet is the previous entry, followed by its own first byte)
+            table_size = len(prefixes)
+            if code < table_size:
+                entry_code = code
+                first_byte = first_bytes[code]
+            elif code == table_size and previous_code is not None:
+                entry_code = previous_code
+                first_byte = first_bytes[previous_code]
+            else:
+                raise PDFSyntaxError("malformed lzw byte stream")
+
+            # write entry, walking its prefixes
+            if entry_code < 256:
+                bytes_out.append(entry_code)
+            else:
+                entry = []
+                while entry_code >= 256:
+                    entry.append(last_bytes[entry_code])
+                    entry_code = prefixes[entry_code]
+                entry.append(entry_code)
+                entry.reverse()
+                bytes_out += bytes(entry)
+            if code == table_size:
+                bytes_out.append(first_byte)
+
+            # add previous entry, followed by the first byte of this entry, to the table
+            if previous_code is not None and table_size < 4096:
+                prefixes.append(previous_code)
+                last_bytes.append(first_byte)
+                first_bytes.append(first_bytes[previous_code])
+                if (
+                    table_size + 1 + early_change >= (1 << code_length)
+                    and code_length < 12
+                ):
+                    code_length += 1
+            previous_code = code
+
+        self._bit_buffer = bit_buffer
+        self._number_of_bits = number_of_bits
+        self._code_length = code_length
+        self._previous_code = previous_code
+        return bytes(bytes_out)
 
 
 class LZWDecode:
@@ -11,7 +127,14 @@ class LZWDecode:
     """
 
     @staticmethod
-    def decode(bytes_in: bytes) -> bytes:
+    def decode(
+        bytes_in: bytes,
+        early_change: int = 1,
+        predictor: int = 1,
+        colors: int = 1,
+        bits_per_component: int = 8,
+        columns: int = 1,
+    ) -> bytes:
         """
         Decompresses data encoded using the LZW (Lempel-Ziv-
         Welch) adaptive compression method
@@ -21,34 +144,14 @@ class LZWDecode:
         if len(bytes_in) == 0:
             return bytes_in
 
-        # Build the dictionary.
-        dict_size = 256
-        dictionary = {i: bytearray() for i in range(dict_size)}
-        for k, v in dictionary.items():
-            v.append(k)
+        # decode
+        bytes_after_lzw = LZWDecoder(early_change).decode(bytes_in)
 
-        # use bytearray, otherwise this becomes O(N^2)
-        # due to concatenation in a loop
-        bytes_out = bytearray()
-        w = bytearray()
-        w.append(bytes_in[0])
-        bytes_out.append(bytes_in[0])
-
-        for i in range(1, len(bytes_in)):
-            k = bytes_in[i]
-            if k in dictionary:
-                entry = dictionary[k]
-            elif k == dict_size:
-                entry = copy.deepcopy(w)
-                entry.append(w[0])
-            else:
-                raise PDFSyntaxError("malformed lzw byte stream")
-            bytes_out.extend(entry)
-
-            # Add w+entry[0] to the dictionary.
-            dictionary[dict_size] = copy.deepcopy(w)
-            dictionary[dict_size].append(entry[0])
-            dict_size += 1
-
-            w = entry
-        return bytes(bytes_out)
+        # undo predictor (if any)
+        return Predictor.decode(
+            bytes_after_lzw,
+            predictor=predictor,
+            colors=colors,
+            bits_per_component=bits_per_component,
+            columns=columns,
+        )
@@ -0,0 +1,449 @@
+from typing import Optional
+
+from ptext.exception.pdf_exception import PDFValueError
+
+try:
+    import numpy  # type: ignore [import]
+except ImportError:
+    numpy = None
+
+
+class Predictor:
+    """
+    LZW and Flate encoding compress more compactly if their input data is highly predictable. One way of
+    increasing the predictability of many continuous-tone sampled images is to replace each sample with the
+    difference between that sample and a predictor function applied to earlier neighboring samples. If the predictor
+    function works well, the postprediction data clusters toward 0.
+    PDF supports two groups of Predictor functions. The first, the TIFF group, consists of the single function that is
+    Predictor 2 in the TIFF 6.0 specification. The second, the PNG group, consists of the filters of the
+    PNG specification (None, Sub, Up, Average and Paeth), which may differ from one row to the next.
+
+    This class undoes either group of predictors, a row (or a group of rows) at a time.
+    It uses NumPy (if it is installed), and falls back to plain Python otherwise.
+    """
+
+    # the number of samples (of a skewed band of rows) decoded at once when undoing the Average or Paeth predictors
+    MAX_SKEWED_BAND_SIZE: int = 1 << 24
+
+    # PNG_FILTER_PAETH predictions are looked up in a table, see _get_paeth_table_numpy
+    PAETH_TABLE_OFFSET: int = 255 * 512 + 255
+    _paeth_table: Optional["numpy.ndarray"] = None
+
+    @staticmethod
+    def decode(
+        bytes_in: bytes,
+        predictor: int = 1,
+        colors: int = 1,
+        bits_per_component: int = 8,
+        columns: int = 1,
+    ) -> bytes:
+        """
+        This function undoes the predictor (if any) applied to the given bytes
+        """
+
+        # check \Predictor
+        if predictor not in [1, 2, 10, 11, 12, 13, 14, 15]:
+            raise PDFValueError(
+                expected_value_description="[1, 2, 10, 11, 12, 13, 14, 15]",
+                received_value_description=str(predictor),
+            )
+
+        # check \BitsPerComponent
+        if bits_per_component not in [1, 2, 4, 8, 16]:
+            raise PDFValueError(
+                expected_value_description="[1, 2, 4, 8, 16]",
+                received_value_description=str(bits_per_component),
+            )
+
+        # check \Colors and \Columns
+        if colors < 1 or columns < 1:
+            raise PDFValueError(
+                expected_value_description="\\Colors >= 1, \\Columns >= 1",
+                received_value_description="\\Colors %d, \\Columns %d"
+                % (colors, columns),
+            )
+
+        # trivial case
+        if predictor == 1 or len(bytes_in) == 0:
+            return bytes_in
+
+        # TIFF predictor
+        if predictor == 2:
+            if numpy is not None:
+                return Predictor._decode_tiff_numpy(
+                    bytes_in, colors, bits_per_component, columns
+                )
+            return Predictor._decode_tiff(bytes_in, colors, bits_per_component, columns)
+
+        # PNG predictors
+        if numpy is not None:
+            return Predictor._decode_png_numpy(
+                bytes_in, colors, bits_per_component, columns
+            )
+        return Predictor._decode_png(bytes_in, colors, bits_per_component, columns)
+
+    @staticmethod
+    def _get_bytes_per_row(colors: int, bits_per_component: int, columns: int) -> int:
+        return (colors * bits_per_component * columns + 7) // 8
+
+    @staticmethod
+    def _get_bytes_per_pixel(colors: int, bits_per_component: int) -> int:
+        # PNG filters operate on bytes, comparing a byte to the corresponding byte of the pixel to its left
+        # (or to the byte to its left, if a pixel takes less than a byte)
+        return max(1, (colors * bits_per_component) // 8)
+
+    @staticmethod
+    def _decode_tiff(
+        bytes_in: bytes, colors: int, bits_per_component: int, columns: int
+    ) -> bytes:
+        bytes_per_row = Predictor._get_bytes_per_row(
+            colors, bits_per_component, columns
+        )
+        number_of_rows = len(bytes_in) // bytes_per_row
+        bytes_out = bytearray(bytes_in[0 : number_of_rows * bytes_per_row])
+
+        # 8 bits per component, every sample is a byte
+        if bits_per_component == 8:
+            for row_start in range(0, len(bytes_out), bytes_per_row):
+                for i in range(row_start + colors, row_start + bytes_per_row):
+                    bytes_out[i] = (bytes_out[i] + bytes_out[i - colors]) & 0xFF
+            return bytes(bytes_out)
+
+        # any other number of bits per component, unpack each row into its samples
+        mask = (1 << bits_per_component) - 1
+        number_of_samples = colors * columns
+        bits_per_row = bytes_per_row * 8
+        for row_start in range(0, len(bytes_out), bytes_per_row):
+            row = int.from_bytes(
+                bytes_out[row_start : row_start + bytes_per_row], "big"
+            )
+            samples = [
+                (row >> (bits_per_row - (i + 1) * bits_per_component)) & mask
+                for i in range(0, number_of_samples)
+            ]
+            for i in range(colors, number_of_samples):
+                samples[i] = (samples[i] + samples[i - colors]) & mask
+            row = 0
+            for s in samples:
+                row = (row << bits_per_component) | s
+            row <<= bits_per_row - number_of_samples * bits_per_component
+            bytes_out[row_start : row_start + bytes_per_row] = row.to_bytes(
+                bytes_per_row, "big"
+            )
+        return bytes(bytes_out)
+
+    @staticmethod
+    def _decode_tiff_numpy(
+        bytes_in: bytes, colors: int, bits_per_component: int, columns: int
+    ) -> bytes:
+        bytes_per_row = Predictor._get_bytes_per_row(
+            colors, bits_per_component, columns
+        )
+        number_of_rows = len(bytes_in) // bytes_per_row
+        rows = numpy.frombuffer(
+            bytes_in, dtype=numpy.uint8, count=number_of_rows * bytes_per_row
+        ).reshape(number_of_rows, bytes_per_row)
+
+        # 8 or 16 bits per component, add up every component along each row
+        if bits_per_component in [8, 16]:
+            dtype = numpy.uint8 if bits_per_component == 8 else numpy.dtype(">u2")
+            samples = rows.view(dtype).reshape(number_of_rows, columns, colors)
+            samples = numpy.cumsum(samples, axis=1, dtype=dtype)
+            return samples.astype(dtype, copy=False).tobytes()
+
+        # 1, 2 or 4 bits per component, unpack each row into its samples
+        number_of_samples = colors * columns
+        bits = numpy.unpackbits(rows, axis=1)[
+            :, 0 : number_of_samples * bits_per_component
+        ].reshape(number_of_rows, number_of_samples, bits_per_component)
+        weights = 1 << numpy.arange(bits_per_component - 1, -1, -1, dtype=numpy.uint16)
+        samples = (bits * weights).sum(axis=2, dtype=numpy.uint16)
+        samples = numpy.cumsum(
+            samples.reshape(number_of_rows, columns, colors), axis=1, dtype=numpy.uint16
+        ) & ((1 << bits_per_component) - 1)
+
+        # pack samples into rows again
+        bits_out = numpy.zeros((number_of_rows, bytes_per_row * 8), dtype=numpy.uint8)
+        bits_out[:, 0 : number_of_samples * bits_per_component] = (
+            (samples.reshape(number_of_rows, number_of_samples, 1) & weights) != 0
+        ).reshape(number_of_rows, number_of_samples * bits_per_component)
+        return numpy.packbits(bits_out, axis=1).tobytes()
+
+    @staticmethod
+    def _decode_png(
+        bytes_in: bytes, colors: int, bits_per_component: int, columns: int
+    ) -> bytes:
+        bytes_per_row = Predictor._get_bytes_per_row(
+            colors, bits_per_component, columns
+        )
+        bpp = Predictor._get_bytes_per_pixel(colors, bits_per_component)
+        number_of_rows = len(bytes_in) // (bytes_per_row + 1)
+
+        # every row is preceded by its filter type byte
+        bytes_out = bytearray(number_of_rows * bytes_per_row)
+        prior_row = bytearray(bytes_per_row)
+        for row_number in range(0, number_of_rows):
+            pos = row_number * (bytes_per_row + 1)
+            filter_type = bytes_in[pos]
+            row = bytearray(bytes_in[pos + 1 : pos + 1 + bytes_per_row])
+
+            # PNG_FILTER_SUB
+            # Predicts the same as the sample to the left
+            if filter_type == 1:
+                for i in range(bpp, bytes_per_row):
+                    row[i] = (row[i] + row[i - bpp]) & 0xFF
+
+            # PNG_FILTER_UP
+            # Predicts the same as the sample above
+            elif filter_type == 2:
+                for i in range(0, bytes_per_row):
+                    row[i] = (row[i] + prior_row[i]) & 0xFF
+
+            # PNG_FILTER_AVERAGE
+            # Predicts the average of the sample to the left and the
+            # sample above
+            elif filter_type == 3:
+                for i in range(0, min(bpp, bytes_per_row)):
+                    row[i] = (row[i] + (prior_row[i] >> 1)) & 0xFF
+                for i in range(bpp, bytes_per_row):
+                    row[i] = (row[i] + ((row[i - bpp] + prior_row[i]) >> 1)) & 0xFF
+
+            # PNG_FILTER_PAETH
+            # Predicts the same as whichever of the sample to the left, above, or above-left
+            # is closest to (left + above - above-left)
+            elif filter_type == 4:
+                for i in range(0, min(bpp, bytes_per_row)):
+                    row[i] = (row[i] + prior_row[i]) & 0xFF
+                for i in range(bpp, bytes_per_row):
+                    a = row[i - bpp]
+                    b = prior_row[i]
+                    c = prior_row[i - bpp]
+                    pa = abs(b - c)
+                    pb = abs(a - c)
+                    pc = abs(a + b - c - c)
+                    if pa <= pb and pa <= pc:
+                        row[i] = (row[i] + a) & 0xFF
+                    elif pb <= pc:
+                        row[i] = (row[i] + b) & 0xFF
+                    else:
+                        row[i] = (row[i] + c) & 0xFF
+
+            # PNG_FILTER_NONE (or any unknown filter type)
+            # DO NOTHING
+
+            bytes_out[row_number * bytes_per_row : (row_number + 1) * bytes_per_row] = (
+                row
+            )
+            prior_row = row
+
+        return bytes(bytes_out)
+
+    @staticmethod
+    def _decode_png_numpy(
+        bytes_in: bytes, colors: int, bits_per_component: int, columns: int
+    ) -> bytes:
+        bytes_per_row = Predictor._get_bytes_per_row(
+            colors, bits_per_component, columns
+        )
+        bpp = Predictor._get_bytes_per_pixel(colors, bits_per_component)
+        number_of_rows = len(bytes_in) // (bytes_per_row + 1)
+        rows = numpy.frombuffer(
+            bytes_in, dtype=numpy.uint8, count=number_of_rows * (bytes_per_row + 1)
+        ).reshape(number_of_rows, bytes_per_row + 1)
+
+        # every row is preceded by its filter type byte
+        filter_types = rows[:, 0]
+        data = rows[:, 1:]
+
+        # a pixel takes a whole number of bytes (or a pixel takes less than a byte, and bpp is 1)
+        number_of_pixels = bytes_per_row // bpp
+
+        # rows using None, Sub or Up only depend on their own (raw) bytes, or on the row above
+        if numpy.all(filter_types <= 2):
+            return Predictor._decode_png_none_sub_up_numpy(
+                data, filter_types, number_of_pixels, bpp
+            )
+
+        # rows using Average or Paeth depend on the pixel to their left, and on the row above
+        return Predictor._decode_png_any_numpy(
+            data, filter_types, number_of_pixels, bpp
+        )
+
+    @staticmethod
+    def _decode_png_none_sub_up_numpy(
+        data: "numpy.ndarray",
+        filter_types: "numpy.ndarray",
+        number_of_pixels: int,
+        bpp: int,
+    ) -> bytes:
+        number_of_rows = data.shape[0]
+        values = numpy.array(data, dtype=numpy.uint8)
+
+        # PNG_FILTER_SUB, add up each byte of every pixel along the row
+        sub_rows = filter_types == 1
+        if numpy.any(sub_rows):
+            values[sub_rows] = numpy.cumsum(
+                values[sub_rows].reshape(-1, number_of_pixels, bpp),
+                axis=1,
+                dtype=numpy.uint8,
+            ).reshape(-1, number_of_pixels * bpp)
+
+        # PNG_FILTER_UP, add up every row with all Up rows before it,
+        # starting from the nearest row that is not an Up row (or from 0)
+        up_rows = filter_types == 2
+        if not numpy.any(up_rows):
+            return values.tobytes()
+        running_sum = numpy.zeros(
+            (number_of_rows + 1, number_of_pixels * bpp), dtype=numpy.uint8
+        )
+        numpy.cumsum(values, axis=0, dtype=numpy.uint8, out=running_sum[1:])
+        segment_start = numpy.maximum.accumulate(
+            numpy.where(up_rows, 0, numpy.arange(0, number_of_rows))
+        )
+        return (running_sum[1:] - running_sum[segment_start]).tobytes()
+
+    @staticmethod
+    def _get_paeth_table_numpy() -> "numpy.ndarray":
+        # PNG_FILTER_PAETH only depends on b - c and a - c, it predicts c + (a - c), c + (b - c) or c.
+        # This table holds that difference (modulo 256) for every (b - c) * 512 + (a - c) + PAETH_TABLE_OFFSET
+        if Predictor._paeth_table is None:
+            p = numpy.arange(-255, 256, dtype=numpy.int32).reshape(-1, 1)
+            q = numpy.arange(-255, 256, dtype=numpy.int32).reshape(1, -1)
+            pa = numpy.abs(p)
+            pb = numpy.abs(q)
+            pc = numpy.abs(p + q)
+            paeth_table = numpy.zeros(1 << 19, dtype=numpy.uint8)
+            paeth_table[(p * 512 + q + Predictor.PAETH_TABLE_OFFSET).ravel()] = (
+                numpy.where((pa <= pb) & (pa <= pc), q, numpy.where(pb <= pc, p, 0))
+                & 0xFF
+            ).ravel()
+            Predictor._paeth_table = paeth_table
+        return Predictor._paeth_table
+
+    @staticmethod
+    def _decode_png_any_numpy(
+        data: "numpy.ndarray",
+        filter_types: "numpy.ndarray",
+        number_of_pixels: int,
+        bpp: int,
+    ) -> bytes:
+        number_of_rows = data.shape[0]
+        data = data.reshape(number_of_rows, number_of_pixels, bpp)
+        bytes_out = numpy.empty((number_of_rows, number_of_pixels, bpp), numpy.uint8)
+
+        # A pixel only depends on the pixels to its left, above, and above-left,
+        # so all pixels on the same anti-diagonal (row + column) can be decoded at once.
+        # Rows are decoded in bands, each band is skewed so that its anti-diagonals are contiguous slices.
+        rows_per_band = number_of_rows
+        while (
+            rows_per_band > 1
+            and (rows_per_band + number_of_pixels + 1) * (rows_per_band + 1) * bpp
+            > Predictor.MAX_SKEWED_BAND_SIZE
+        ):
+            rows_per_band = (rows_per_band + 1) // 2
+
+        # the diagonals are decoded in place, using uint8 arithmetic (which wraps around modulo 256),
+        # Paeth looks up its prediction in a table (so each diagonal only takes a few ufunc calls)
+        key = numpy.empty((rows_per_band + 1, bpp), dtype=numpy.int32)
+        tmp = numpy.empty((rows_per_band + 1, bpp), dtype=numpy.int32)
+        delta = numpy.empty((rows_per_band + 1, bpp), dtype=numpy.uint8)
+        paeth_table = Predictor._get_paeth_table_numpy()
+
+        prior_row = numpy.zeros((number_of_pixels, bpp), dtype=numpy.uint8)
+        for first_row in range(0, number_of_rows, rows_per_band):
+            band = data[first_row : first_row + rows_per_band]
+            h = band.shape[0]
+
+            # skewed[k, i] holds pixel k - i - 1 of row i (row 0 being the row above the band)
+            w = h + 1
+            skewed = numpy.zeros((h + number_of_pixels + 1, w, bpp), numpy.uint8)
+            skewed[1 : number_of_pixels + 1, 0] = prior_row
+            unskewed = numpy.lib.stride_tricks.as_strided(
+                skewed[2, 1],
+                shape=(h, number_of_pixels, bpp),
+                strides=((w + 1) * bpp, w * bpp, 1),
+                writeable=True,
+            )
+            unskewed[...] = band
+
+            # most encoders use a single filter type for all rows
+            f = filter_types[first_row : first_row + h].astype(numpy.int16)
+            f = f.reshape(h, 1)
+            single_filter_type = int(f[0, 0]) if numpy.all(f == f[0, 0]) else None
+
+            for k in range(2, h + number_of_pixels + 1):
+                lo = max(1, k - number_of_pixels)
+                hi = min(h, k - 1) + 1
+                x = skewed[k, lo:hi]
+                a = skewed[k - 1, lo:hi]
+                b = skewed[k - 1, lo - 1 : hi - 1]
+                c = skewed[k - 2, lo - 1 : hi - 1]
+
+                # PNG_FILTER_AVERAGE
+                if single_filter_type == 3:
+                    kk = key[0 : hi - lo]
+                    numpy.add(a, b, out=kk, dtype=numpy.int32)
+                    numpy.right_shift(kk, 1, out=kk)
+                    numpy.add(x, kk, out=x, casting="unsafe")
+                    continue
+
+                # PNG_FILTER_PAETH
+                if single_filter_type == 4:
+                    kk = key[0 : hi - lo]
+                    tt = tmp[0 : hi - lo]
+                    d = delta[0 : hi - lo]
+                    numpy.subtract(b, c, out=kk, dtype=numpy.int32)
+                    numpy.left_shift(kk, 9, out=kk)
+                    numpy.subtract(a, c, out=tt, dtype=numpy.int32)
+                    numpy.add(kk, tt, out=kk)
+                    numpy.add(kk, Predictor.PAETH_TABLE_OFFSET, out=kk)
+                    paeth_table.take(kk, mode="clip", out=d)
+                    numpy.add(x, c, out=x)
+                    numpy.add(x, d, out=x)
+                    continue
+
+                # a mix of filter types
+                prediction = Predictor._get_png_prediction_numpy(
+                    a.astype(numpy.int16),
+                    b.astype(numpy.int16),
+                    c.astype(numpy.int16),
+                    single_filter_type,
+                    f[lo - 1 : hi - 1],
+                )
+                numpy.add(x, prediction, out=x, casting="unsafe")
+
+            # unskew
+            bytes_out[first_row : first_row + h] = unskewed
+            prior_row = unskewed[h - 1].copy()
+
+        return bytes_out.tobytes()
+
+    @staticmethod
+    def _get_png_prediction_numpy(
+        a: "numpy.ndarray",
+        b: "numpy.ndarray",
+        c: "numpy.ndarray",
+        filter_type: Optional[int],
+        filter_types: "numpy.ndarray",
+    ) -> "numpy.ndarray":
+        # PNG_FILTER_SUB
+        if filter_type == 1:
+            return a
+        # PNG_FILTER_UP
+        if filter_type == 2:
+            return b
+        # PNG_FILTER_AVERAGE
+        if filter_type == 3:
+            return (a + b) >> 1
+        # PNG_FILTER_PAETH
+        pa = numpy.abs(b - c)
+        pb = numpy.abs(a - c)
+        pc = numpy.abs(a + b - c - c)
+        paeth = numpy.where((pa <= pb) & (pa <= pc), a, numpy.where(pb <= pc, b, c))
+        if filter_type == 4:
+            return paeth
+        # a mix of filter types (any unknown filter type is treated as PNG_FILTER_NONE)
+        return numpy.choose(
+            numpy.where(filter_types <= 4, filter_types, 0),
+            [numpy.zeros_like(a), a, b, (a + b) >> 1, paeth],
+        )
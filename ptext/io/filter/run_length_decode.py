@@ -6,22 +6,35 @@ class RunLengthDecode:
     frequent long runs of a single byte value).
     """
 
+    END_OF_DATA: int = 128
+
     @staticmethod
     def decode(bytes_in: bytes) -> bytes:
         """
         Decompresses data encoded using a byte-oriented run-length
-        encoding algorithm
+        encoding algorithm.
+        The encoded data shall be a sequence of runs, where each run shall consist of a length byte followed by 1 to 128
+        bytes of data. If the length byte is in the range 0 to 127, the following length + 1 (1 to 128) bytes shall be
+        copied literally during decompression. If length is in the range 129 to 255, the following single byte shall be
+        copied 257 - length (2 to 128) times during decompression. A length value of 128 shall denote EOD.
         """
 
         # trivial case
         if len(bytes_in) == 0:
             return bytes_in
 
-        bytes_out = bytearray()
-        for i in range(0, len(bytes_in), 2):
-            b = bytes_in[i]
-            n = bytes_in[i + 1]
-            for j in range(0, n):
-                bytes_out.append(b)
+        parts = []
+        i = 0
+        n = len(bytes_in)
+        while i < n:
+            length = bytes_in[i]
+            if length == RunLengthDecode.END_OF_DATA:
+                break
+            if length < 128:
+                parts.append(bytes_in[i + 1 : i + 2 + length])
+                i += 2 + length
+            else:
+                parts.append(bytes_in[i + 1 : i + 2] * (257 - length))
+                i += 2
 
-        return bytes(bytes_out)
+        return b"".join(parts)
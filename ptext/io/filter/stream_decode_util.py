@@ -1,17 +1,105 @@
+import io
 import typing
+from typing import Callable, Iterator, Optional, Union
 
 from ptext.exception.pdf_exception import PDFValueError
 from ptext.io.filter.ascii85_decode import ASCII85Decode
-from ptext.io.filter.flate_decode import FlateDecode
-from ptext.io.filter.lzw_decode import LZWDecode
+from ptext.io.filter.ascii_hex_decode import ASCIIHexDecode
+from ptext.io.filter.decode_pipeline import (
+    BufferedFilterStage,
+    DecodeBudget,
+    DecodedBytesReader,
+    DecodePipeline,
+    FilterStage,
+    FlateDecodeStage,
+    LZWDecodeStage,
+    PredictorStage,
+)
 from ptext.io.filter.run_length_decode import RunLengthDecode
 from ptext.io.transform.types import Stream, List, Decimal, Dictionary
 
+# a FilterStageFactory builds the FilterStage(s) of a filter, given its decode parameters and the chunk size
+FilterStageFactory = Callable[[Dictionary, int], typing.List[FilterStage]]
 
-def decode_stream(s: Stream) -> Stream:
+# registered filters, keyed by (full, or abbreviated) filter name
+_FILTER_STAGE_FACTORIES: typing.Dict[str, FilterStageFactory] = {}
 
-    assert isinstance(s, Stream)
-    assert "Bytes" in s
+
+def register_filter(
+    filter_name: str,
+    filter_stage_factory: FilterStageFactory,
+    abbreviations: typing.List[str] = [],
+) -> None:
+    """
+    This function registers (or replaces) the FilterStageFactory that builds the FilterStage(s) of a filter.
+    e.g. to decode ASCIIHexDecode (also known as AHx) streams using an accelerated decode function:
+
+        register_filter("ASCIIHexDecode", lambda params, chunk_size: [BufferedFilterStage(my_decode)], ["AHx"])
+    """
+    for n in [filter_name] + abbreviations:
+        _FILTER_STAGE_FACTORIES[n] = filter_stage_factory
+
+
+def _get_predictor_stages(decode_params: Dictionary) -> typing.List[FilterStage]:
+    predictor = int(decode_params.get("Predictor", Decimal(1)))
+    if predictor == 1:
+        return []
+    return [
+        PredictorStage(
+            predictor=predictor,
+            colors=int(decode_params.get("Colors", Decimal(1))),
+            bits_per_component=int(decode_params.get("BitsPerComponent", Decimal(8))),
+            columns=int(decode_params.get("Columns", Decimal(1))),
+        )
+    ]
+
+
+def _get_flate_decode_stages(
+    decode_params: Dictionary, chunk_size: int
+) -> typing.List[FilterStage]:
+    return [FlateDecodeStage(chunk_size)] + _get_predictor_stages(decode_params)
+
+
+def _get_lzw_decode_stages(
+    decode_params: Dictionary, chunk_size: int
+) -> typing.List[FilterStage]:
+    early_change = int(decode_params.get("EarlyChange", Decimal(1)))
+    return [LZWDecodeStage(early_change)] + _get_predictor_stages(decode_params)
+
+
+def _get_crypt_stages(
+    decode_params: Dictionary, chunk_size: int
+) -> typing.List[FilterStage]:
+    # only the Identity crypt filter (which passes the data through unchanged) is supported
+    if decode_params.get("Name", "Identity") != "Identity":
+        raise PDFValueError(
+            expected_value_description="/Identity",
+            received_value_description=str(decode_params.get("Name")),
+        )
+    return []
+
+
+register_filter(
+    "ASCIIHexDecode",
+    lambda decode_params, chunk_size: [BufferedFilterStage(ASCIIHexDecode.decode)],
+    ["AHx"],
+)
+register_filter(
+    "ASCII85Decode",
+    lambda decode_params, chunk_size: [BufferedFilterStage(ASCII85Decode.decode)],
+    ["A85"],
+)
+register_filter("Crypt", _get_crypt_stages)
+register_filter("FlateDecode", _get_flate_decode_stages, ["Fl"])
+register_filter("LZWDecode", _get_lzw_decode_stages, ["LZW"])
+register_filter(
+    "RunLengthDecode",
+    lambda decode_params, chunk_size: [BufferedFilterStage(RunLengthDecode.decode)],
+    ["RL"],
+)
+
+
+def _get_filter_stages(s: Stream, chunk_size: int) -> typing.List[FilterStage]:
 
     # determine filter(s) to apply
     filters: typing.List[str] = []
@@ -30,41 +118,97 @@ def decode_stream(s: Stream) -> Stream:
     else:
         decode_params = [Dictionary() for x in range(0, len(filters))]
 
-    # apply filter(s)
-    transformed_bytes = s["Bytes"]
+    # build stage(s)
+    stages: typing.List[FilterStage] = []
     for filter_index, filter_name in enumerate(filters):
-        # FLATE
-        if filter_name in ["FlateDecode", "Fl"]:
-            transformed_bytes = FlateDecode.decode(
-                bytes_in=transformed_bytes,
-                columns=int(decode_params[filter_index].get("Columns", Decimal(1))),
-                predictor=int(decode_params[filter_index].get("Predictor", Decimal(1))),
-                bits_per_component=int(
-                    decode_params[filter_index].get("BitsPerComponent", Decimal(8))
-                ),
+        filter_stage_factory = _FILTER_STAGE_FACTORIES.get(str(filter_name))
+
+        # unknown filter
+        if filter_stage_factory is None:
+            raise PDFValueError(
+                expected_value_description="["
+                + ", ".join(["/" + n for n in sorted(_FILTER_STAGE_FACTORIES)])
+                + "]",
+                received_value_description=str(filter_name),
             )
-            continue
 
-        # ASCII85
-        if filter_name in ["ASCII85Decode"]:
-            transformed_bytes = ASCII85Decode.decode(transformed_bytes)
-            continue
+        # a null entry (or a missing entry) means the default decode parameters
+        params = (
+            decode_params[filter_index] if filter_index < len(decode_params) else None
+        )
+        if not isinstance(params, dict):
+            params = Dictionary()
+        stages += filter_stage_factory(params, chunk_size)
+
+    return stages
 
-        # LZW
-        if filter_name in ["LZWDecode"]:
-            transformed_bytes = LZWDecode.decode(transformed_bytes)
-            continue
 
-        # RunLengthDecode
-        if filter_name in ["RunLengthDecode"]:
-            transformed_bytes = RunLengthDecode.decode(transformed_bytes)
+def iter_decoded_bytes(
+    s: Stream,
+    decode_budget: Optional[DecodeBudget] = None,
+    chunk_size: int = DecodePipeline.DEFAULT_CHUNK_SIZE,
+    bytes_in: Optional[Union[bytes, memoryview]] = None,
+) -> Iterator[bytes]:
+    """
+    This function yields the decoded bytes of a Stream (or of the given raw bytes, using the filter(s) of the Stream),
+    a chunk at a time, without holding the (decoded) Stream in its entirety.
+    A DecodeBudgetExceededError is raised as soon as the Stream exceeds the DecodeBudget.
+    """
+    assert isinstance(s, Stream)
+    if bytes_in is None:
+        assert "Bytes" in s
+        bytes_in = s["Bytes"]
+    stages = _get_filter_stages(s, chunk_size)
+    yield from DecodePipeline(stages, decode_budget, chunk_size).decode(bytes_in)
+
+
+def can_be_decoded(s: Stream) -> bool:
+    """
+    This function returns True if every filter of a Stream is registered (see register_filter),
+    so that the Stream can be decoded by iter_decoded_bytes (rather than e.g. from its raw bytes, by PIL)
+    """
+    filters = s.get("Filter", [])
+    if not isinstance(filters, list):
+        filters = [filters]
+    return all([str(f) in _FILTER_STAGE_FACTORIES for f in filters])
+
+
+def _iter_decoded_bytes_of_streams(
+    streams: typing.List[Stream], decode_budget: Optional[DecodeBudget]
+) -> Iterator[Union[bytes, memoryview]]:
+    for i, s in enumerate(streams):
+        if i > 0:
+            yield b" "
+        # a Stream that is (being) decoded, or that is decoded lazily, decodes itself,
+        # DecodedBytes that it does not keep yet are streamed (rather than kept) here as well
+        if "DecodedBytes" in s:
+            yield from s.iter_decoded_bytes()
             continue
+        yield from iter_decoded_bytes(s, decode_budget)
 
-        # unknown filter
-        raise PDFValueError(
-            expected_value_description="[/ASCII85Decode, /FlateDecode, /Fl, /LZWDecode, /RunLengthDecode]",
-            received_value_description=str(filter_name),
-        )
+
+def open_decoded_stream(
+    s: Union[Stream, typing.List[Stream]], decode_budget: Optional[DecodeBudget] = None
+) -> io.BufferedReader:
+    """
+    This function returns an io source that reads the decoded bytes of a Stream (chunk by chunk).
+    Given a List of Streams (e.g. the content streams of a Page), it reads the decoded bytes of every Stream,
+    one after the other (separated by whitespace), without joining them up front.
+    """
+    streams = s if isinstance(s, list) else [s]
+    return io.BufferedReader(
+        DecodedBytesReader(_iter_decoded_bytes_of_streams(streams, decode_budget))
+    )
+
+
+def decode_stream(s: Stream, decode_budget: Optional[DecodeBudget] = None) -> Stream:
+
+    assert isinstance(s, Stream)
+    assert "Bytes" in s
+
+    # apply filter(s)
+    # Bytes may be a (zero-copy) view on the source, DecodedBytes is always bytes
+    transformed_bytes = b"".join(iter_decoded_bytes(s, decode_budget))
 
     # set DecodedBytes
     s["DecodedBytes"] = transformed_bytes
@@ -0,0 +1,83 @@
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+from ptext.io.transform.types import Stream
+
+
+class StreamPrefetcher:
+    """
+    A StreamPrefetcher decodes (lazily decoded) streams concurrently, on a pool of number_of_threads threads,
+    ahead of the moment their DecodedBytes are accessed.
+    zlib releases the GIL while it decompresses, so streams inflate on otherwise idle cores,
+    while the interpreter thread continues (e.g. transforming the fonts and images of a page).
+    The threads are started when the first stream is prefetched.
+
+    Streams that have not been read yet (e.g. the content streams of the next page) can be prefetched by
+    object number, the Stream takes its decoding (see pop_prefetched_object) when it is read.
+    At most MAXIMUM_NUMBER_OF_PREFETCHED_OBJECTS such decodings are kept, the oldest are dropped.
+    """
+
+    MAXIMUM_NUMBER_OF_PREFETCHED_OBJECTS = 64
+
+    def __init__(self, number_of_threads: int):
+        assert number_of_threads >= 1
+        self.number_of_threads = number_of_threads
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # object number -> decoding (of a Stream that has not been read yet)
+        self._prefetched_objects: "OrderedDict[int, Future]" = OrderedDict()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.number_of_threads,
+                thread_name_prefix="ptext-stream-prefetch",
+            )
+        return self._executor
+
+    def prefetch(self, streams: Any) -> "StreamPrefetcher":
+        """
+        This function starts decoding the given Stream (or List of Stream objects) in the background.
+        Anything that is not a (lazily decoded) Stream is ignored.
+        """
+        if not isinstance(streams, list):
+            streams = [streams]
+        for s in streams:
+            if not isinstance(s, Stream):
+                continue
+            s.prefetch(self._get_executor())
+        return self
+
+    def prefetch_object(
+        self, object_number: int, decoder: Callable[[], bytes]
+    ) -> "StreamPrefetcher":
+        """
+        This function starts decoding the Stream with the given object number in the background,
+        before that Stream is read, using the given decoder.
+        """
+        if object_number in self._prefetched_objects:
+            return self
+        self._prefetched_objects[object_number] = self._get_executor().submit(decoder)
+        if (
+            len(self._prefetched_objects)
+            > StreamPrefetcher.MAXIMUM_NUMBER_OF_PREFETCHED_OBJECTS
+        ):
+            self._prefetched_objects.popitem(last=False)
+        return self
+
+    def pop_prefetched_object(self, object_number: int) -> Optional[Future]:
+        """
+        This function returns (and forgets) the decoding of the Stream with the given object number,
+        or None if that Stream is not being prefetched
+        """
+        return self._prefetched_objects.pop(object_number, None)
+
+    def shutdown(self) -> None:
+        """
+        This function waits for all streams that are being decoded, and stops the threads.
+        Prefetching (again) afterwards starts new threads.
+        """
+        self._prefetched_objects.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
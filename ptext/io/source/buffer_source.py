@@ -0,0 +1,119 @@
+import io
+import mmap
+import os
+from typing import Optional, Union
+
+
+class BufferSource(io.RawIOBase):
+    """
+    This class represents a read-only, seekable io source over a contiguous (bytes-like) buffer.
+    Positions are relative to a start offset in the buffer, which makes it possible to skip
+    leading bytes (e.g. garbage in front of %PDF) without copying the buffer.
+    The view returned by getvalue() is shared (not copied), slicing it yields zero-copy views.
+    """
+
+    def __init__(
+        self, buffer: Union[bytes, bytearray, memoryview, mmap.mmap], offset: int = 0
+    ):
+        super(BufferSource, self).__init__()
+        self._view = memoryview(buffer)[offset:]
+        self._pos = 0
+
+    def getvalue(self) -> memoryview:
+        """
+        This function returns a (zero-copy) view of the entire content of this BufferSource
+        """
+        return self._view
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        """
+        Read up to size bytes from this BufferSource and return them.
+        As a convenience, if size is unspecified or -1, all bytes until EOF are returned.
+        """
+        start = min(self._pos, len(self._view))
+        end = (
+            len(self._view)
+            if size is None or size < 0
+            else min(start + size, len(self._view))
+        )
+        self._pos = max(self._pos, end)
+        return self._view[start:end].tobytes()
+
+    def readinto(self, b) -> int:
+        """
+        Read bytes into a pre-allocated, writable bytes-like object b, and return the number of bytes read.
+        """
+        bts = self.read(len(b))
+        b[0 : len(bts)] = bts
+        return len(bts)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        """
+        Change the stream position to the given byte offset. offset is interpreted relative to the position indicated by whence.
+        Return the new absolute position.
+        """
+        if whence == io.SEEK_CUR:
+            pos += self._pos
+        elif whence == io.SEEK_END:
+            pos += len(self._view)
+        if pos < 0:
+            raise ValueError("negative seek value %d" % pos)
+        self._pos = pos
+        return pos
+
+    def tell(self) -> int:
+        """
+        Return the current stream position.
+        """
+        return self._pos
+
+    def close(self) -> None:
+        """
+        Release the view this BufferSource holds on its buffer.
+        Views previously returned by getvalue() (or slices thereof) remain valid.
+        """
+        if not self.closed:
+            try:
+                self._view.release()
+            except BufferError:
+                pass
+        super(BufferSource, self).close()
+
+
+class MemoryMappedSource(BufferSource):
+    """
+    This implementation of BufferSource memory-maps a file (read-only).
+    Pages of the file are loaded by the operating system as they are accessed,
+    rather than copying the entire file into memory up front.
+    """
+
+    def __init__(self, path: Union[str, "os.PathLike"]):
+        with open(path, "rb") as file_handle:
+            file_length = os.fstat(file_handle.fileno()).st_size
+            # an empty file can not be mapped
+            self._mmap: Optional[mmap.mmap] = None
+            if file_length > 0:
+                self._mmap = mmap.mmap(file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        super(MemoryMappedSource, self).__init__(
+            self._mmap if self._mmap is not None else b""
+        )
+        self.name = os.fspath(path)
+
+    def close(self) -> None:
+        """
+        Unmap the file. If views on the map are still referenced elsewhere
+        (e.g. the raw bytes of a Stream), the file is unmapped as soon as the last of those views is released.
+        """
+        super(MemoryMappedSource, self).close()
+        if self._mmap is not None:
+            try:
+                self._mmap.close()
+            except BufferError:
+                pass
+            self._mmap = None
@@ -1,4 +1,6 @@
+import mmap
 import re
+import typing
 from typing import Optional
 
 from ptext.exception.pdf_exception import PDFEOFError, PDFTypeError, PDFSyntaxError
@@ -19,6 +21,26 @@ from ptext.io.transform.types import (
 
 
 class HighLevelTokenizer(LowLevelTokenizer):
+    """
+    This implementation of LowLevelTokenizer reads (composite) PDF objects, rather than tokens.
+    If read_numbers_as_floats is set, numbers are read as (Python) floats, rather than Decimal objects.
+    Only canvas_operator_names (by default CanvasOperatorName.VALID_NAMES) are read as CanvasOperatorName objects.
+    """
+
+    def __init__(
+        self,
+        io_source,
+        read_numbers_as_floats: bool = False,
+        canvas_operator_names: Optional[typing.Set[str]] = None,
+    ):
+        super(HighLevelTokenizer, self).__init__(io_source)
+        self.read_numbers_as_floats = read_numbers_as_floats
+        self.canvas_operator_names = (
+            canvas_operator_names
+            if canvas_operator_names is not None
+            else CanvasOperatorName.VALID_NAMES
+        )
+
     def read_array(self) -> List:
         """
         This method processes the next tokens and returns a PDFArray.
@@ -216,7 +238,9 @@ class HighLevelTokenizer(LowLevelTokenizer):
         # numbers
         if token.token_type == TokenType.NUMBER:
             self.seek(self.tell() + len(token.text))
-            return Decimal(Decimal(token.text))
+            if self.read_numbers_as_floats:
+                return float(token.text)
+            return Decimal(token.text)
 
         # boolean
         if token.token_type == TokenType.OTHER and token.text in ["true", "false"]:
@@ -225,7 +249,7 @@ class HighLevelTokenizer(LowLevelTokenizer):
         # canvas operators
         if (
             token.token_type == TokenType.OTHER
-            and token.text in CanvasOperatorName.VALID_NAMES
+            and token.text in self.canvas_operator_names
         ):
             return CanvasOperatorName(token.text)
 
@@ -291,7 +315,9 @@ class HighLevelTokenizer(LowLevelTokenizer):
                     byte_offset=self.tell(),
                 )
 
-        bytes = self.io_source.read(int(length_of_stream))
+        pos = self.tell()
+        stream_bytes = self._get_stream_bytes(pos, int(length_of_stream))
+        self.seek(pos + len(stream_bytes))
 
         # attempt to read token "endstream"
         end_of_stream_token = self.next_non_comment_token()
@@ -306,7 +332,22 @@ class HighLevelTokenizer(LowLevelTokenizer):
             )
 
         # set Bytes
-        stream_dictionary["Bytes"] = bytes
+        stream_dictionary["Bytes"] = stream_bytes
 
         # return
-        return Stream(stream_dictionary)
+        # the Stream can read its Bytes again (from the source), so that it can drop them (see StreamDecodePolicy)
+        length = len(stream_bytes)
+        return Stream(stream_dictionary).set_raw_bytes_reader(
+            lambda: self._get_stream_bytes(pos, length)
+        )
+
+    def _get_stream_bytes(self, pos: int, length: int):
+        # slice the bytes (rather than reading them)
+        # only a memory-mapped source keeps (zero-copy) views, other sources copy the bytes of the stream,
+        # so that a Stream does not keep the entire source alive
+        stream_bytes = self.get_buffer()[pos : pos + length]
+        if not isinstance(stream_bytes, memoryview) or not isinstance(
+            stream_bytes.obj, mmap.mmap
+        ):
+            stream_bytes = bytes(stream_bytes)
+        return stream_bytes
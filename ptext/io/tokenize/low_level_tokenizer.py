@@ -1,6 +1,7 @@
 import enum
 import io
-from typing import Optional
+import re
+from typing import Optional, Tuple
 
 from ptext.exception.pdf_exception import PDFEOFError, PDFSyntaxError
 
@@ -50,6 +51,26 @@ class Token:
         return self
 
 
+# fmt: off
+_WHITESPACE_BYTES = b"\x00\t\n\x0c\r "
+_DELIMITER_BYTES = _WHITESPACE_BYTES + b"%()/<>[]"
+# fmt: on
+
+# 256-entry lookup tables, indexed by byte value
+_IS_WHITESPACE = tuple(i in _WHITESPACE_BYTES for i in range(0, 256))
+_IS_DELIMITER = tuple(i in _DELIMITER_BYTES for i in range(0, 256))
+_IS_NUMBER_START = tuple(i in b"-+.0123456789" for i in range(0, 256))
+
+# compiled scanners, each matching a complete token (or run of whitespace)
+_WHITESPACE_RUN = re.compile(b"[" + re.escape(_WHITESPACE_BYTES) + b"]*")
+_NAME = re.compile(b"/[^" + re.escape(_DELIMITER_BYTES) + b"]*")
+_NUMBER = re.compile(b"[-+.0-9]+")
+_COMMENT = re.compile(b"%[^\r\n]*")
+_OTHER = re.compile(b"[^" + re.escape(_DELIMITER_BYTES) + b"]*")
+_HEX_STRING_END = re.compile(b">")
+_STRING_SPECIAL_CHARACTER = re.compile(b"[\\\\()]")
+
+
 class LowLevelTokenizer:
     """
     In computer science, lexical analysis, lexing or tokenization is the process of converting a sequence of characters
@@ -58,11 +79,41 @@ class LowLevelTokenizer:
     although scanner is also a term for the first stage of a lexer.
     A lexer is generally combined with a parser, which together analyze the syntax of programming languages, web pages,
     and so forth.
+
+    This implementation scans a single in-memory view of the io source (rather than calling read(1) for every byte).
+    The position of the io source is kept in sync with the tokenizer, so callers may freely seek the io source.
     """
 
     def __init__(self, io_source):
         self.io_source = io_source
 
+    @property
+    def io_source(self):
+        return self._io_source
+
+    @io_source.setter
+    def io_source(self, io_source):
+        self._io_source = io_source
+        self._buffer = None
+
+    def get_buffer(self):
+        """
+        This function returns the contiguous (bytes-like) view of the io source this LowLevelTokenizer scans.
+        The view is built (once) on first use. Sources that offer getvalue() (such as io.BytesIO or BufferSource)
+        are shared, other sources are read into memory.
+        """
+        if self._buffer is None:
+            src = self._io_source
+            if hasattr(src, "getvalue"):
+                # BytesIO shares its initial bytes object, so this does not copy
+                self._buffer = src.getvalue()
+            else:
+                pos = src.tell()
+                src.seek(0)
+                self._buffer = src.read()
+                src.seek(pos)
+        return self._buffer
+
     def next_non_comment_token(self) -> Optional[Token]:
         """
         This function retrieves the next non-comment Token.
@@ -78,133 +129,101 @@ class LowLevelTokenizer:
         This function retrieves the next Token.
         It returns None if no such Token exists (end of stream/file)
         """
-        ch = self._next_char()
-        if len(ch) == 0:
-            return None
+        buf = self.get_buffer()
+        pos = self._io_source.tell()
+        token, pos = self._scan_token(buf, pos)
+        self._io_source.seek(pos)
+        return token
 
-        while len(ch) > 0 and self._is_whitespace(ch):
-            ch = self._next_char()
+    def _scan_token(self, buf, pos: int) -> Tuple[Optional[Token], int]:
+        """
+        This function scans a single Token in buf, starting at pos.
+        It returns the Token (or None) and the position right after the Token
+        """
+        n = len(buf)
+        if pos >= n:
+            return None, pos
+
+        # skip whitespace
+        if _IS_WHITESPACE[buf[pos]]:
+            pos = _WHITESPACE_RUN.match(buf, pos).end()
+
+        # only whitespace remained
+        if pos >= n:
+            return Token(n - 1, TokenType.NUMBER, ""), n
+
+        ch = buf[pos]
 
         # START_ARRAY
-        if ch == "[":
-            return Token(self.io_source.tell() - 1, TokenType.START_ARRAY, "[")
+        if ch == 91:
+            return Token(pos, TokenType.START_ARRAY, "["), pos + 1
 
         # END ARRAY
-        if ch == "]":
-            return Token(self.io_source.tell() - 1, TokenType.END_ARRAY, "]")
+        if ch == 93:
+            return Token(pos, TokenType.END_ARRAY, "]"), pos + 1
 
         # NAME
-        if ch == "/":
-            out_str = "/"
-            out_pos = self.io_source.tell() - 1
-            while True:
-                ch = self._next_char()
-                if len(ch) == 0:
-                    break
-                if self._is_delimiter(ch):
-                    break
-                out_str += ch
-            if len(ch) != 0:
-                self._prev_char()
-            return Token(out_pos, TokenType.NAME, out_str)
+        if ch == 47:
+            end = _NAME.match(buf, pos).end()
+            return Token(pos, TokenType.NAME, str(buf[pos:end], "latin-1")), end
 
         # END_DICT
-        if ch == ">":
-            out_pos = self.io_source.tell() - 1
-            ch = self._next_char()
+        if ch == 62:
             # UNEXPECTED CHARACTER AFTER >
-            if ch != ">":
+            if pos + 1 >= n or buf[pos + 1] != 62:
                 raise PDFSyntaxError(
-                    message="invalid character, expected >, received %s" % ch,
-                    byte_offset=self.io_source.tell(),
+                    message="invalid character, expected >, received %s"
+                    % str(buf[pos + 1 : pos + 2], "latin-1"),
+                    byte_offset=min(pos + 2, n),
                 )
-            return Token(out_pos, TokenType.END_DICT, ">>")
+            return Token(pos, TokenType.END_DICT, ">>"), pos + 2
 
         # COMMENT
-        if ch == "%":
-            out_str = ""
-            out_pos = self.io_source.tell() - 1
-            while len(ch) != 0 and ch != "\r" and ch != "\n":
-                out_str += ch
-                ch = self._next_char()
-            if len(ch) != 0:
-                self._prev_char()
-            return Token(out_pos, TokenType.COMMENT, out_str)
+        if ch == 37:
+            end = _COMMENT.match(buf, pos).end()
+            return Token(pos, TokenType.COMMENT, str(buf[pos:end], "latin-1")), end
 
         # HEX_STRING OR DICT
-        if ch == "<":
-            out_pos = self.io_source.tell() - 1
-            ch = self._next_char()
+        if ch == 60:
 
             # DICT
-            if ch == "<":
-                return Token(out_pos, TokenType.START_DICT, "<<")
+            if pos + 1 < n and buf[pos + 1] == 60:
+                return Token(pos, TokenType.START_DICT, "<<"), pos + 2
 
-            # empty hex string
-            if ch == ">":
-                return Token(out_pos, TokenType.HEX_STRING, "<>")
-
-            # HEX_STRING
-            out_str = "<" + ch
-            while True:
-                ch = self._next_char()
-                if len(ch) == 0:
-                    break
-                out_str += ch
-                if ch == ">":
-                    break
-
-            return Token(out_pos, TokenType.HEX_STRING, out_str)
+            # HEX_STRING (including the empty hex string)
+            m = _HEX_STRING_END.search(buf, pos + 1)
+            end = n if m is None else m.end()
+            return Token(pos, TokenType.HEX_STRING, str(buf[pos:end], "latin-1")), end
 
         # NUMBER
-        if ch in "-+.0123456789":
-            out_str = ""
-            out_pos = self.io_source.tell() - 1
-            while len(ch) != 0 and ch in "-+.0123456789":
-                out_str += ch
-                ch = self._next_char()
-            if len(ch) != 0:
-                self._prev_char()
-            return Token(out_pos, TokenType.NUMBER, out_str)
+        if _IS_NUMBER_START[ch]:
+            end = _NUMBER.match(buf, pos).end()
+            return Token(pos, TokenType.NUMBER, str(buf[pos:end], "latin-1")), end
 
         # STRING
-        if ch == "(":
+        if ch == 40:
             bracket_nesting_level = 1
-            out_str = "("
-            out_pos = self.io_source.tell() - 1
-            while True:
-                ch = self._next_char()
-                if len(ch) == 0:
-                    break
-                if ch == "\\":
-                    ch = self._next_char()
-                    out_str += "\\" + ch
-                    continue
-                if ch == "(":
+            end = pos + 1
+            while bracket_nesting_level > 0:
+                m = _STRING_SPECIAL_CHARACTER.search(buf, end)
+                if m is None:
+                    raise PDFEOFError()
+                end = m.end()
+                c = buf[m.start()]
+                if c == 92:
+                    # skip escaped character
+                    end += 1
+                    if end > n:
+                        raise PDFEOFError()
+                elif c == 40:
                     bracket_nesting_level += 1
-                if ch == ")":
+                else:
                     bracket_nesting_level -= 1
-                out_str += ch
-                if bracket_nesting_level == 0:
-                    break
-            if len(ch) == 0:
-                raise PDFEOFError()
-            if out_str.endswith("\\"):
-                raise PDFSyntaxError(
-                    message="unterminated escape sequence",
-                    byte_offset=self.io_source.tell(),
-                )
-            return Token(out_pos, TokenType.STRING, out_str)
+            return Token(pos, TokenType.STRING, str(buf[pos:end], "latin-1")), end
 
         # OTHER
-        out_str = ""
-        out_pos = self.io_source.tell() - 1
-        while len(ch) != 0 and not self._is_delimiter(ch):
-            out_str += ch
-            ch = self._next_char()
-        if len(ch) != 0:
-            self._prev_char()
-        return Token(out_pos, TokenType.OTHER, out_str)
+        end = _OTHER.match(buf, pos).end()
+        return Token(pos, TokenType.OTHER, str(buf[pos:end], "latin-1")), end
 
     def seek(self, pos: int, whence: int = io.SEEK_SET):
         """
@@ -215,24 +234,25 @@ class LowLevelTokenizer:
         SEEK_END or 2 – end of the stream; offset is usually negative
         Return the new absolute position.
         """
-        return self.io_source.seek(pos, whence)
+        return self._io_source.seek(pos, whence)
 
     def tell(self) -> int:
         """
         Return the current stream position.
         """
-        return self.io_source.tell()
+        return self._io_source.tell()
 
     def _is_delimiter(self, ch: str) -> bool:
-        # fmt: off
-        return ord(ch) in [ -1, 0, 9, 10, 12, 13, 32, 37, 40, 41, 47, 60, 62, 91, 93,]
-        # fmt: on
+        return len(ch) == 0 or _IS_DELIMITER[ord(ch)]
 
     def _is_whitespace(self, ch: str) -> bool:
-        return ord(ch) in [0, 9, 10, 12, 13, 32]
+        return _IS_WHITESPACE[ord(ch)]
 
     def _next_char(self):
-        return self.io_source.read(1).decode("latin-1")
+        buf = self.get_buffer()
+        pos = self._io_source.tell()
+        self._io_source.seek(min(pos + 1, max(len(buf), pos)))
+        return str(buf[pos : pos + 1], "latin-1")
 
     def _prev_char(self):
-        return self.io_source.seek(-1, io.SEEK_CUR)
+        return self._io_source.seek(-1, io.SEEK_CUR)
@@ -1,9 +1,12 @@
 import io
 import typing
+from concurrent.futures import Future
 from typing import Optional, Any, Union
 
+from ptext.io.filter.decode_pipeline import DecodeBudget
+from ptext.io.filter.stream_prefetcher import StreamPrefetcher
 from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
-from ptext.io.transform.types import AnyPDFType
+from ptext.io.transform.types import AnyPDFType, StreamDecodePolicy
 from ptext.pdf.canvas.event.event_listener import EventListener
 
 
@@ -13,11 +16,39 @@ class TransformerContext:
         source: Optional[Union[io.BufferedIOBase, io.RawIOBase]] = None,
         tokenizer: Optional[HighLevelTokenizer] = None,
         root_object: Optional[Any] = None,
+        resolve_references_lazily: bool = False,
+        decode_budget: Optional[DecodeBudget] = None,
+        stream_decode_policy: StreamDecodePolicy = StreamDecodePolicy.KEEP_BOTH,
+        stream_prefetcher: Optional[StreamPrefetcher] = None,
+        fast_math: bool = False,
+        read_images: bool = True,
     ):
         self.source = source
         self.tokenizer = tokenizer
         self.root_object = root_object
         self.indirect_reference_chain = []
+        self.resolve_references_lazily = resolve_references_lazily
+        self.decode_budget = decode_budget or DecodeBudget()
+        self.stream_decode_policy = stream_decode_policy
+        self.stream_prefetcher = stream_prefetcher
+        self.fast_math = fast_math
+        self.read_images = read_images
+
+    def pop_prefetched_stream(self) -> Optional[Future]:
+        """
+        This function returns (and forgets) the decoding of the Stream that is being read
+        (the last object in the indirect reference chain), or None if that Stream is not being prefetched
+        (see StreamPrefetcher.prefetch_object)
+        """
+        if (
+            self.stream_prefetcher is None
+            or len(self.indirect_reference_chain) == 0
+            or not self.indirect_reference_chain[-1].isdigit()
+        ):
+            return None
+        return self.stream_prefetcher.pop_prefetched_object(
+            int(self.indirect_reference_chain[-1])
+        )
 
 
 class BaseTransformer:
@@ -62,12 +62,16 @@ class DefaultLowLevelObjectTransformer(BaseTransformer):
         self.add_child_transformer(DefaultFontDictionaryTransformer())
         self.add_child_transformer(DefaultFontDescriptorDictionaryTransformer())
         # images
-        self.add_child_transformer(DefaultCCITTFaxImageTransformer())
-        self.add_child_transformer(DefaultDCTDecodeImageTransformer())
-        self.add_child_transformer(DefaultGrayscaleImageTransformer())
-        self.add_child_transformer(DefaultJBIG2ImageTransformer())
-        self.add_child_transformer(DefaultJPEG2000ImageTransformer())
-        self.add_child_transformer(DefaultJPEGImageTransformer())
+        self.image_transformers = [
+            DefaultCCITTFaxImageTransformer(),
+            DefaultDCTDecodeImageTransformer(),
+            DefaultGrayscaleImageTransformer(),
+            DefaultJBIG2ImageTransformer(),
+            DefaultJPEG2000ImageTransformer(),
+            DefaultJPEGImageTransformer(),
+        ]
+        for h in self.image_transformers:
+            self.add_child_transformer(h)
         # pages
         self.add_child_transformer(DefaultPageDictionaryTransformer())
         # references
@@ -100,7 +104,19 @@ class DefaultLowLevelObjectTransformer(BaseTransformer):
                 TransformerContext(),
                 event_listeners,
             )
-        else:
-            return super().transform(
-                object_to_transform, parent_object, context, event_listeners
-            )
+        if not context.read_images:
+            # image XObject(s) are kept as (undecoded) Stream objects
+            for h in self.handlers:
+                if h in self.image_transformers:
+                    continue
+                if h.can_be_transformed(object_to_transform):
+                    return h.transform(
+                        object_to_transform,
+                        parent_object=parent_object,
+                        context=context,
+                        event_listeners=event_listeners,
+                    )
+            return None
+        return super().transform(
+            object_to_transform, parent_object, context, event_listeners
+        )
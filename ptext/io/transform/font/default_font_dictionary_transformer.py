@@ -52,6 +52,10 @@ class DefaultFontDictionaryTransformer(BaseTransformer):
         if font_obj is not None:
             font_obj.set_parent(parent_object)
 
+        # keep the reference (if the font dictionary is an indirect object)
+        if font_obj is not None and object_to_transform.get_reference() is not None:
+            font_obj.set_reference(object_to_transform.get_reference())
+
         # add listener(s)
         for l in event_listeners:
             font_obj.add_event_listener(l)
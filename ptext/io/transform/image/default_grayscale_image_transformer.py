@@ -5,7 +5,7 @@ from typing import Optional, Any, Union
 
 from PIL import Image   # type: ignore [import]
 
-from ptext.io.filter.stream_decode_util import decode_stream
+from ptext.io.filter.stream_decode_util import open_decoded_stream
 from ptext.io.transform.base_transformer import BaseTransformer, TransformerContext
 from ptext.io.transform.types import add_base_methods, Reference, AnyPDFType, Stream
 from ptext.pdf.canvas.event.event_listener import EventListener
@@ -47,22 +47,26 @@ class DefaultGrayscaleImageTransformer(BaseTransformer):
                 v = xref.get(v, context.tokenizer.io_source, context.tokenizer)
                 object_to_transform[k] = v
 
-        grayscale_bytes = [
-            x for x in decode_stream(object_to_transform)["DecodedBytes"]
-        ]
-
         # use PIL to process image bytes
+        # (only the bytes of the image are decoded, and they are not kept as DecodedBytes)
+        # an image that was prefetched (see DefaultPageDictionaryTransformer) takes that decoding
         w = int(object_to_transform["Width"])
         h = int(object_to_transform["Height"])
-        tmp = Image.new("RGB", (w, h))
-        for i in range(0, w):
-            for j in range(0, h):
-                k = i * h + j
-                try:
-                    c = (grayscale_bytes[k], grayscale_bytes[k], grayscale_bytes[k])
-                    tmp.putpixel((i, j), value=c)
-                except:
-                    pass
+        prefetched_bytes = context.pop_prefetched_stream()
+        if prefetched_bytes is not None:
+            grayscale_bytes = prefetched_bytes.result()[: w * h]
+        else:
+            grayscale_bytes = open_decoded_stream(
+                object_to_transform, context.decode_budget
+            ).read(w * h)
+        grayscale_bytes += bytes(w * h - len(grayscale_bytes))
+
+        # the byte at i * h + j is the pixel at (i, j)
+        tmp = (
+            Image.frombytes("L", (h, w), grayscale_bytes)
+            .transpose(Image.TRANSPOSE)
+            .convert("RGB")
+        )
 
         # add base methods
         add_base_methods(tmp.__class__)
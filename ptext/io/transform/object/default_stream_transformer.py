@@ -2,7 +2,7 @@ import io
 import typing
 from typing import Optional, Any, Union
 
-from ptext.io.filter.stream_decode_util import decode_stream
+from ptext.io.filter.stream_decode_util import iter_decoded_bytes
 from ptext.io.transform.base_transformer import BaseTransformer, TransformerContext
 from ptext.io.transform.types import (
     Dictionary,
@@ -43,8 +43,29 @@ class DefaultStreamTransformer(BaseTransformer):
                 v = xref.get(v, context.tokenizer.io_source, context.tokenizer)
                 object_to_transform[k] = v
 
-        # apply filter(s)
-        object_to_transform = decode_stream(object_to_transform)
+        # apply filter(s), when the DecodedBytes are first accessed
+        # a Stream that is decoded again (see StreamDecodePolicy) is not charged to the DecodeBudget again
+        decode_budgets = [context.decode_budget]
+
+        def chunked_decoder(s: Stream, bytes_in: Any) -> typing.Iterator[bytes]:
+            yield from iter_decoded_bytes(s, decode_budgets[0], bytes_in=bytes_in)
+            decode_budgets[0] = None
+
+        def decoder(s: Stream, bytes_in: Any) -> bytes:
+            return b"".join(chunked_decoder(s, bytes_in))
+
+        object_to_transform.set_decoder(
+            decoder, context.stream_decode_policy, chunked_decoder
+        )
+
+        # a Stream that was prefetched before it was read (e.g. a content stream of the next page)
+        # takes that decoding, which has been charged to the DecodeBudget
+        prefetched_bytes = context.pop_prefetched_stream()
+        if prefetched_bytes is not None:
+            decode_budgets[0] = None
+            object_to_transform.set_prefetched_bytes(prefetched_bytes)
+        if "Type" not in object_to_transform:
+            object_to_transform["Type"] = "Stream"
 
         # convert (remainder of) stream dictionary
         for k, v in object_to_transform.items():
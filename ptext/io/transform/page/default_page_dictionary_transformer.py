@@ -3,11 +3,18 @@ import typing
 from typing import Optional, List, Any, Union, Dict
 
 from ptext.exception.pdf_exception import PDFTypeError
+from ptext.io.filter.stream_decode_util import (
+    can_be_decoded,
+    iter_decoded_bytes,
+    open_decoded_stream,
+)
 from ptext.io.transform.base_transformer import BaseTransformer, TransformerContext
 from ptext.io.transform.types import (
     Dictionary,
     List,
     AnyPDFType,
+    Reference,
+    Stream,
 )
 from ptext.pdf.canvas.canvas import Canvas
 from ptext.pdf.canvas.event.begin_page_event import BeginPageEvent
@@ -17,6 +24,18 @@ from ptext.pdf.page.page import Page
 
 
 class DefaultPageDictionaryTransformer(BaseTransformer):
+
+    INHERITABLE_KEYS = ["Resources", "MediaBox", "CropBox", "Rotate"]
+
+    def __init__(self):
+        super().__init__()
+        self.cache = {}
+        self.number_of_pages = 0
+        # object number of a page -> Reference of the next kid (in the same Kids array)
+        self.next_kids: Dict[int, Reference] = {}
+        # object numbers of the images that have been prefetched (images are often shared among pages)
+        self.prefetched_images: typing.Set[int] = set()
+
     def can_be_transformed(
         self, object: Union[io.BufferedIOBase, io.RawIOBase, AnyPDFType]
     ) -> bool:
@@ -36,21 +55,41 @@ class DefaultPageDictionaryTransformer(BaseTransformer):
         tmp = Page().set_parent(parent_object)
 
         # add listener(s)
+        # (the EventListener(s) of the Document are notified of the events of each of its pages)
+        if context is not None and context.root_object is not None:
+            event_listeners = event_listeners + [
+                l
+                for l in context.root_object.get_event_listeners()
+                if l not in event_listeners
+            ]
         for l in event_listeners:
             tmp.add_event_listener(l)
 
         # convert key/value pairs
+        # Contents are converted first, so that its stream(s) can be decoded (prefetched)
+        # while the other keys (e.g. the fonts and images in Resources) are converted
         assert isinstance(object_to_transform, Dictionary)
-        for k, v in object_to_transform.items():
+        keys = sorted(object_to_transform.keys(), key=lambda k: k != "Contents")
+        for k in keys:
             # avoid circular reference
             if k == "Parent":
                 continue
-            v = self.get_root_transformer().transform(v, tmp, context, [])
+            v = self.get_root_transformer().transform(
+                object_to_transform[k], tmp, context, []
+            )
             if v is not None:
                 tmp[k] = v
+            if k == "Contents" and context is not None:
+                self._prefetch_contents(tmp, context)
+                self._prefetch_images(object_to_transform, context)
+                self._prefetch_next_page(object_to_transform, context)
+
+        # inherited attributes
+        self._inherit_attributes(object_to_transform, tmp, context)
 
         # send out BeginPageEvent
-        tmp.event_occurred(BeginPageEvent(tmp))
+        page_number = self._get_page_number(context)
+        tmp.event_occurred(BeginPageEvent(tmp, page_number))
 
         # set up canvas
         if "Contents" not in tmp:
@@ -60,19 +99,200 @@ class DefaultPageDictionaryTransformer(BaseTransformer):
             )
         contents = tmp["Contents"]
         if contents is not None:
-            canvas = Canvas().set_parent(tmp)
-
-            # process bytes in stream
-            if isinstance(contents, dict):
-                canvas.read(io.BytesIO(contents["DecodedBytes"]))
+            assert context is not None
+            canvas = Canvas(context.fast_math).set_parent(tmp)
+            for l in event_listeners:
+                canvas.add_event_listener(l)
 
-            # process bytes in array
-            if isinstance(contents, list):
-                bts = b"".join([x["DecodedBytes"] + b" " for x in contents])
-                canvas.read(io.BytesIO(bts))
+            # process bytes in stream (or array of streams)
+            if isinstance(contents, (dict, list)):
+                canvas.read(open_decoded_stream(contents, context.decode_budget))
 
         # send out EndPageEvent
-        tmp.event_occurred(EndPageEvent(tmp))
+        tmp.event_occurred(EndPageEvent(tmp, page_number))
 
         # return
         return tmp
+
+    def _get_page_number(self, context: Optional[TransformerContext]) -> int:
+        """
+        This function returns the (0-based) page number of the page that is being transformed.
+        A lazily loaded page is looked up (by its object number) in the page tree of the Document,
+        since pages may be accessed in any order (and more than once). Other pages are read in the order
+        of the page tree, and numbered in the order in which they are read.
+        """
+        page_number = None
+        if (
+            context is not None
+            and context.resolve_references_lazily
+            and len(context.indirect_reference_chain) > 0
+            and context.indirect_reference_chain[-1].isdigit()
+        ):
+            page_number = context.root_object.get_page_number(
+                int(context.indirect_reference_chain[-1])
+            )
+        if page_number is None:
+            page_number = self.number_of_pages
+            self.number_of_pages += 1
+        return page_number
+
+    def _prefetch_contents(self, page: Page, context: TransformerContext) -> None:
+        """
+        This function starts decoding the content stream(s) of a page in the background,
+        if the TransformerContext has a StreamPrefetcher
+        """
+        if context.stream_prefetcher is None or page.get("Contents") is None:
+            return
+        contents = page["Contents"]
+        if isinstance(contents, list):
+            contents = [x for x in contents]
+        context.stream_prefetcher.prefetch(contents)
+
+    def _prefetch_next_page(
+        self, object_to_transform: Dictionary, context: TransformerContext
+    ) -> None:
+        """
+        This function starts decoding the content stream(s) (and images) of the next page
+        (the next kid of the parent of a page) in the background, before that page is read,
+        if the TransformerContext has a StreamPrefetcher. They are then decoded while this page is being processed.
+        """
+        if (
+            context.stream_prefetcher is None
+            or len(context.indirect_reference_chain) == 0
+            or not context.indirect_reference_chain[-1].isdigit()
+        ):
+            return
+        parent = object_to_transform.get("Parent")
+        if not isinstance(parent, Reference):
+            return
+        self._get_inheritable_attributes(parent, context)
+        next_kid = self.next_kids.get(int(context.indirect_reference_chain[-1]))
+        if next_kid is None:
+            return
+
+        # read the (untransformed) next page, and its content stream(s)
+        xref = context.root_object["XRef"]
+        next_page = xref.get(next_kid, context.source, context.tokenizer)
+        if not isinstance(next_page, dict) or next_page.get("Type") != "Page":
+            return
+        contents = next_page.get("Contents")
+        if not isinstance(contents, list):
+            contents = [contents]
+        decode_budget = context.decode_budget
+        for r in contents:
+            if not isinstance(r, Reference) or r.object_number is None:
+                continue
+            s = xref.get(r, context.source, context.tokenizer)
+            if not isinstance(s, Stream):
+                continue
+            context.stream_prefetcher.prefetch_object(
+                r.object_number,
+                lambda s=s: b"".join(iter_decoded_bytes(s, decode_budget)),
+            )
+        self._prefetch_images(next_page, context)
+
+    def _prefetch_images(
+        self, object_to_transform: Dictionary, context: TransformerContext
+    ) -> None:
+        """
+        This function starts decoding the image XObject(s) in the Resources of an (untransformed) page
+        in the background, before they are read, if the TransformerContext has a StreamPrefetcher and images are read.
+        Only images that are decoded by their filter(s) are prefetched, not those that are read from their raw bytes
+        (e.g. DCTDecode images).
+        """
+        if context.stream_prefetcher is None or not context.read_images:
+            return
+        xref = context.root_object["XRef"]
+        resources = object_to_transform.get("Resources")
+        if isinstance(resources, Reference):
+            resources = xref.get(resources, context.source, context.tokenizer)
+        if not isinstance(resources, dict):
+            return
+        xobjects = resources.get("XObject")
+        if isinstance(xobjects, Reference):
+            xobjects = xref.get(xobjects, context.source, context.tokenizer)
+        if not isinstance(xobjects, dict):
+            return
+        decode_budget = context.decode_budget
+        for r in xobjects.values():
+            if (
+                not isinstance(r, Reference)
+                or r.object_number is None
+                or r.object_number in self.prefetched_images
+            ):
+                continue
+            s = xref.get(r, context.source, context.tokenizer)
+            if (
+                not isinstance(s, Stream)
+                or s.get("Subtype") != "Image"
+                or "Filter" not in s
+                or not can_be_decoded(s)
+            ):
+                continue
+            self.prefetched_images.add(r.object_number)
+            context.stream_prefetcher.prefetch_object(
+                r.object_number,
+                lambda s=s: b"".join(iter_decoded_bytes(s, decode_budget)),
+            )
+
+    def _inherit_attributes(
+        self,
+        object_to_transform: Dictionary,
+        page: Page,
+        context: Optional[TransformerContext] = None,
+    ) -> None:
+        """
+        Some of the page attributes shall be inheritable. If such an attribute is omitted from a page object,
+        its value shall be inherited from an ancestor node in the page tree.
+        If the attribute is a required one, a value shall be supplied in an ancestor node.
+        If the attribute is optional and no inherited value is specified, the default value shall be used.
+        (see 7.7.3.4, "Inheritance of Page Attributes")
+        """
+        assert context is not None
+        parent = object_to_transform.get("Parent")
+        visited = set()
+        while isinstance(parent, Reference) and any(
+            [k not in page for k in DefaultPageDictionaryTransformer.INHERITABLE_KEYS]
+        ):
+            # avoid circular reference
+            if parent.object_number in visited:
+                break
+            visited.add(parent.object_number)
+
+            # read (inheritable keys of) ancestor node
+            node = self._get_inheritable_attributes(parent, context)
+            if node is None:
+                break
+            for k in DefaultPageDictionaryTransformer.INHERITABLE_KEYS:
+                if k in page or k not in node:
+                    continue
+                v = self.get_root_transformer().transform(node[k], page, context, [])
+                if v is not None:
+                    page[k] = v
+            parent = node.get("Parent")
+
+    def _get_inheritable_attributes(
+        self, reference: Reference, context: TransformerContext
+    ) -> Optional[Dictionary]:
+        """
+        This function returns the (untransformed) inheritable attributes, and Parent of a page tree node.
+        These are cached, since each page would otherwise read its ancestor nodes (and their Kids) again.
+        The next kid of each of its kids is kept as well (see _prefetch_next_page).
+        """
+        if reference.object_number in self.cache:
+            return self.cache[reference.object_number]
+        node = context.root_object["XRef"].get(
+            reference, context.source, context.tokenizer
+        )
+        if isinstance(node, dict):
+            kids = node.get("Kids")
+            if isinstance(kids, list):
+                for kid, next_kid in zip(kids, kids[1:]):
+                    if isinstance(kid, Reference) and kid.object_number is not None:
+                        self.next_kids[int(kid.object_number)] = next_kid
+            keys = DefaultPageDictionaryTransformer.INHERITABLE_KEYS + ["Parent"]
+            node = {k: v for k, v in node.items() if k in keys}
+        else:
+            node = None
+        self.cache[reference.object_number] = node
+        return node
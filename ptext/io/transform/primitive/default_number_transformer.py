@@ -21,4 +21,5 @@ class DefaultNumberTransformer(BaseTransformer):
         context: Optional[TransformerContext] = None,
         event_listeners: typing.List[EventListener] = [],
     ) -> Any:
-        return Decimal(object_to_transform).set_parent(parent_object)
+        # Decimal objects are immutable, and keep no link to their parent, so they need not be copied
+        return object_to_transform
@@ -3,8 +3,9 @@ import typing
 from typing import Optional, Any, Union
 
 from ptext.io.transform.base_transformer import BaseTransformer, TransformerContext
-from ptext.io.transform.types import Reference, AnyPDFType
+from ptext.io.transform.types import Reference, AnyPDFType, ReferenceProxy
 from ptext.pdf.canvas.event.event_listener import EventListener
+from ptext.pdf.canvas.font.font import Font
 
 
 class DefaultReferenceTransformer(BaseTransformer):
@@ -26,19 +27,47 @@ class DefaultReferenceTransformer(BaseTransformer):
     ) -> Any:
 
         assert isinstance(object_to_transform, Reference)
+        assert context is not None
 
-        # canonic reference
+        # defer resolving the reference until it is accessed
+        if context.resolve_references_lazily:
+            ref_uuid = self._get_reference_uuid(object_to_transform)
+            if ref_uuid in self.cache:
+                return self.cache[ref_uuid]
+            return ReferenceProxy(
+                object_to_transform,
+                lambda: self._resolve(
+                    object_to_transform, parent_object, context, event_listeners
+                ),
+            )
+
+        return self._resolve(
+            object_to_transform, parent_object, context, event_listeners
+        )
+
+    def _get_reference_uuid(self, reference: Reference) -> str:
         ref_uuid = ""
-        if object_to_transform.object_number is not None:
-            ref_uuid = "%d" % object_to_transform.object_number
-        if object_to_transform.parent_stream_object_number is not None:
+        if reference.object_number is not None:
+            ref_uuid = "%d" % reference.object_number
+        if reference.parent_stream_object_number is not None:
             ref_uuid = "%d/%d" % (
-                object_to_transform.parent_stream_object_number,
-                object_to_transform.index_in_parent_stream,
+                reference.parent_stream_object_number,
+                reference.index_in_parent_stream,
             )
+        return ref_uuid
+
+    def _resolve(
+        self,
+        object_to_transform: Reference,
+        parent_object: Any,
+        context: TransformerContext,
+        event_listeners: typing.List[EventListener] = [],
+    ) -> Any:
+
+        # canonic reference
+        ref_uuid = self._get_reference_uuid(object_to_transform)
 
         # check for circular reference
-        assert context is not None
         if ref_uuid in context.indirect_reference_chain:
             return None
 
@@ -67,3 +96,13 @@ class DefaultReferenceTransformer(BaseTransformer):
 
         # return
         return val
+
+    def release(self, number_of_objects_to_keep: int) -> None:
+        """
+        This function removes all objects from the cache, except the first number_of_objects_to_keep objects.
+        Fonts are kept, since they are typically shared among pages.
+        """
+        keys = list(self.cache.keys())[number_of_objects_to_keep:]
+        for k in keys:
+            if not isinstance(self.cache[k], Font):
+                self.cache.pop(k)
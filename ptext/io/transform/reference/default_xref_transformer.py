@@ -5,6 +5,7 @@ from decimal import Decimal
 from typing import Union, Optional, Any
 
 from ptext.exception.pdf_exception import PDFCommentTokenNotFoundError
+from ptext.io.source.buffer_source import BufferSource
 from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
 from ptext.io.transform.base_transformer import BaseTransformer, TransformerContext
 from ptext.io.transform.types import AnyPDFType
@@ -40,6 +41,12 @@ class DefaultXREFTransformer(BaseTransformer):
         context.root_object = Document()
         context.source = object_to_transform
         context.tokenizer = HighLevelTokenizer(context.source)
+        context.root_object.set_tokenizer(context.tokenizer)
+        context.root_object.set_decode_budget(context.decode_budget)
+
+        # from here on, read from an in-memory view of the source
+        context.source = BufferSource(context.tokenizer.get_buffer())
+        context.tokenizer.io_source = context.source
 
         # add listener(s)
         for l in event_listeners:
@@ -89,27 +96,16 @@ class DefaultXREFTransformer(BaseTransformer):
         assert context.source is not None
 
         # read first 2 Kb
-        bytes_near_sof = "".join(
-            [context.source.read(1).decode("latin-1") for _ in range(0, 2048)]
-        )
-        context.source.seek(0)
+        bytes_near_sof = context.source.getvalue()[0:2048].tobytes()
 
         # find %PDF-
-        index_of_pdf_comment = -1
-        try:
-            index_of_pdf_comment = bytes_near_sof.index("%PDF")
-        except ValueError:
-            pass
+        index_of_pdf_comment = bytes_near_sof.find(b"%PDF")
 
-        # truncate
+        # skip prefix (by offset, rather than by copying the remainder of the file)
         if index_of_pdf_comment > 0:
-            # determine end of file
-            end_of_file = context.source.seek(0, os.SEEK_END)
-            context.source.seek(0)
-            # build byte array
-            bts = context.source.read(end_of_file)[index_of_pdf_comment:end_of_file]
-            # reset values in context
-            context.source = io.BytesIO(bts)
+            context.source = BufferSource(
+                context.source.getvalue(), offset=index_of_pdf_comment
+            )
             context.tokenizer.io_source = context.source
 
     def _check_header(self, context: TransformerContext) -> None:
@@ -1,5 +1,7 @@
+import copy
+import enum
 from decimal import Decimal
-from typing import Union, Optional
+from typing import Union, Optional, Callable, Any, Dict, Iterator
 
 
 def add_base_methods(cls):
@@ -9,19 +11,24 @@ def add_base_methods(cls):
     setting/getting a parent, getting the root in hierarchy,
     adding an EventListener,
     and notifying an object that an event has occurred.
+    Objects that have no room for a parent (e.g. Decimal, or interned Name objects, which are shared)
+    silently keep no link to their parent, nor any EventListener, only containers do.
     """
 
     def get_parent(self):
         """
         Get the parent object of this object
         """
-        return getattr(self, "_parent")
+        return getattr(self, "_parent", None)
 
     def set_parent(self, parent):
         """
         Set the parent object of this object
         """
-        setattr(self, "_parent", parent)
+        try:
+            setattr(self, "_parent", parent)
+        except AttributeError:
+            pass
         return self
 
     def get_root(self):
@@ -37,9 +44,15 @@ def add_base_methods(cls):
             tmp = getattr(tmp, "_parent")
         return tmp
 
+    def get_reference(self) -> Optional["Reference"]:
+        return getattr(self, "_reference", None)
+
     def set_reference(self, reference: "Reference"):
-        if not hasattr(self, "_reference"):
-            setattr(self, "_reference", reference)
+        if getattr(self, "_reference", None) is None:
+            try:
+                setattr(self, "_reference", reference)
+            except AttributeError:
+                pass
         return self
 
     def add_event_listener(self, event_listener):
@@ -47,18 +60,40 @@ def add_base_methods(cls):
         Add an EventListener to this object
         """
         if not hasattr(self, "_event_listeners"):
-            setattr(self, "_event_listeners", [])
+            try:
+                setattr(self, "_event_listeners", [])
+            except AttributeError:
+                return self
         getattr(self, "_event_listeners").append(event_listener)
         return self
 
+    def remove_event_listener(self, event_listener):
+        """
+        Remove an EventListener from this object
+        """
+        if event_listener in getattr(self, "_event_listeners", []):
+            getattr(self, "_event_listeners").remove(event_listener)
+        return self
+
+    def get_event_listeners(self):
+        """
+        Get the EventListeners registered to this object
+        """
+        return getattr(self, "_event_listeners", [])
+
+    def has_event_listener_for(self, event_type):
+        """
+        Return True if any of the EventListeners registered
+        to this object consumes Events of the given type
+        """
+        return any([l.consumes(event_type) for l in self.get_event_listeners()])
+
     def event_occurred(self, event):
         """
         Notify the EventListeners registered
         to this object that an Event has occurred
         """
-        if not hasattr(self, "_event_listeners"):
-            setattr(self, "_event_listeners", [])
-        for l in getattr(self, "_event_listeners"):
+        for l in getattr(self, "_event_listeners", []):
             l.event_occurred(event)
         return self
 
@@ -91,20 +126,25 @@ def add_base_methods(cls):
     setattr(cls, "get_root", get_root)
     # event listener methods
     setattr(cls, "add_event_listener", add_event_listener)
+    setattr(cls, "remove_event_listener", remove_event_listener)
+    setattr(cls, "get_event_listeners", get_event_listeners)
+    setattr(cls, "has_event_listener_for", has_event_listener_for)
     setattr(cls, "event_occurred", event_occurred)
     # pdf methods
+    setattr(cls, "get_reference", get_reference)
     setattr(cls, "set_reference", set_reference)
     # serialization methods
     setattr(cls, "to_json_serializable", to_json_serializable)
-    # initialize fields
-    setattr(cls, "_parent", None)
-    setattr(cls, "_event_listeners", [])
+    # initialize fields (unless they are slots)
+    slots = getattr(cls, "__slots__", ())
+    if "_parent" not in slots:
+        setattr(cls, "_parent", None)
     return cls
 
 
 @add_base_methods
 class Decimal(Decimal):
-    pass
+    __slots__ = ()
 
 
 @add_base_methods
@@ -151,13 +191,37 @@ class String(str):
 
 @add_base_methods
 class Name(str):
+    """
+    A PDF name object.
+    Name objects are interned, every Name with a given value is (normally) the same instance.
+    At most MAXIMUM_NUMBER_OF_INTERNED_NAMES values are interned, any others are new instances.
+    """
+
+    __slots__ = ()
+
+    MAXIMUM_NUMBER_OF_INTERNED_NAMES: int = 1 << 16
+    _interned_names: Dict[str, "Name"] = {}
+
     def __new__(cls, value):
-        return str.__new__(cls, value)
+        n = Name._interned_names.get(value)
+        if n is not None and type(n) is cls:
+            return n
+        n = str.__new__(cls, value)
+        if len(Name._interned_names) < Name.MAXIMUM_NUMBER_OF_INTERNED_NAMES:
+            Name._interned_names[str(value)] = n
+        return n
 
 
 class CanvasOperatorName(str):
+    """
+    A PDF (content stream) operator.
+    CanvasOperatorName objects are interned, every CanvasOperatorName with a given (valid) name is the same instance.
+    """
+
+    __slots__ = ()
+
     # fmt: off
-    VALID_NAMES = [
+    VALID_NAMES = {
         "b", "B", "b*", "B*", "BDC", "BI", "BMC", "BT", "BX",
         "c", "cm", "cs", "CS",
         "d", "d0", "d1", "Do", "DP",
@@ -180,11 +244,19 @@ class CanvasOperatorName(str):
         "y",
         "''",
         '"',
-    ]
+    }
     # fmt: on
 
+    _interned_names: Dict[str, "CanvasOperatorName"] = {}
+
     def __new__(cls, value):
-        return str.__new__(cls, value)  # type: ignore [call-arg]
+        n = CanvasOperatorName._interned_names.get(value)
+        if n is not None and type(n) is cls:
+            return n
+        n = str.__new__(cls, value)  # type: ignore [call-arg]
+        if value in CanvasOperatorName.VALID_NAMES:
+            CanvasOperatorName._interned_names[str(value)] = n
+        return n
 
 
 @add_base_methods
@@ -206,17 +278,260 @@ class HexadecimalString(String):
 
 @add_base_methods
 class List(list):
-    pass
+    """
+    A PDF array object.
+    Any ReferenceProxy held by this List is resolved (and replaced) when it is first accessed.
+    """
+
+    def _resolve(self, index: int) -> Any:
+        value = list.__getitem__(self, index)
+        if isinstance(value, ReferenceProxy):
+            value = value.resolve()
+            list.__setitem__(self, index, value)
+        return value
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._resolve(i) for i in range(*index.indices(len(self)))]
+        return self._resolve(index)
+
+    def __iter__(self):
+        for i in range(0, len(self)):
+            yield self._resolve(i)
+
+    def pop(self, index: int = -1) -> Any:
+        value = self._resolve(index)
+        list.pop(self, index)
+        return value
 
 
 @add_base_methods
 class Dictionary(dict):
-    pass
+    """
+    A PDF dictionary object.
+    Any ReferenceProxy held by this Dictionary is resolved (and replaced) when it is first accessed.
+    A ReferenceProxy that resolves to None is removed.
+    """
+
+    def __getitem__(self, key):
+        value = dict.__getitem__(self, key)
+        if isinstance(value, ReferenceProxy):
+            value = value.resolve()
+            if value is None:
+                dict.__delitem__(self, key)
+                raise KeyError(key)
+            dict.__setitem__(self, key, value)
+        return value
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def items(self):
+        return [(k, self[k]) for k in list(self.keys()) if k in self]
+
+    def values(self):
+        return [v for k, v in self.items()]
+
+    def pop(self, key, *args):
+        try:
+            value = self[key]
+        except KeyError:
+            if len(args) > 0:
+                return args[0]
+            raise
+        dict.__delitem__(self, key)
+        return value
+
+
+class StreamDecodePolicy(enum.Enum):
+    """
+    A StreamDecodePolicy determines which bytes a (lazily decoded) Stream keeps, once its DecodedBytes have been accessed:
+    KEEP_BOTH keeps its (raw) Bytes and its DecodedBytes,
+    KEEP_RAW_BYTES keeps its Bytes, and decodes them again whenever its DecodedBytes are accessed,
+    KEEP_DECODED_BYTES keeps its DecodedBytes, and removes its Bytes,
+    KEEP_NEITHER removes its Bytes, and reads (see Stream.set_raw_bytes_reader) and decodes them again
+    whenever its DecodedBytes are accessed. A Stream that can not read its Bytes again keeps them (as KEEP_RAW_BYTES).
+    """
+
+    KEEP_BOTH = 0
+    KEEP_RAW_BYTES = 1
+    KEEP_DECODED_BYTES = 2
+    KEEP_NEITHER = 3
 
 
 @add_base_methods
 class Stream(Dictionary):
-    pass
+    """
+    A PDF stream object.
+    A Stream can be decoded lazily, its DecodedBytes are then only computed when they are first accessed
+    (and kept, or not, according to its StreamDecodePolicy).
+    """
+
+    _decoder: Optional[Callable[["Stream", Any], bytes]] = None
+    _chunked_decoder: Optional[Callable[["Stream", Any], Iterator[bytes]]] = None
+    _decode_policy: StreamDecodePolicy = StreamDecodePolicy.KEEP_BOTH
+    _raw_bytes: Any = None
+    _raw_bytes_reader: Optional[Callable[[], Any]] = None
+    _prefetched_bytes: Any = None
+
+    def set_decoder(
+        self,
+        decoder: Callable[["Stream", Any], bytes],
+        decode_policy: StreamDecodePolicy = StreamDecodePolicy.KEEP_BOTH,
+        chunked_decoder: Optional[Callable[["Stream", Any], Iterator[bytes]]] = None,
+    ) -> "Stream":
+        """
+        Set the function that decodes (the raw bytes of) this Stream when its DecodedBytes are first accessed,
+        and (optionally) the function that yields those DecodedBytes a chunk at a time (see iter_decoded_bytes)
+        """
+        self._decoder = decoder
+        self._chunked_decoder = chunked_decoder
+        self._decode_policy = decode_policy
+        self._raw_bytes = dict.get(self, "Bytes")
+        self._prefetched_bytes = None
+        return self
+
+    def set_raw_bytes_reader(self, raw_bytes_reader: Callable[[], Any]) -> "Stream":
+        """
+        Set the function that reads the (raw) Bytes of this Stream again (e.g. from the source it was read from),
+        this allows a Stream to drop its Bytes (see StreamDecodePolicy.KEEP_NEITHER)
+        """
+        self._raw_bytes_reader = raw_bytes_reader
+        return self
+
+    def _get_raw_bytes(self) -> Any:
+        if self._raw_bytes is None and self._raw_bytes_reader is not None:
+            return self._raw_bytes_reader()
+        return self._raw_bytes
+
+    def prefetch(self, executor: Any) -> "Stream":
+        """
+        Start decoding this Stream on the given (concurrent.futures) Executor,
+        its DecodedBytes are then taken from that decoding when they are first accessed.
+        This does nothing if this Stream is not decoded lazily, or if its decoding has already started.
+        """
+        if (
+            self._decoder is not None
+            and self._prefetched_bytes is None
+            and not dict.__contains__(self, "DecodedBytes")
+        ):
+            self._prefetched_bytes = executor.submit(
+                self._decoder, self, self._get_raw_bytes()
+            )
+        return self
+
+    def set_prefetched_bytes(self, prefetched_bytes: Any) -> "Stream":
+        """
+        Set the (concurrent.futures) Future that decodes this Stream (e.g. started before this Stream was read),
+        its DecodedBytes are then taken from that decoding when they are first accessed.
+        """
+        if self._decoder is not None and not dict.__contains__(self, "DecodedBytes"):
+            self._prefetched_bytes = prefetched_bytes
+        return self
+
+    def iter_decoded_bytes(self) -> Iterator[bytes]:
+        """
+        Yield the DecodedBytes of this Stream a chunk at a time, without keeping them in this Stream.
+        DecodedBytes that are already kept (or that are being prefetched) are yielded in one chunk.
+        """
+        if self._decoder is None or dict.__contains__(self, "DecodedBytes"):
+            yield self["DecodedBytes"]
+            return
+        if self._prefetched_bytes is not None:
+            prefetched_bytes = self._prefetched_bytes
+            self._prefetched_bytes = None
+            yield prefetched_bytes.result()
+            return
+        if self._chunked_decoder is None:
+            yield self._decode()
+            return
+        yield from self._chunked_decoder(self, self._get_raw_bytes())
+
+    def __getitem__(self, key):
+        if (
+            key == "DecodedBytes"
+            and self._decoder is not None
+            and not dict.__contains__(self, key)
+        ):
+            return self._decode()
+        return super(Stream, self).__getitem__(key)
+
+    def __contains__(self, key) -> bool:
+        if key == "DecodedBytes" and self._decoder is not None:
+            return True
+        return dict.__contains__(self, key)
+
+    def _decode(self) -> bytes:
+        assert self._decoder is not None
+        if self._prefetched_bytes is not None:
+            decoded_bytes = self._prefetched_bytes.result()
+            self._prefetched_bytes = None
+        else:
+            decoded_bytes = self._decoder(self, self._get_raw_bytes())
+        if self._decode_policy in [
+            StreamDecodePolicy.KEEP_BOTH,
+            StreamDecodePolicy.KEEP_DECODED_BYTES,
+        ]:
+            dict.__setitem__(self, "DecodedBytes", decoded_bytes)
+        if self._decode_policy in [
+            StreamDecodePolicy.KEEP_DECODED_BYTES,
+            StreamDecodePolicy.KEEP_NEITHER,
+        ]:
+            if dict.__contains__(self, "Bytes"):
+                dict.__delitem__(self, "Bytes")
+        if (
+            self._decode_policy == StreamDecodePolicy.KEEP_NEITHER
+            and self._raw_bytes_reader is not None
+        ):
+            self._raw_bytes = None
+        if self._decode_policy == StreamDecodePolicy.KEEP_DECODED_BYTES:
+            self._decoder = None
+            self._chunked_decoder = None
+            self._raw_bytes = None
+        return decoded_bytes
+
+    def _get_copyable_items_and_state(self):
+        # (zero-copy) views on a memory-mapped source are copied into bytes,
+        # a decoding that is still in progress is not copied (the copy decodes its own bytes),
+        # and neither is the parent (the copy is not part of the Document, like a copied Font),
+        # nor the function that reads its Bytes from the source (the copy keeps its own Bytes)
+        items = [
+            (k, bytes(v) if isinstance(v, memoryview) else v)
+            for k, v in dict.items(self)
+        ]
+        state = {
+            k: (bytes(v) if isinstance(v, memoryview) else v)
+            for k, v in self.__dict__.items()
+            if k not in ["_prefetched_bytes", "_parent", "_raw_bytes_reader"]
+        }
+        if self._decoder is not None:
+            raw_bytes = self._get_raw_bytes()
+            state["_raw_bytes"] = (
+                bytes(raw_bytes) if isinstance(raw_bytes, memoryview) else raw_bytes
+            )
+        return items, state
+
+    def __deepcopy__(self, memodict={}):
+        out = Stream()
+        memodict[id(self)] = out
+        items, state = self._get_copyable_items_and_state()
+        for k, v in items:
+            dict.__setitem__(out, k, copy.deepcopy(v, memodict))
+        for k, v in state.items():
+            out.__dict__[k] = copy.deepcopy(v, memodict)
+        return out
+
+    def __reduce_ex__(self, protocol):
+        # a pickled Stream is decoded (its decoder is bound to the Document it was read from)
+        items, state = self._get_copyable_items_and_state()
+        if self._decoder is not None and not dict.__contains__(self, "DecodedBytes"):
+            items.append(("DecodedBytes", self["DecodedBytes"]))
+        for k in ["_decoder", "_chunked_decoder", "_decode_policy", "_raw_bytes"]:
+            state.pop(k, None)
+        return Stream, (), state, None, iter(items)
 
 
 @add_base_methods
@@ -230,13 +545,26 @@ class Boolean:
 
 @add_base_methods
 class Reference:
+    __slots__ = (
+        "object_number",
+        "generation_number",
+        "parent_stream_object_number",
+        "index_in_parent_stream",
+        "byte_offset",
+        "is_in_use",
+        "document",
+        "_parent",
+        "_event_listeners",
+        "_reference",
+    )
+
     object_number: Optional[int]
     generation_number: Optional[int]
     parent_stream_object_number: Optional[int]
     index_in_parent_stream: Optional[int]
     byte_offset: Optional[int]
     is_in_use: bool
-    document: "Document"    # type: ignore [name-defined]
+    document: "Document"  # type: ignore [name-defined]
 
     def __init__(
         self,
@@ -257,6 +585,36 @@ class Reference:
         self.document = document
 
 
+class ReferenceProxy(Reference):
+    """
+    A ReferenceProxy stands in for the (transformed) object an indirect Reference points to.
+    It is resolved (and replaced by that object) when it is first accessed through its containing Dictionary or List.
+    """
+
+    __slots__ = ("_resolver",)
+
+    def __init__(self, reference: Reference, resolver: Callable[[], Any]):
+        super(ReferenceProxy, self).__init__(
+            object_number=reference.object_number,
+            generation_number=reference.generation_number,
+            parent_stream_object_number=reference.parent_stream_object_number,
+            index_in_parent_stream=reference.index_in_parent_stream,
+            byte_offset=reference.byte_offset,
+            is_in_use=reference.is_in_use,
+            document=reference.document,
+        )
+        self._resolver = resolver
+
+    def resolve(self) -> Any:
+        """
+        Resolve this ReferenceProxy, returning the (transformed) object it points to
+        """
+        return self._resolver()
+
+    def __deepcopy__(self, memodict={}):
+        return self
+
+
 AnyPDFType = Union[
     Boolean,
     CanvasOperatorName,
@@ -1,6 +1,6 @@
 import io
 import logging
-import os
+import typing
 
 from ptext.exception.pdf_exception import IllegalGraphicsStateError
 from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
@@ -8,8 +8,10 @@ from ptext.io.transform.types import (
     Dictionary,
     List,
     CanvasOperatorName,
+    AnyPDFType,
 )
 from ptext.pdf.canvas.canvas_graphics_state import CanvasGraphicsState
+from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
 from ptext.pdf.canvas.operator.color.set_cmyk_non_stroking import SetCMYKNonStroking
 from ptext.pdf.canvas.operator.color.set_cmyk_stroking import SetCMYKStroking
 from ptext.pdf.canvas.operator.color.set_color_non_stroking import (
@@ -76,10 +78,24 @@ logger = logging.getLogger(__name__)
 
 
 class Canvas(Dictionary):
-    def __init__(self):
+    """
+    A Canvas processes the instructions of a content stream, keeping track of the graphics state,
+    and sending out events (e.g. TextRenderEvent, ImageRenderEvent) as it goes along.
+    If fast_math is set, numbers are read as floats and geometry is computed using FloatMatrix objects,
+    rather than (slower, but exact) Decimal objects and Matrix objects.
+    """
+
+    # CanvasOperator(s) registered with every Canvas
+    _registered_canvas_operators: typing.List[CanvasOperator] = []
+
+    # the number of bytes of content (at least) that are tokenized at a time
+    CONTENT_WINDOW_SIZE: int = 1 << 16
+
+    def __init__(self, fast_math: bool = False):
         super(Canvas, self).__init__()
+        self.fast_math = fast_math
         # initialize operators
-        self.canvas_operators = [
+        canvas_operators = [
             # color
             SetCMYKNonStroking(),
             SetCMYKStroking(),
@@ -122,38 +138,104 @@ class Canvas(Dictionary):
             # xobject
             Do(),
         ]
+        # operator registry (name -> operator, number of operands)
+        self.canvas_operators: typing.Dict[
+            str, typing.Tuple[CanvasOperator, typing.Optional[int]]
+        ] = {}
+        # names that are read as operators (the registered names, and those of the operators of this Canvas)
+        self.canvas_operator_names: typing.Set[str] = set(
+            CanvasOperatorName.VALID_NAMES
+        )
+        for operator in canvas_operators + Canvas._registered_canvas_operators:
+            self.add_canvas_operator(operator)
         # compatibility mode
         self.in_compatibility_section = False
         # set initial graphics state
-        self.graphics_state = CanvasGraphicsState()
+        self.graphics_state = CanvasGraphicsState(fast_math)
         # canvas tag hierarchy is (oddly enough) not considered to be part of the graphics state
         self.marked_content_stack = []
         # set graphics state stack
         self.graphics_state_stack = []
 
+    @staticmethod
+    def register_canvas_operator(canvas_operator: CanvasOperator) -> None:
+        """
+        This method registers a CanvasOperator with every Canvas that is created from here on.
+        A registered CanvasOperator replaces any CanvasOperator with the same name.
+        """
+        CanvasOperatorName.VALID_NAMES.add(canvas_operator.get_text())
+        Canvas._registered_canvas_operators.append(canvas_operator)
+
+    def add_canvas_operator(self, canvas_operator: CanvasOperator) -> "Canvas":
+        """
+        This method adds a CanvasOperator to this Canvas.
+        It replaces any CanvasOperator with the same name.
+        """
+        self.canvas_operator_names.add(canvas_operator.get_text())
+        # the number of operands is resolved once, unless it depends on the state of the Canvas
+        number_of_operands: typing.Optional[int] = None
+        if (
+            type(canvas_operator).get_number_of_operands
+            is CanvasOperator.get_number_of_operands
+        ):
+            number_of_operands = canvas_operator.get_number_of_operands()
+        self.canvas_operators[canvas_operator.get_text()] = (
+            canvas_operator,
+            number_of_operands,
+        )
+        return self
+
     def add_listener(self, event_listener: "EventListener") -> "Canvas":
         """
         This method adds a generic EventListener to this Canvas
         """
-        self.listeners.append(event_listener)
+        self.add_event_listener(event_listener)
         return self
 
-    def read(self, io_source: io.IOBase) -> "Canvas":
-
-        io_source.seek(0, os.SEEK_END)
-        length = io_source.tell()
-        io_source.seek(0)
+    def _read_objects(self, io_source: io.IOBase) -> typing.Iterator[AnyPDFType]:
+        # the content is tokenized a window at a time, rather than read (and held) in its entirety,
+        # an object that may continue beyond the end of a window is read again from the next (refilled) window
+        if io_source.seekable():
+            io_source.seek(0)
+        window = b""
+        at_end = False
+        while not at_end:
+            # the window (at least) doubles when a single object does not fit in it
+            chunk = io_source.read(max(Canvas.CONTENT_WINDOW_SIZE, len(window)))
+            at_end = len(chunk) == 0
+            window += chunk
+            canvas_tokenizer = HighLevelTokenizer(
+                io.BytesIO(window),
+                read_numbers_as_floats=self.fast_math,
+                canvas_operator_names=self.canvas_operator_names,
+            )
+            while canvas_tokenizer.tell() != len(window):
+                start = canvas_tokenizer.tell()
+                if at_end:
+                    obj = canvas_tokenizer.read_object()
+                    if obj is None:
+                        return
+                    yield obj
+                    continue
+                try:
+                    obj = canvas_tokenizer.read_object()
+                except Exception:
+                    obj = None
+                    canvas_tokenizer.seek(len(window))
+                if canvas_tokenizer.tell() == len(window):
+                    window = window[start:]
+                    break
+                if obj is None:
+                    return
+                yield obj
+            else:
+                window = b""
 
-        canvas_tokenizer = HighLevelTokenizer(io_source)
+    def read(self, io_source: io.IOBase) -> "Canvas":
 
         # process content
         operand_stk = []
-        while canvas_tokenizer.tell() != length:
-
-            # attempt to read object
-            obj = canvas_tokenizer.read_object()
-            if obj is None:
-                break
+        for obj in self._read_objects(io_source):
 
             # push argument onto stack
             if not isinstance(obj, CanvasOperatorName):
@@ -161,12 +243,11 @@ class Canvas(Dictionary):
                 continue
 
             # process operator
-            candidate_ops = [
-                x for x in self.canvas_operators if x.get_text() == str(obj)
-            ]
-            if len(candidate_ops) == 1:
-                operator = candidate_ops[0]
-                if len(operand_stk) < operator.get_number_of_operands():
+            operator, number_of_operands = self.canvas_operators.get(obj, (None, 0))
+            if operator is not None:
+                if number_of_operands is None:
+                    number_of_operands = operator.get_number_of_operands()
+                if len(operand_stk) < number_of_operands:
                     # if we are in a compatibility section ignore any possible mistake
                     if self.in_compatibility_section:
                         continue
@@ -174,13 +255,14 @@ class Canvas(Dictionary):
                         message="Unable to execute operator %s. Expected %d arguments, received %d."
                         % (
                             operator.text,
-                            operator.get_number_of_operands(),
+                            number_of_operands,
                             len(operand_stk),
                         )
                     )
                 operands = []
-                for _ in range(0, operator.get_number_of_operands()):
-                    operands.insert(0, operand_stk.pop(-1))
+                if number_of_operands > 0:
+                    operands = operand_stk[-number_of_operands:]
+                    del operand_stk[-number_of_operands:]
 
                 # append
                 if "Instructions" not in self:
@@ -199,14 +281,15 @@ class Canvas(Dictionary):
                 self["Instructions"].append(instruction_dictionary)
 
                 # debug
-                logger.debug(
-                    "%d %s %s"
-                    % (
-                        instruction_number,
-                        operator.text,
-                        str([str(x) for x in operands]),
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "%d %s %s"
+                        % (
+                            instruction_number,
+                            operator.text,
+                            str([str(x) for x in operands]),
+                        )
                     )
-                )
 
                 # invoke
                 try:
@@ -216,7 +299,7 @@ class Canvas(Dictionary):
                         raise e
 
             # unknown operator
-            if len(candidate_ops) == 0:
+            if operator is None:
                 # print("Missing OPERATOR %s" % obj)
                 pass
 
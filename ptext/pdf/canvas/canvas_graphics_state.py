@@ -2,7 +2,7 @@ import copy
 from decimal import Decimal
 
 from ptext.pdf.canvas.color.color import RGBColor
-from ptext.pdf.canvas.geometry.matrix import Matrix
+from ptext.pdf.canvas.geometry.matrix import FloatMatrix, Matrix
 
 
 class CanvasGraphicsState:
@@ -20,28 +20,34 @@ class CanvasGraphicsState:
     appropriate to specify in page descriptions. The parameters listed in Table 53 control details of the rendering
     (scan conversion) process and are device-dependent; a page description that is intended to be device-
     independent should not be written to modify these parameters.
+
+    If fast_math is set, all numbers in the graphics state are floats (rather than Decimal objects),
+    and all matrices are FloatMatrix objects (rather than Matrix objects).
     """
 
-    def __init__(self):
-        self.ctm = Matrix.identity_matrix()
-        self.text_matrix = Matrix.identity_matrix()
-        self.text_line_matrix = Matrix.identity_matrix()
-        self.text_rise = Decimal(0)
-        self.character_spacing = Decimal(0)
-        self.word_spacing = Decimal(0)
-        self.horizontal_scaling = Decimal(100)
-        self.leading = Decimal(0)
+    def __init__(self, fast_math: bool = False):
+        self.fast_math = fast_math
+        number = float if fast_math else Decimal
+        matrix = FloatMatrix if fast_math else Matrix
+        self.ctm = matrix.identity_matrix()
+        self.text_matrix = matrix.identity_matrix()
+        self.text_line_matrix = matrix.identity_matrix()
+        self.text_rise = number(0)
+        self.character_spacing = number(0)
+        self.word_spacing = number(0)
+        self.horizontal_scaling = number(100)
+        self.leading = number(0)
         self.font = None
         self.font_size = None
         self.clipping_path = None
         self.non_stroke_color_space = None
-        self.non_stroke_color = RGBColor(Decimal(0), Decimal(0), Decimal(0))
+        self.non_stroke_color = RGBColor(number(0), number(0), number(0))
         self.stroke_color_space = None
-        self.stroke_color = RGBColor(Decimal(0), Decimal(0), Decimal(0))
-        self.line_width = Decimal(1)
+        self.stroke_color = RGBColor(number(0), number(0), number(0))
+        self.line_width = number(1)
         self.line_cap = None
         self.line_join = None
-        self.miter_limit = Decimal(10)
+        self.miter_limit = number(10)
         self.dash_pattern = None
         self.rendering_intent = None
         self.stroke_adjustment = None
@@ -50,8 +56,19 @@ class CanvasGraphicsState:
         self.alpha_constant = None
         self.alpha_source = None
 
+    def __copy__(self):
+        """
+        This function returns a shallow copy of this CanvasGraphicsState.
+        Fonts, colors and matrices are shared with the copy, rather than copied.
+        Operators never change them in place, but replace them (copy-on-write),
+        so a saved CanvasGraphicsState does not see any later changes.
+        """
+        out = CanvasGraphicsState.__new__(CanvasGraphicsState)
+        out.__dict__.update(self.__dict__)
+        return out
+
     def __deepcopy__(self, memodict={}):
-        out = CanvasGraphicsState()
+        out = CanvasGraphicsState(self.fast_math)
         out.ctm = copy.deepcopy(self.ctm)
         out.text_matrix = copy.deepcopy(self.text_matrix)
         out.text_line_matrix = copy.deepcopy(self.text_line_matrix)
@@ -60,7 +77,7 @@ class CanvasGraphicsState:
         out.word_spacing = self.word_spacing
         out.horizontal_scaling = self.horizontal_scaling
         out.leading = self.leading
-        out.font = copy.deepcopy(self.font)
+        out.font = self.font
         out.font_size = self.font_size
         # out.clipping_path = None
         # out.non_stroke_color_space = None
@@ -67,10 +67,9 @@ class CMYKColor(Color):
         self.key = k
 
     def to_rgb(self) -> "Color":
-        ONE = Decimal(1)
-        r = (ONE - self.cyan) * (ONE - self.key)
-        g = (ONE - self.magenta) * (ONE - self.key)
-        b = (ONE - self.yellow) * (ONE - self.key)
+        r = (1 - self.cyan) * (1 - self.key)
+        g = (1 - self.magenta) * (1 - self.key)
+        b = (1 - self.yellow) * (1 - self.key)
         return RGBColor(r, g, b)
 
     def __deepcopy__(self, memodict={}):
@@ -4,10 +4,16 @@ from ptext.pdf.canvas.event.event_listener import Event
 class BeginPageEvent(Event):
     """
     This implementation of Event is triggered right before the Canvas is being processed.
+    It carries the (0-based) page number of the Page, since (lazily loaded) pages are not necessarily
+    processed in the order in which they appear in the Document.
     """
 
-    def __init__(self, page: "Page"):
+    def __init__(self, page: "Page", page_number: int = 0):
         self.page = page
+        self.page_number = page_number
 
     def get_page(self) -> "Page":
         return self.page
+
+    def get_page_number(self) -> int:
+        return self.page_number
@@ -5,10 +5,15 @@ from ptext.pdf.page.page import Page
 class EndPageEvent(Event):
     """
     This implementation of Event is triggered right after the Canvas has been processed.
+    It carries the (0-based) page number of the Page, like BeginPageEvent.
     """
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, page_number: int = 0):
         self.page = page
+        self.page_number = page_number
 
     def get_page(self) -> Page:
         return self.page
+
+    def get_page_number(self) -> int:
+        return self.page_number
@@ -1,3 +1,6 @@
+import typing
+
+
 class Event:
     pass
 
@@ -8,5 +11,37 @@ class EventListener:
     This listener is notified whenever the canvas processes an event/command.
     """
 
+    # EventListener(s) that implement merge set this to True (see merge)
+    can_be_merged: bool = False
+
     def event_occurred(self, event: Event) -> None:
         pass
+
+    def get_event_types(self) -> typing.List[typing.Type[Event]]:
+        """
+        This method returns the types of Event this EventListener consumes (their subclasses included).
+        Events that no EventListener consumes may not be built (e.g. TextRenderEvent, ImageRenderEvent),
+        nor may the objects they need (e.g. images) be read.
+        By default, an EventListener consumes every Event.
+        """
+        return [Event]
+
+    def consumes(self, event_type: typing.Type[Event]) -> bool:
+        """
+        This method returns True if this EventListener consumes Event(s) of the given type
+        """
+        return any([issubclass(event_type, t) for t in self.get_event_types()])
+
+    def merge(self, other: "EventListener", page_offset: int) -> "EventListener":
+        """
+        This method merges the results of another EventListener into this EventListener.
+        It is used when pages are processed in parallel. other started from a copy of this EventListener
+        (as it was before any page was processed), and processed the pages starting at page_offset.
+        Pages are numbered as in the Document (see BeginPageEvent.get_page_number), not relative to page_offset.
+        EventListener(s) are merged in page order.
+        Only EventListener(s) that implement this method (and set can_be_merged) can be used to process pages
+        in parallel, any other EventListener raises a TypeError.
+        """
+        raise TypeError(
+            "%s can not be used to process pages in parallel" % type(self).__name__
+        )
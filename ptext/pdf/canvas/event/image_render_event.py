@@ -22,8 +22,8 @@ class ImageRenderEvent(Event):
         self.width = max(abs(int(v[0])), 1)
         self.height = max(abs(int(v[1])), 1)
 
-        # scaled image
-        self.scaled_image = self.image.resize((self.width, self.height))
+        # scaled image (resized when it is first needed)
+        self.scaled_image = None
 
     def get_image(self) -> "PIL.Image":
         """
@@ -39,6 +39,8 @@ class ImageRenderEvent(Event):
         This Image has the same dimensions as how
         it is displayed in the PDF
         """
+        if self.scaled_image is None:
+            self.scaled_image = self.image.resize((self.width, self.height))
         return self.scaled_image
 
     def get_x(self) -> int:
@@ -66,12 +68,13 @@ class ImageRenderEvent(Event):
         return self.height
 
     def get_rgb(self, x: int, y: int) -> RGBColor:
-        c = self.scaled_image.getpixel((x, y))
-        if self.scaled_image.mode == "RGB":
+        scaled_image = self.get_scaled_image()
+        c = scaled_image.getpixel((x, y))
+        if scaled_image.mode == "RGB":
             return RGBColor(r=Decimal(c[0]), g=Decimal(c[1]), b=Decimal(c[2]))
-        if self.scaled_image.mode == "RGBA":
+        if scaled_image.mode == "RGBA":
             return RGBColor(r=Decimal(c[0]), g=Decimal(c[1]), b=Decimal(c[2]))
-        if self.scaled_image.mode == "CMYK":
+        if scaled_image.mode == "CMYK":
             r = int((1 - c[0]) * (1 - c[3]) / 255)
             g = int((1 - c[1]) * (1 - c[3]) / 255)
             b = int((1 - c[2]) * (1 - c[0]) / 255)
@@ -1,25 +1,38 @@
 from decimal import Decimal
+from typing import Optional
 
 from ptext.io.transform.types import String
 from ptext.pdf.canvas.event.event_listener import Event
+from ptext.pdf.canvas.font.glyph_line import GlyphLine
+from ptext.pdf.canvas.font.glyph_table import GlyphRun
 from ptext.pdf.canvas.geometry.line_segment import LineSegment
 
+# marks a derived property (that may be None) as not calculated (yet)
+_NOT_CALCULATED = object()
+
 
 class TextRenderEvent(Event):
     """
-    This implementation of Event is triggered right after the Canvas has processed a text-rendering instruction
+    This implementation of Event is triggered right after the Canvas has processed a text-rendering instruction.
+    If the graphics state uses fast math, all numbers (font ascent, font size, baseline, ..) are floats.
+    The event keeps the (relevant) parts of the graphics state,
+    everything that is derived from them (glyphs, baseline, ..) is calculated when it is first needed.
+    The glyphs are looked up as a (shared) GlyphRun, of which only the font size, spacing and scaling
+    are applied to this event.
     """
 
     def __init__(self, graphics_state: "CanvasGraphicsState", raw_bytes: String):
         self.raw_bytes = raw_bytes
-        self.glyph_line = graphics_state.font.build_glyph_line(raw_bytes)
-        self.text_to_user_space_transform_matrix = graphics_state.text_matrix.mul(
-            graphics_state.ctm
-        )
 
-        # store font family
-        self.font_family = graphics_state.font.get_font_name()
-        self.font_ascent = graphics_state.font.get_ascent()
+        # graphics state
+        # (the matrices, and color, of a graphics state are replaced, rather than changed, by operators)
+        self._font = graphics_state.font
+        self._text_matrix = graphics_state.text_matrix
+        self._ctm = graphics_state.ctm
+        self._word_spacing = graphics_state.word_spacing
+        self._horizontal_scaling = graphics_state.horizontal_scaling
+        self._text_rise = graphics_state.text_rise
+        self._fast_math = graphics_state.fast_math
 
         # store font size
         self.font_size = graphics_state.font_size
@@ -30,17 +43,70 @@ class TextRenderEvent(Event):
         # store char spacing
         self.character_spacing = graphics_state.character_spacing
 
-        # store space character width
-        self.space_character_width = (
-            graphics_state.font.get_space_character_width_estimate()
-            * Decimal(0.001)
-            * graphics_state.font_size
-            * graphics_state.horizontal_scaling
-            * Decimal(0.01)
-        )
-
-        # calculate baseline
-        self.baseline = self._get_baseline(graphics_state)
+        # derived properties
+        self._glyph_run = None
+        self._text_to_user_space_transform_matrix = None
+        self._font_family = _NOT_CALCULATED
+        self._font_ascent = _NOT_CALCULATED
+        self._space_character_width = None
+        self._baseline = None
+
+    @property
+    def glyph_run(self) -> GlyphRun:
+        if self._glyph_run is None:
+            self._glyph_run = self._font.build_glyph_run(self.raw_bytes)
+        return self._glyph_run
+
+    @property
+    def glyph_line(self) -> GlyphLine:
+        return self.glyph_run.glyph_line
+
+    @property
+    def text_to_user_space_transform_matrix(self) -> "Matrix":
+        if self._text_to_user_space_transform_matrix is None:
+            self._text_to_user_space_transform_matrix = self._text_matrix.mul(self._ctm)
+        return self._text_to_user_space_transform_matrix
+
+    @property
+    def font_family(self) -> Optional[str]:
+        if self._font_family is _NOT_CALCULATED:
+            self._font_family = self._font.get_font_name()
+        return self._font_family
+
+    @property
+    def font_ascent(self) -> Optional[Decimal]:
+        if self._font_ascent is _NOT_CALCULATED:
+            self._font_ascent = self._font.get_ascent()
+            if self._fast_math and self._font_ascent is not None:
+                self._font_ascent = float(self._font_ascent)
+        return self._font_ascent
+
+    @property
+    def space_character_width(self) -> Decimal:
+        if self._space_character_width is None:
+            if self._fast_math:
+                self._space_character_width = (
+                    float(self._font.get_space_character_width_estimate())
+                    * 0.001
+                    * self.font_size
+                    * self._horizontal_scaling
+                    * 0.01
+                )
+            else:
+                self._space_character_width = (
+                    self._font.get_space_character_width_estimate()
+                    * Decimal(0.001)
+                    * self.font_size
+                    * self._horizontal_scaling
+                    * Decimal(0.01)
+                )
+        return self._space_character_width
+
+    @property
+    def baseline(self) -> LineSegment:
+        if self._baseline is None:
+            self._baseline = self._get_baseline()
+        return self._baseline
 
     def get_font_ascent(self) -> Decimal:
         return self.font_ascent
@@ -57,14 +123,14 @@ class TextRenderEvent(Event):
     def get_text(self) -> str:
         return self.glyph_line.get_text()
 
-    def _get_baseline(self, graphics_state: "CanvasGraphicsState") -> LineSegment:
+    def _get_baseline(self) -> LineSegment:
         # build and transform line segment
+        zero = 0.0 if self._fast_math else Decimal(0)
         return LineSegment(
-            Decimal(0),
-            graphics_state.text_rise,
-            self._get_pdf_string_width_in_text_space(self.raw_bytes, graphics_state)
-            or Decimal(0),
-            graphics_state.text_rise,
+            zero,
+            self._text_rise,
+            self._get_pdf_string_width_in_text_space() or zero,
+            self._text_rise,
         ).transform_by(self.text_to_user_space_transform_matrix)
 
     def get_baseline(self):
@@ -73,37 +139,50 @@ class TextRenderEvent(Event):
     def get_space_character_width_in_text_space(self):
         return self.space_character_width
 
-    def _get_pdf_string_width_in_text_space(
-        self, text: String, graphics_state: "CanvasGraphicsState"
-    ) -> Decimal:
+    def _get_pdf_string_width_in_text_space(self) -> Decimal:
         """
         Get the width of a String in text space units
         """
+        if self._fast_math:
+            return self._get_pdf_string_width_in_text_space_using_floats()
         total_width = Decimal(0)
         for g in self.glyph_line:
             character_width = (
-                Decimal(g.width) * Decimal(graphics_state.font_size) * Decimal(0.001)
+                Decimal(g.width) * Decimal(self.font_size) * Decimal(0.001)
             )
 
             # add word spacing where applicable
             if g.unicode == " ":
-                character_width += Decimal(graphics_state.word_spacing)
+                character_width += Decimal(self._word_spacing)
 
             # horizontal scaling
-            character_width *= Decimal(graphics_state.horizontal_scaling / 100)
+            character_width *= Decimal(self._horizontal_scaling / 100)
 
             # add character spacing to character_width
-            character_width += graphics_state.character_spacing
+            character_width += self.character_spacing
 
             # add character width to total
             total_width += character_width
 
         # subtract character spacing once (there are only N-1 spacings in a string of N characters)
-        total_width -= Decimal(graphics_state.character_spacing)
+        total_width -= Decimal(self.character_spacing)
 
         # return
         return total_width
 
+    def _get_pdf_string_width_in_text_space_using_floats(self) -> float:
+        """
+        Get the width of a String in text space units (using fast math)
+        """
+        glyph_run = self.glyph_run
+        number_of_glyphs = len(glyph_run.glyph_line)
+        return (
+            float(glyph_run.width) * self.font_size * 0.001
+            + glyph_run.number_of_spaces * self._word_spacing
+        ) * (self._horizontal_scaling / 100) + self.character_spacing * (
+            number_of_glyphs - 1
+        )
+
 
 class LeftToRightComparator:
     @staticmethod
@@ -3,8 +3,9 @@ import os
 import pathlib
 import re
 import typing
+from collections import OrderedDict
 from decimal import Decimal
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from ptext.io.transform.types import (
     List,
@@ -19,43 +20,94 @@ class AdobeFontMetrics:
     contains the master design of a specific font, which defines the way each character of the font looks.
     """
 
-    _font_cache = {}
+    # canonical name -> afm file name, built when it is first needed
+    _font_file_index: Optional[Dict[str, str]] = None
+
+    # afm file name -> Font
+    _font_cache: Dict[str, Optional[Font]] = {}
+
+    # canonical (requested) name -> Font, including names that are not one of the afm files
+    # the names that were looked up most recently are kept (in least recently used order)
+    FONTS_BY_NAME_CACHE_SIZE = 1024
+    _fonts_by_name: "OrderedDict[str, Optional[Font]]" = OrderedDict()
+
+    # name (exactly as it was requested) -> Font, checked before the name is canonicalized
+    # this cache is cleared whenever it holds more than FONTS_BY_NAME_CACHE_SIZE names
+    _fonts_by_raw_name: Dict[str, Optional[Font]] = {}
+
+    @staticmethod
+    def _get_canonical_name(name: str) -> str:
+        return re.sub("[^A-Z]+", "", name.upper())
+
+    @staticmethod
+    def _get_font_file_index() -> Dict[str, str]:
+        """
+        Get the index (canonical name -> file name) of all available afm files
+        """
+        if AdobeFontMetrics._font_file_index is None:
+            parent_dir = pathlib.Path(__file__).parent
+            AdobeFontMetrics._font_file_index = {
+                AdobeFontMetrics._get_canonical_name(x[:-4]): x
+                for x in os.listdir(parent_dir)
+                if x.endswith(".afm")
+            }
+        return AdobeFontMetrics._font_file_index
 
     @staticmethod
     def get(name: str) -> Optional[Font]:
         """
         Get the Font (only the metrics will be filled in) with a given name
         """
-        # standardize names
-        canonical_name = re.sub("[^A-Z]+", "", name.upper())
-
-        # find all available afm files
-        parent_dir = pathlib.Path(__file__).parent
-        available_font_metrics = [
-            (re.sub("[^A-Z]+", "", x.upper()[:-4]), x)
-            for x in os.listdir(parent_dir)
-            if x.endswith(".afm")
-        ]
+        # lookup by name
+        # (fonts are looked up for every glyph they show, by the same name)
+        if name in AdobeFontMetrics._fonts_by_raw_name:
+            return AdobeFontMetrics._fonts_by_raw_name[name]
+        font = AdobeFontMetrics._get_by_canonical_name(
+            AdobeFontMetrics._get_canonical_name(name)
+        )
+        if (
+            len(AdobeFontMetrics._fonts_by_raw_name)
+            >= AdobeFontMetrics.FONTS_BY_NAME_CACHE_SIZE
+        ):
+            AdobeFontMetrics._fonts_by_raw_name.clear()
+        AdobeFontMetrics._fonts_by_raw_name[name] = font
+        return font
+
+    @staticmethod
+    def _get_by_canonical_name(canonical_name: str) -> Optional[Font]:
+        # lookup by canonical name
+        if canonical_name in AdobeFontMetrics._fonts_by_name:
+            AdobeFontMetrics._fonts_by_name.move_to_end(canonical_name)
+            return AdobeFontMetrics._fonts_by_name[canonical_name]
 
         # check whether given name is present
-        afm_file_name = [x for x in available_font_metrics if x[0] == canonical_name]
-        afm_file_name = None if len(afm_file_name) == 0 else afm_file_name[0][1]
+        afm_file_name = AdobeFontMetrics._get_font_file_index().get(canonical_name)
         if afm_file_name is None:
+            AdobeFontMetrics._set_font_by_name(canonical_name, None)
             return None
 
         # read file
         if afm_file_name not in AdobeFontMetrics._font_cache:
+            parent_dir = pathlib.Path(__file__).parent
             with open(parent_dir / afm_file_name, "r") as afm_file_handle:
-                AdobeFontMetrics._font_cache[
-                    afm_file_name
-                ] = AdobeFontMetrics._read_file(afm_file_handle)
+                AdobeFontMetrics._font_cache[afm_file_name] = (
+                    AdobeFontMetrics._read_file(afm_file_handle)
+                )
 
         # read cache
-        if afm_file_name in AdobeFontMetrics._font_cache:
-            return AdobeFontMetrics._font_cache[afm_file_name]
+        return AdobeFontMetrics._set_font_by_name(
+            canonical_name, AdobeFontMetrics._font_cache[afm_file_name]
+        )
 
-        # default
-        return None
+    @staticmethod
+    def _set_font_by_name(canonical_name: str, font: Optional[Font]) -> Optional[Font]:
+        AdobeFontMetrics._fonts_by_name[canonical_name] = font
+        if (
+            len(AdobeFontMetrics._fonts_by_name)
+            > AdobeFontMetrics.FONTS_BY_NAME_CACHE_SIZE
+        ):
+            AdobeFontMetrics._fonts_by_name.popitem(last=False)
+        return font
 
     @staticmethod
     def _read_file(input: io.IOBase) -> Optional[Font]:
@@ -1,8 +1,9 @@
 import copy
 from decimal import Decimal
-from typing import Optional
+from typing import Dict, Optional
 
 from ptext.pdf.canvas.font.font import Font
+from ptext.pdf.canvas.font.glyph_table import GlyphTable
 
 
 class CIDFontType0(Font):
@@ -17,8 +18,18 @@ class CIDFontType0(Font):
     used in other environments.
 
     A Type 0 CIDFont contains glyph descriptions based on CFF
+
+    The widths of a CIDFont (W, and DW) are indexed by CID. A character code is mapped to its CID
+    by the Encoding of the parent (Type 0) font. Identity-H and Identity-V map every code to the same CID.
+    The other predefined CMaps map codes to the CIDs of an Adobe character collection, which is not available,
+    so their glyphs get the default width (DW), and the positions of their text are approximate.
+    A CID that is not in W gets the default width (DW) as well.
     """
 
+    def __init__(self):
+        super(CIDFontType0, self).__init__()
+        self._cached_widths: Optional[Dict[int, Decimal]] = None
+
     def get_average_character_width(self) -> Optional[Decimal]:
         return Decimal(0)
 
@@ -35,7 +46,71 @@ class CIDFontType0(Font):
         return Decimal(0)
 
     def get_single_character_width(self, character_code: int) -> Optional[Decimal]:
-        return Decimal(0)
+        # DW defaults to 1000 (see Table 117, "Entries in a CIDFont dictionary")
+        default_width = Decimal(self["DW"]) if "DW" in self else Decimal(1000)
+        cid = self._get_cid(character_code)
+        if cid is None:
+            return default_width
+        return self._get_widths().get(cid, default_width)
+
+    def _get_cid(self, character_code: int) -> Optional[int]:
+        """
+        This function maps a character code to a CID, using the Encoding of the parent (Type 0) font.
+        It returns None if the CID is not known.
+        """
+        parent = self.get_parent()
+        while parent is not None and not isinstance(parent, Font):
+            parent = parent.get_parent()
+        if parent is None or "Encoding" not in parent:
+            return character_code
+        encoding = parent["Encoding"]
+        if isinstance(encoding, str) and encoding.upper() in [
+            "IDENTITY-H",
+            "IDENTITY-V",
+        ]:
+            return character_code
+        return None
+
+    def _get_widths(self) -> Dict[int, Decimal]:
+        """
+        This function reads the W array (once) into a dictionary, mapping every CID to its width.
+        The W array holds entries c [w1 w2 .. wn] (consecutive CIDs, starting at c),
+        and entries c_first c_last w (every CID in the range has the same width)
+        """
+        if self._cached_widths is not None:
+            return self._cached_widths
+        self._cached_widths = {}
+        w = self.get("W", [])
+        i = 0
+        while i + 1 < len(w):
+            c_first = int(w[i])
+            if isinstance(w[i + 1], list):
+                for j in range(0, len(w[i + 1])):
+                    self._cached_widths[c_first + j] = Decimal(w[i + 1][j])
+                i += 2
+                continue
+            if i + 2 >= len(w):
+                break
+            for c in range(c_first, int(w[i + 1]) + 1):
+                self._cached_widths[c] = Decimal(w[i + 2])
+            i += 3
+        return self._cached_widths
+
+    def _build_glyph_table(self) -> GlyphTable:
+
+        # init Encoding
+        if self._font_encoding is None:
+            self._init_font_encoding()
+        if self._font_encoding is None:
+            self._font_encoding = self._parent._font_encoding
+
+        # init ToUnicode
+        if self._to_unicode_map is None:
+            self._init_to_unicode_map()
+        if self._to_unicode_map is None:
+            self._to_unicode_map = self._parent._to_unicode_map
+
+        return super()._build_glyph_table()
 
     def __deepcopy__(self, memodict={}):
         copy_out = CIDFontType0()
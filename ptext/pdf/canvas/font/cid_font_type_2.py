@@ -1,8 +1,7 @@
 import copy
-from decimal import Decimal
-from typing import Optional
 
-from ptext.pdf.canvas.font.glyph_line import GlyphLine
+from ptext.pdf.canvas.font.cid_font_type_0 import CIDFontType0
+from ptext.pdf.canvas.font.glyph_table import GlyphTable
 from ptext.pdf.canvas.font.true_type_font import TrueTypeFont
 
 
@@ -18,41 +17,19 @@ class CIDFontType2(TrueTypeFont):
     used in other environments.
 
     A Type 2 CIDFont contains glyph descriptions based on the TrueType font format
+
+    Its widths are indexed by CID, like those of a Type 0 CIDFont (see CIDFontType0).
     """
 
     def __init__(self):
         super(CIDFontType2, self).__init__()
         self._cached_widths = None
 
-    def get_single_character_width(self, character_code: int) -> Optional[Decimal]:
-        if "W" not in self:
-            if "DW" not in self:
-                self["DW"] = Decimal(1000)
-            return self["DW"]
-        if self._cached_widths is None:
-            i = 0
-            self._cached_widths = {}
-            while i < len(self["W"]):
-                c_first = int(self["W"][i])
-                if isinstance(self["W"][i + 1], list):
-                    for j in range(0, len(self["W"][i + 1])):
-                        self._cached_widths[c_first + j] = self["W"][i + 1][j]
-                    i += 2
-                    continue
-                if isinstance(self["W"][i + 1], Decimal):
-                    c_last = int(self["W"][i + 1])
-                    w = int(self["W"][i + 2])
-                    for j in range(c_first, c_last + 1):
-                        self._cached_widths[j] = w
-                    i += 3
-                    continue
-        # use cache
-        if character_code in self._cached_widths:
-            return self._cached_widths[character_code]
-        # default
-        return None
+    get_single_character_width = CIDFontType0.get_single_character_width
+    _get_cid = CIDFontType0._get_cid
+    _get_widths = CIDFontType0._get_widths
 
-    def build_glyph_line(self, content) -> GlyphLine:
+    def _build_glyph_table(self) -> GlyphTable:
 
         # init Encoding
         if self._font_encoding is None:
@@ -66,7 +43,7 @@ class CIDFontType2(TrueTypeFont):
         if self._to_unicode_map is None:
             self._to_unicode_map = self._parent._to_unicode_map
 
-        return super().build_glyph_line(content)
+        return super()._build_glyph_table()
 
     def __deepcopy__(self, memodict={}):
         copy_out = CIDFontType2()
@@ -1,8 +1,23 @@
-import io
-from typing import Union, List, Optional, Tuple
+import bisect
+import hashlib
+import re
+import typing
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 
-from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
-from ptext.io.transform.types import HexadecimalString
+# the operators (and operands) of a ToUnicode CMap that are read
+_CMAP_SECTION_PATTERN = re.compile(
+    r"\b(begincodespacerange|beginbfchar|beginbfrange)\b(.*?)\b(endcodespacerange|endbfchar|endbfrange)\b",
+    re.DOTALL,
+)
+_CMAP_COMMENT_PATTERN = re.compile(r"%[^\r\n]*")
+_HEXADECIMAL_STRING_PATTERN = re.compile(r"<([0-9A-Fa-f\s]*)>")
+_BFCHAR_PATTERN = re.compile(r"<([0-9A-Fa-f\s]*)>\s*<([0-9A-Fa-f\s]*)>")
+_BFRANGE_PATTERN = re.compile(
+    r"<([0-9A-Fa-f\s]*)>\s*<([0-9A-Fa-f\s]*)>\s*(?:<([0-9A-Fa-f\s]*)>|\[([^\]]*)\])"
+)
+_WHITESPACE_PATTERN = re.compile(r"\s+")
 
 
 class CMap:
@@ -13,99 +28,291 @@ class CMap:
     specific CIDFont; instead, it shall be combined with it as part of a CID-keyed font, represented in PDF as a
     Type 0 font dictionary (see 9.7.6, "Type 0 Font Dictionaries"). Within the CMap, the character mappings shall
     refer to the associated CIDFont by font number, which in PDF shall be 0.
+
+    The single character mappings (bfchar) of a CMap are kept in a dictionary,
+    its ranges (bfrange) are kept as sorted arrays, which are searched (rather than expanded).
+    Parsed CMaps are cached (by the digest of their content), identical CMaps are only parsed once,
+    and share their (read-only) entries, codespace ranges, character mappings and ranges.
+
+    Character codes may be 1 to 4 bytes long, a code is read as one number (whatever its length).
+    Unicode values are read as UTF-16BE, a value of more than one 16-bit unit is kept as a tuple.
     """
 
+    PARSED_CMAP_CACHE_SIZE = 64
+
+    # digest of content -> (entries, codespace ranges, character mappings, ranges), all read-only
+    _parsed_cmaps: "OrderedDict[bytes, tuple]" = OrderedDict()
+
     def __init__(self):
-        self._unicode_to_code = {}
-        self._code_to_unicode = {}
+        # every mapping, in the order in which the CMap defines it
+        # (character code, unicode) for a bfchar, (low, high, unicode or list of unicode) for a bfrange
+        self._entries: typing.Sequence[tuple] = ()
+        self._codespace_ranges: typing.Sequence[Tuple[int, int, int]] = ()
+
+        # character code -> unicode
+        self._code_to_unicode: Mapping[int, Union[int, Tuple[int, ...]]] = {}
+
+        # sorted, non-overlapping, ranges (low, high, unicode or list of unicode)
+        self._ranges: typing.Sequence[tuple] = ()
+        self._range_lows: List[int] = []
+
+        # unicode -> character code, built when it is first needed
+        self._unicode_to_code: Optional[dict] = None
+
+    def __getstate__(self):
+        # the (read-only) character mappings are pickled (and copied) as a dict
+        state = self.__dict__.copy()
+        state["_code_to_unicode"] = dict(self._code_to_unicode)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._code_to_unicode = MappingProxyType(self._code_to_unicode)
 
     def unicode_to_code(self, unicode: Union[int, List[int]]) -> Optional[int]:
         """
         Converts a unicode code point to a character code
         Returns None if this CMAP does not contain a mapping for the given unicode code point
         """
-        return self._unicode_to_code.get(unicode)
+        return self._get_unicode_to_code().get(unicode)
 
     def code_to_unicode(self, character_code: int) -> Optional[int]:
         """
         Converts a character code to a unicode code point
         Returns None if this CMAP does not contain a mapping for the given character code
         """
-        return self._code_to_unicode.get(character_code, None)
+        unicode = self._code_to_unicode.get(character_code)
+        if unicode is not None or len(self._ranges) == 0:
+            return unicode
+        i = bisect.bisect_right(self._range_lows, character_code) - 1
+        if i < 0:
+            return None
+        low, high, unicode = self._ranges[i]
+        if character_code > high:
+            return None
+        return CMap._get_unicode_in_range(unicode, character_code - low)
 
-    def _add_symbol(
-        self, character_code: int, unicode: Union[int, List[int]]
-    ) -> "CMap":
-        self._unicode_to_code[unicode] = character_code
-        self._code_to_unicode[character_code] = unicode
-        return self
+    def get_codespace_ranges(self) -> List[Tuple[int, int, int]]:
+        """
+        The codespace ranges of a CMap determine how many bytes make up a character code.
+        Each range is returned as a tuple (low, high, number_of_bytes).
+        Returns an empty list if this CMAP does not define any codespace ranges.
+        """
+        return list(self._codespace_ranges)
+
+    def get_character_code_ranges(self) -> List[Tuple[int, int]]:
+        """
+        Get the (low, high) character codes of every mapping of this CMap,
+        single character mappings are returned as a range of one character code
+        """
+        return [(c, c) for c in self._code_to_unicode.keys()] + [
+            (low, high) for low, high, _ in self._ranges
+        ]
 
     def can_encode_unicode(self, unicode: Union[int, List[int]]) -> bool:
         """
         Return True if this CMAP can encode the given unicode code point, False otherwise
         """
-        return unicode in self._unicode_to_code
+        return unicode in self._get_unicode_to_code()
 
     def can_encode_character_code(self, character_code: int) -> bool:
         """
         Return True if this CMAP can encode the given character code, False otherwise
         """
-        return character_code in self._code_to_unicode
+        return self.code_to_unicode(character_code) is not None
 
     def read(self, cmap_bytes: str) -> "CMap":
 
-        N = len(cmap_bytes)
-        tok = HighLevelTokenizer(io.BytesIO(cmap_bytes.encode("latin-1")))
+        # lookup in cache
+        digest = hashlib.sha1(cmap_bytes.encode("latin-1")).digest()
+        if len(self._entries) == 0 and len(self._codespace_ranges) == 0:
+            if digest in CMap._parsed_cmaps:
+                CMap._parsed_cmaps.move_to_end(digest)
+                (
+                    self._entries,
+                    self._codespace_ranges,
+                    self._code_to_unicode,
+                    self._ranges,
+                ) = CMap._parsed_cmaps[digest]
+                self._range_lows = [low for low, _, _ in self._ranges]
+                self._unicode_to_code = None
+                return self
 
-        prev_token = None
-        while tok.tell() < N:
+        # parse
+        entries = list(self._entries)
+        codespace_ranges = list(self._codespace_ranges)
+        cmap_bytes = _CMAP_COMMENT_PATTERN.sub("", cmap_bytes)
+        for section in _CMAP_SECTION_PATTERN.finditer(cmap_bytes):
+            operator = section.group(1)
+            operands = section.group(2)
 
-            token = tok.next_non_comment_token()
-            if token is None:
-                break
+            # begincodespacerange
+            if operator == "begincodespacerange":
+                hex_strings = [
+                    _WHITESPACE_PATTERN.sub("", x)
+                    for x in _HEXADECIMAL_STRING_PATTERN.findall(operands)
+                ]
+                for j in range(0, len(hex_strings) - 1, 2):
+                    low = hex_strings[j]
+                    high = hex_strings[j + 1]
+                    codespace_ranges.append(
+                        (int(low, 16), int(high, 16), len(low) // 2)
+                    )
+                continue
 
             # beginbfchar
-            if token.text == "beginbfchar":
-                n = int(prev_token.text)
-                for j in range(0, n):
-                    c = self._hex_string_to_int_or_tuple(tok.read_object())
-                    uc = self._hex_string_to_int_or_tuple(tok.read_object())
-                    self._add_symbol(c, uc)
+            if operator == "beginbfchar":
+                for c, uc in _BFCHAR_PATTERN.findall(operands):
+                    entries.append(
+                        (
+                            int(_WHITESPACE_PATTERN.sub("", c), 16),
+                            self._hex_string_to_int_or_tuple(uc),
+                        )
+                    )
                 continue
 
             # beginbfrange
-            if token.text == "beginbfrange":
-                n = int(prev_token.text)
-                for j in range(0, n):
+            if operator == "beginbfrange":
+                for c_start, c_end, uc, ucs in _BFRANGE_PATTERN.findall(operands):
+                    c_start = int(_WHITESPACE_PATTERN.sub("", c_start), 16)
+                    c_end = int(_WHITESPACE_PATTERN.sub("", c_end), 16)
+                    if c_end < c_start:
+                        continue
+                    if ucs != "" or uc == "":
+                        unicode = [
+                            self._hex_string_to_int_or_tuple(x)
+                            for x in _HEXADECIMAL_STRING_PATTERN.findall(ucs)
+                        ][0 : c_end - c_start + 1]
+                        if len(unicode) == 0:
+                            continue
+                        c_end = c_start + len(unicode) - 1
+                    else:
+                        unicode = self._hex_string_to_int_or_tuple(uc)
+                    entries.append((c_start, c_end, unicode))
 
-                    c_start_token = tok.read_object()
-                    c_start = int(c_start_token, 16)
+        # the entries (and lookup tables) of a parsed CMap are read-only, they are shared by identical CMaps
+        self._entries = tuple(entries)
+        self._codespace_ranges = tuple(codespace_ranges)
+        self._build_lookup_tables()
+        self._code_to_unicode = MappingProxyType(self._code_to_unicode)
+        self._ranges = tuple(self._ranges)
 
-                    c_end_token = tok.read_object()
-                    c_end = int(c_end_token, 16)
+        # update cache
+        CMap._parsed_cmaps[digest] = (
+            self._entries,
+            self._codespace_ranges,
+            self._code_to_unicode,
+            self._ranges,
+        )
+        if len(CMap._parsed_cmaps) > CMap.PARSED_CMAP_CACHE_SIZE:
+            CMap._parsed_cmaps.popitem(last=False)
 
-                    tmp = tok.read_object()
-                    if isinstance(tmp, HexadecimalString):
-                        uc = self._hex_string_to_int_or_tuple(tmp)
-                        for k in range(0, c_end - c_start + 1):
-                            if isinstance(uc, int):
-                                self._add_symbol(c_start + k, uc + k)
-                            elif isinstance(uc, tuple):
-                                self._add_symbol(c_start + k, (uc[0], uc[1] + k))
+        return self
 
-                    elif isinstance(tmp, list):
-                        for k in range(0, c_end - c_start + 1):
-                            uc = self._hex_string_to_int_or_tuple(tmp[k])
-                            self._add_symbol(c_start + k, uc)
+    def _build_lookup_tables(self) -> None:
+        """
+        Build the character mappings (and sorted ranges) of this CMap from its entries,
+        later entries take precedence over earlier entries
+        """
+        # ranges, sorted by their first character code
+        ranges = sorted(
+            [(e[0], e[1], e[2], i) for i, e in enumerate(self._entries) if len(e) == 3]
+        )
 
-            # default
-            prev_token = token
+        # overlapping ranges are split, so that the part of a range that a later range overlaps is dropped
+        if any([ranges[i][1] >= ranges[i + 1][0] for i in range(0, len(ranges) - 1)]):
+            ranges = self._split_overlapping_ranges()
 
-        return self
+        self._ranges = [(low, high, unicode) for low, high, unicode, _ in ranges]
+        self._range_lows = [low for low, _, _ in self._ranges]
+        range_indices = [i for _, _, _, i in ranges]
+
+        # single character mappings, unless a later range maps the same character code
+        self._code_to_unicode = {}
+        for i, e in enumerate(self._entries):
+            if len(e) != 2:
+                continue
+            self._code_to_unicode[e[0]] = e[1]
+            j = bisect.bisect_right(self._range_lows, e[0]) - 1
+            if j >= 0 and e[0] <= self._ranges[j][1] and range_indices[j] > i:
+                del self._code_to_unicode[e[0]]
+
+    def _split_overlapping_ranges(self) -> List[tuple]:
+        """
+        Insert the ranges of this CMap (in the order in which the CMap defines them) into a sorted list
+        of non-overlapping ranges (low, high, unicode or list of unicode, index of entry),
+        splitting the ranges that a later range overlaps
+        """
+        ranges: List[tuple] = []
+        range_lows: List[int] = []
+        for i, e in enumerate(self._entries):
+            if len(e) != 3:
+                continue
+            low, high, unicode = e
+
+            # the ranges that this range overlaps
+            j = bisect.bisect_right(range_lows, low) - 1
+            if j < 0 or ranges[j][1] < low:
+                j += 1
+            k = j
+            while k < len(ranges) and ranges[k][0] <= high:
+                k += 1
 
-    def _hex_string_to_int_or_tuple(
-        self, token: HexadecimalString
+            # keep the parts of those ranges before (and after) this range
+            split_ranges = [(low, high, unicode, i)]
+            if k > j and ranges[j][0] < low:
+                r_low, _, r_unicode, r_i = ranges[j]
+                split_ranges.insert(0, (r_low, low - 1, r_unicode, r_i))
+            if k > j and ranges[k - 1][1] > high:
+                r_low, r_high, r_unicode, r_i = ranges[k - 1]
+                split_ranges.append(
+                    (
+                        high + 1,
+                        r_high,
+                        CMap._get_unicode_range_from(r_unicode, high + 1 - r_low),
+                        r_i,
+                    )
+                )
+            ranges[j:k] = split_ranges
+            range_lows[j:k] = [r[0] for r in split_ranges]
+        return ranges
+
+    @staticmethod
+    def _get_unicode_range_from(
+        unicode: Union[int, Tuple[int, ...], list], offset: int
+    ) -> Union[int, Tuple[int, ...], list]:
+        # the unicode (or list of unicode) of the part of a range that starts at the given offset
+        if isinstance(unicode, int):
+            return unicode + offset
+        if isinstance(unicode, tuple):
+            return unicode[0], unicode[1] + offset
+        return unicode[offset:]
+
+    def _get_unicode_to_code(self) -> dict:
+        if self._unicode_to_code is None:
+            self._unicode_to_code = {}
+            for e in self._entries:
+                if len(e) == 2:
+                    self._unicode_to_code[e[1]] = e[0]
+                    continue
+                for k in range(0, e[1] - e[0] + 1):
+                    self._unicode_to_code[CMap._get_unicode_in_range(e[2], k)] = (
+                        e[0] + k
+                    )
+        return self._unicode_to_code
+
+    @staticmethod
+    def _get_unicode_in_range(
+        unicode: Union[int, Tuple[int, ...], list], offset: int
     ) -> Union[int, Tuple[int, int]]:
-        uc_hex = token.replace(" ", "")
+        if isinstance(unicode, int):
+            return unicode + offset
+        if isinstance(unicode, tuple):
+            return unicode[0], unicode[1] + offset
+        return unicode[offset]
+
+    def _hex_string_to_int_or_tuple(self, token: str) -> Union[int, Tuple[int, ...]]:
+        # a (UTF-16BE) unicode value, character codes are read as one number
+        uc_hex = _WHITESPACE_PATTERN.sub("", token)
         uc = [int(uc_hex[k : k + 4], 16) for k in range(0, int(len(uc_hex)), 4)]
         return tuple(uc) if len(uc) > 1 else uc[0]
@@ -0,0 +1,227 @@
+import bisect
+import mmap
+import pathlib
+import sys
+import typing
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from ptext.pdf.canvas.font.cmap.cmap import CMap
+
+# predefined CMap (name, without its writing mode) -> (table, codec, codespace ranges)
+# the tables are built from the codecs (see PredefinedCMap.build), the Unicode-based CMaps share one table
+_PREDEFINED_CMAPS: Dict[str, Tuple[str, Optional[str], List[Tuple[int, int, int]]]] = {
+    # Japanese
+    "90ms-RKSJ": (
+        "90ms-RKSJ",
+        "cp932",
+        [(0x00, 0x80, 1), (0x8140, 0x9FFC, 2), (0xA0, 0xDF, 1), (0xE040, 0xFCFC, 2)],
+    ),
+    "90msp-RKSJ": ("90ms-RKSJ", "cp932", []),
+    "EUC": (
+        "EUC",
+        "euc_jp",
+        [(0x00, 0x80, 1), (0x8EA0, 0x8EDF, 2), (0xA1A1, 0xFEFE, 2)],
+    ),
+    # Chinese (simplified)
+    "GB-EUC": ("GB-EUC", "gb2312", [(0x00, 0x80, 1), (0xA1A1, 0xFEFE, 2)]),
+    "GBpc-EUC": ("GB-EUC", "gb2312", []),
+    "GBK-EUC": ("GBK-EUC", "gbk", [(0x00, 0x80, 1), (0x8140, 0xFEFE, 2)]),
+    "GBKp-EUC": ("GBK-EUC", "gbk", []),
+    # Chinese (traditional)
+    "ETen-B5": ("ETen-B5", "cp950", [(0x00, 0x80, 1), (0xA140, 0xFEFE, 2)]),
+    "HKscs-B5": ("HKscs-B5", "big5hkscs", [(0x00, 0x80, 1), (0x8840, 0xFEFE, 2)]),
+    # Korean
+    "KSC-EUC": ("KSC-EUC", "euc_kr", [(0x00, 0x80, 1), (0xA1A1, 0xFEFE, 2)]),
+    "KSCpc-EUC": ("KSC-EUC", "euc_kr", []),
+    "KSCms-UHC": ("KSCms-UHC", "cp949", [(0x00, 0x80, 1), (0x8141, 0xFEFE, 2)]),
+    # Unicode
+    "UniJIS-UCS2": ("Uni-UCS2", None, [(0x0000, 0xFFFF, 2)]),
+    "UniJIS-UTF16": ("Uni-UCS2", None, []),
+    "UniGB-UCS2": ("Uni-UCS2", None, []),
+    "UniGB-UTF16": ("Uni-UCS2", None, []),
+    "UniCNS-UCS2": ("Uni-UCS2", None, []),
+    "UniCNS-UTF16": ("Uni-UCS2", None, []),
+    "UniKS-UCS2": ("Uni-UCS2", None, []),
+    "UniKS-UTF16": ("Uni-UCS2", None, []),
+}
+
+# first word of every table
+_MAGIC_NUMBER = 0x504D4350
+_VERSION = 1
+
+
+class PredefinedCMap(CMap):
+    """
+    A predefined CMap is a CMap that is referred to by name (e.g. /UniGB-UCS2-H or /90ms-RKSJ-H),
+    rather than embedded in the PDF. The character code to unicode mappings of the predefined CMaps are
+    stored (in the predefined directory) as compiled range tables, which are memory-mapped when they are first needed.
+    Memory-mapped tables are read-only, and shared by all processes that use them.
+
+    A table is a sequence of (little-endian) unsigned 32-bit integers:
+    magic number, version, number of codespace ranges, number of ranges,
+    (low, high, number of bytes) of every codespace range,
+    the first character code of every range, the last character code of every range,
+    and the unicode of the first character code of every range.
+    """
+
+    # name -> PredefinedCMap
+    _predefined_cmaps: Dict[str, Optional["PredefinedCMap"]] = {}
+
+    # table name -> (words of) table
+    _tables: Dict[str, typing.Sequence[int]] = {}
+
+    def __init__(self, name: str, words: typing.Sequence[int]):
+        super(PredefinedCMap, self).__init__()
+        self._name = name
+        assert words[0] == _MAGIC_NUMBER and words[1] == _VERSION
+        number_of_codespace_ranges = words[2]
+        number_of_ranges = words[3]
+        i = 4
+        self._codespace_ranges = [
+            (words[i + j * 3], words[i + j * 3 + 1], words[i + j * 3 + 2])
+            for j in range(0, number_of_codespace_ranges)
+        ]
+        i += number_of_codespace_ranges * 3
+        self._lows = words[i : i + number_of_ranges]
+        self._highs = words[i + number_of_ranges : i + 2 * number_of_ranges]
+        self._unicodes = words[i + 2 * number_of_ranges : i + 3 * number_of_ranges]
+
+    @staticmethod
+    def get(name: str) -> Optional["PredefinedCMap"]:
+        """
+        Get the predefined CMap with a given name (e.g. UniJIS-UCS2-H),
+        returns None if the CMap is not a (supported) predefined CMap
+        """
+        if name in PredefinedCMap._predefined_cmaps:
+            return PredefinedCMap._predefined_cmaps[name]
+
+        # the writing mode (horizontal or vertical) does not change the unicode of a character code
+        base_name = name[:-2] if name[-2:] in ["-H", "-V"] else None
+        if base_name not in _PREDEFINED_CMAPS:
+            PredefinedCMap._predefined_cmaps[name] = None
+            return None
+
+        # map table
+        table_name = _PREDEFINED_CMAPS[base_name][0]
+        if table_name not in PredefinedCMap._tables:
+            PredefinedCMap._tables[table_name] = PredefinedCMap._map_table(
+                pathlib.Path(__file__).parent / "predefined" / (table_name + ".bin")
+            )
+
+        PredefinedCMap._predefined_cmaps[name] = PredefinedCMap(
+            name, PredefinedCMap._tables[table_name]
+        )
+        return PredefinedCMap._predefined_cmaps[name]
+
+    @staticmethod
+    def _map_table(path: pathlib.Path) -> typing.Sequence[int]:
+        with open(path, "rb") as table_file_handle:
+            table = mmap.mmap(table_file_handle.fileno(), 0, access=mmap.ACCESS_READ)
+        if sys.byteorder == "little":
+            return memoryview(table).cast("I")
+        # tables are little-endian, big-endian platforms keep a (byte-swapped) copy
+        words = array("I", table[:])
+        words.byteswap()
+        return words
+
+    def get_name(self) -> str:
+        """
+        Get the name of this predefined CMap
+        """
+        return self._name
+
+    def code_to_unicode(self, character_code: int) -> Optional[int]:
+        """
+        Converts a character code to a unicode code point
+        Returns None if this CMAP does not contain a mapping for the given character code
+        """
+        i = bisect.bisect_right(self._lows, character_code) - 1
+        if i < 0 or character_code > self._highs[i]:
+            return None
+        return self._unicodes[i] + character_code - self._lows[i]
+
+    def get_character_code_ranges(self) -> List[Tuple[int, int]]:
+        """
+        Get the (low, high) character codes of every mapping of this CMap
+        """
+        return list(zip(self._lows, self._highs))
+
+    def read(self, cmap_bytes: str) -> "CMap":
+        raise TypeError("predefined CMaps can not be read")
+
+    def _get_unicode_to_code(self) -> dict:
+        if self._unicode_to_code is None:
+            self._unicode_to_code = {}
+            for low, high, unicode in zip(self._lows, self._highs, self._unicodes):
+                for k in range(0, high - low + 1):
+                    self._unicode_to_code.setdefault(unicode + k, low + k)
+        return self._unicode_to_code
+
+    @staticmethod
+    def write(
+        path: pathlib.Path,
+        codespace_ranges: List[Tuple[int, int, int]],
+        code_to_unicode: Dict[int, int],
+    ) -> None:
+        """
+        Write the range table of a predefined CMap,
+        consecutive character codes that map to consecutive unicode code points are stored as one range
+        """
+        ranges: List[List[int]] = []
+        for code in sorted(code_to_unicode.keys()):
+            unicode = code_to_unicode[code]
+            if (
+                len(ranges) > 0
+                and ranges[-1][1] == code - 1
+                and ranges[-1][2] + code - ranges[-1][0] == unicode
+            ):
+                ranges[-1][1] = code
+                continue
+            ranges.append([code, code, unicode])
+        words = array(
+            "I",
+            [_MAGIC_NUMBER, _VERSION, len(codespace_ranges), len(ranges)]
+            + [x for r in codespace_ranges for x in r]
+            + [r[0] for r in ranges]
+            + [r[1] for r in ranges]
+            + [r[2] for r in ranges],
+        )
+        if sys.byteorder == "big":
+            words.byteswap()
+        with open(path, "wb") as table_file_handle:
+            words.tofile(table_file_handle)
+
+    @staticmethod
+    def build(directory: pathlib.Path) -> None:
+        """
+        Build the range tables of all predefined CMaps (from the codecs of the python standard library)
+        """
+        for table_name, codec, codespace_ranges in _PREDEFINED_CMAPS.values():
+            if len(codespace_ranges) == 0:
+                continue
+
+            # Unicode-based CMaps map every (non-surrogate) code to itself
+            code_to_unicode: Dict[int, int] = {}
+            if codec is None:
+                code_to_unicode = {
+                    c: c for c in range(1, 0x10000) if not (0xD800 <= c <= 0xDFFF)
+                }
+
+            # other CMaps map every code their codec can decode (to a single character)
+            for low, high, number_of_bytes in codespace_ranges if codec else []:
+                for code in range(low, high + 1):
+                    if number_of_bytes == 2 and not (
+                        (low & 0xFF) <= (code & 0xFF) <= (high & 0xFF)
+                    ):
+                        continue
+                    try:
+                        s = code.to_bytes(number_of_bytes, "big").decode(codec)
+                    except UnicodeDecodeError:
+                        continue
+                    if len(s) == 1 and ord(s) != 0:
+                        code_to_unicode[code] = ord(s)
+
+            PredefinedCMap.write(
+                directory / (table_name + ".bin"), codespace_ranges, code_to_unicode
+            )
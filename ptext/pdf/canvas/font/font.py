@@ -2,9 +2,10 @@ import logging
 from decimal import Decimal
 from typing import Optional
 
-from ptext.io.transform.types import Dictionary, HexadecimalString
+from ptext.io.transform.types import Dictionary
 from ptext.pdf.canvas.font.cmap.cmap import CMap
-from ptext.pdf.canvas.font.glyph_line import GlyphLine, Glyph
+from ptext.pdf.canvas.font.glyph_line import GlyphLine
+from ptext.pdf.canvas.font.glyph_table import GlyphRun, GlyphTable
 from ptext.pdf.canvas.font.latin_text_encoding import (
     StandardEncoding,
     get_encoding,
@@ -32,6 +33,15 @@ class Font(Dictionary):
         super(Font, self).__init__()
         self._font_encoding = None
         self._to_unicode_map = None
+        self._glyph_table = None
+
+    def __getstate__(self):
+        # the GlyphTable is rebuilt when it is first needed,
+        # and the parent is not pickled (a pickled Font is not part of the Document, like a copied Font)
+        state = self.__dict__.copy()
+        state["_glyph_table"] = None
+        state.pop("_parent", None)
+        return state
 
     def get_average_character_width(self) -> Optional[Decimal]:
         """
@@ -95,7 +105,10 @@ class Font(Dictionary):
         estimates based on the metrics of other characters)
         Returns None if the space character width could not be estimated.
         """
-        space_width = self.get_single_character_width(32)
+        space_width = None
+        space_character_code = self._get_space_character_code()
+        if space_character_code is not None:
+            space_width = self.get_single_character_width(space_character_code)
 
         # missing character width
         if space_width is None:
@@ -165,58 +178,42 @@ class Font(Dictionary):
 
         return space_width
 
+    def _get_space_character_code(self) -> Optional[int]:
+        """
+        Get the character code of the space-character, or None if it is not known
+        """
+        return 32
+
     def build_glyph_line(self, content) -> GlyphLine:
+        return self.get_glyph_table().build_glyph_line(content)
+
+    def build_glyph_run(self, content) -> GlyphRun:
+        """
+        Decode a String into a (shared) GlyphRun, using the cache of the GlyphTable of this Font
+        """
+        return self.get_glyph_table().build_glyph_run(content)
+
+    def get_glyph_table(self) -> GlyphTable:
+        """
+        Get the GlyphTable of this Font, the GlyphTable is built when it is first needed
+        """
+        if self._glyph_table is None:
+            self._glyph_table = self._build_glyph_table()
+        return self._glyph_table
+
+    def set_glyph_table(self, glyph_table: GlyphTable) -> "Font":
+        """
+        Set the GlyphTable of this Font (e.g. the GlyphTable of another instance of the same font dictionary)
+        """
+        self._glyph_table = glyph_table
+        return self
+
+    def _build_glyph_table(self) -> GlyphTable:
         if self._font_encoding is None:
             self._init_font_encoding()
         if self._to_unicode_map is None:
             self._init_to_unicode_map()
-        glyphs = []
-        i = 0
-        value_bytes = content.get_value_bytes()
-        while i < len(value_bytes):
-            # attempt to use ToUnicode CMAP (2 bytes)
-            if i + 1 < len(value_bytes) and isinstance(content, HexadecimalString):
-                code = value_bytes[i] * 256 + value_bytes[i + 1]
-                if (
-                    self._to_unicode_map is not None
-                    and self._to_unicode_map.code_to_unicode(code) is not None
-                    and self._to_unicode_map.code_to_unicode(code) != 0
-                ):
-                    unicode = self._to_unicode_map.code_to_unicode(code)
-                    glyphs.append(
-                        Glyph(code, unicode, self.get_single_character_width(code))
-                    )
-                    i += 2
-                    continue
-            # attempt to use ToUnicode CMAP (1 byte)
-            code = value_bytes[i]
-            if (
-                isinstance(content, HexadecimalString)
-                and self._to_unicode_map is not None
-                and self._to_unicode_map.code_to_unicode(code) is not None
-                and self._to_unicode_map.code_to_unicode(code) != 0
-            ):
-                unicode = self._to_unicode_map.code_to_unicode(code)
-                glyphs.append(
-                    Glyph(code, unicode, self.get_single_character_width(code))
-                )
-                i += 1
-                continue
-            # attempt to use encoding
-            if (
-                self._font_encoding is not None
-                and self._font_encoding.can_encode_character_code(code)
-            ):
-                unicode = self._font_encoding.code_to_unicode(code)
-                glyphs.append(
-                    Glyph(code, unicode, self.get_single_character_width(code))
-                )
-                i += 1
-                continue
-            # default I guess ?
-            i += 1
-        # return
-        return GlyphLine(glyphs)
+        return GlyphTable(self)
 
     def can_encode_unicode(self, unicode_code: int) -> bool:
         if self._to_unicode_map is not None:
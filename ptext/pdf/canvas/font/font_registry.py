@@ -0,0 +1,53 @@
+from typing import Dict, Tuple
+
+from ptext.pdf.canvas.font.font import Font
+from ptext.pdf.canvas.font.glyph_table import GlyphTable
+
+
+class FontRegistry:
+    """
+    A FontRegistry keeps the GlyphTable of every font (dictionary) of a Document.
+    Each font is compiled into a GlyphTable once, the GlyphTable is then shared
+    by every page that uses the font, even when the Font itself is read again
+    (e.g. when pages are processed one at a time, and released afterwards).
+    Fonts are identified by the (object number, generation number) of their indirect object,
+    fonts that are not indirect objects keep their own GlyphTable.
+    """
+
+    def __init__(self):
+        self._glyph_tables: Dict[Tuple[int, int], GlyphTable] = {}
+
+    def get_glyph_table(self, font: Font) -> GlyphTable:
+        """
+        Get the GlyphTable of a Font, setting it on the Font if it was built before
+        """
+        reference = font.get_reference()
+        if reference is None or reference.object_number is None:
+            return font.get_glyph_table()
+        key = (reference.object_number, reference.generation_number or 0)
+        glyph_table = self._glyph_tables.get(key)
+        if glyph_table is None:
+            glyph_table = font.get_glyph_table()
+            self._glyph_tables[key] = glyph_table
+        elif font._glyph_table is None:
+            font.set_glyph_table(glyph_table)
+        return glyph_table
+
+    def get_number_of_glyph_run_hits(self) -> int:
+        """
+        Get the number of GlyphRun cache hits, of all GlyphTable objects in this FontRegistry
+        """
+        return sum(
+            [t.get_number_of_glyph_run_hits() for t in self._glyph_tables.values()]
+        )
+
+    def get_number_of_glyph_run_misses(self) -> int:
+        """
+        Get the number of GlyphRun cache misses, of all GlyphTable objects in this FontRegistry
+        """
+        return sum(
+            [t.get_number_of_glyph_run_misses() for t in self._glyph_tables.values()]
+        )
+
+    def __len__(self) -> int:
+        return len(self._glyph_tables)
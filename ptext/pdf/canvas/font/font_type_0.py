@@ -3,8 +3,9 @@ from decimal import Decimal
 from typing import Optional
 
 from ptext.exception.pdf_exception import PDFTypeError
+from ptext.pdf.canvas.font.cmap.predefined_cmap import PredefinedCMap
 from ptext.pdf.canvas.font.font import Font
-from ptext.pdf.canvas.font.glyph_line import GlyphLine
+from ptext.pdf.canvas.font.glyph_table import GlyphTable
 
 
 class FontType0(Font):
@@ -32,6 +33,14 @@ class FontType0(Font):
     def get_font_name(self) -> Optional[str]:
         return self.get_descendant_font().get_font_name()
 
+    def _get_space_character_code(self) -> Optional[int]:
+        # character code 32 is not the space-character of a composite font (its codes map to CIDs),
+        # the space-character is looked up in its ToUnicode CMap (or predefined CMap) instead
+        self.get_glyph_table()
+        if not self.can_encode_unicode(32):
+            return None
+        return self.unicode_to_code(32)
+
     def get_descendant_font(self) -> Font:
         if "DescendantFonts" not in self:
             raise PDFTypeError(expected_type=list, received_type=None)
@@ -45,15 +54,32 @@ class FontType0(Font):
             return self["DescendantFonts"]
         raise PDFTypeError(expected_type=Font, received_type=None)
 
-    def build_glyph_line(self, content) -> GlyphLine:
+    def _get_predefined_cmap(self) -> Optional[PredefinedCMap]:
+        if not isinstance(self.get("Encoding"), str):
+            return None
+        return PredefinedCMap.get(self["Encoding"])
+
+    def _init_font_encoding(self):
+        # predefined CMaps are not byte-to-char encodings
+        if self._get_predefined_cmap() is not None:
+            return
+        super(FontType0, self)._init_font_encoding()
+
+    def _init_to_unicode_map(self):
+        super(FontType0, self)._init_to_unicode_map()
+        # a ToUnicode CMap takes precedence over a predefined CMap
+        if self._to_unicode_map is None:
+            self._to_unicode_map = self._get_predefined_cmap()
+
+    def _build_glyph_table(self) -> GlyphTable:
         if self._font_encoding is None:
             self._init_font_encoding()
         if self._to_unicode_map is None:
             self._init_to_unicode_map()
         # set parent
         self.get_descendant_font()._parent = self
-        # call child
-        return self.get_descendant_font().build_glyph_line(content)
+        # glyphs are those of the child
+        return self.get_descendant_font().get_glyph_table()
 
     def __deepcopy__(self, memodict={}):
         copy_out = FontType0()
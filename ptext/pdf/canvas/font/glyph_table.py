@@ -0,0 +1,248 @@
+import typing
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Dict, Optional, Tuple
+
+from ptext.io.transform.types import HexadecimalString, String
+from ptext.pdf.canvas.font.cmap.predefined_cmap import PredefinedCMap
+from ptext.pdf.canvas.font.glyph_line import Glyph, GlyphLine
+
+
+class GlyphRun:
+    """
+    A GlyphRun is a (decoded) String, shown in a Font.
+    It keeps the GlyphLine of the String, along with its unscaled advance width
+    (the sum of the widths of its Glyphs, in glyph space) and its number of spaces.
+    These do not depend on the font size, spacing or scaling in which the String is shown,
+    so a GlyphRun can be shared by every text-rendering instruction that shows the same String.
+    GlyphRun objects (and their GlyphLine) are shared, and should not be modified.
+    """
+
+    def __init__(self, glyph_line: GlyphLine):
+        self.glyph_line = glyph_line
+        self.width: Decimal = sum([g.width for g in glyph_line], Decimal(0))
+        self.number_of_spaces: int = len([g for g in glyph_line if g.unicode == " "])
+
+
+class GlyphTable:
+    """
+    A GlyphTable is a Font, compiled into flat lookup tables.
+    It maps every character code the Font can show to a Glyph (its unicode value, and its width),
+    and knows which character codes are 1 byte long, and which are 2 (or 3, or 4) bytes long.
+    Once a GlyphTable is built, decoding a String takes a single lookup per character code.
+
+    The lookup rules are those of Font.build_glyph_line:
+    the ToUnicode CMap is used for (the multi-byte, and 1-byte, codes in) hexadecimal strings,
+    the Encoding is used for any (1-byte) code the ToUnicode CMap does not map.
+    A predefined CMap (e.g. /90ms-RKSJ-H) takes the place of the ToUnicode CMap, and is used for all strings.
+    Bytes that do not map to a Glyph are skipped.
+    3-byte and 4-byte codes are only read within the (3-byte and 4-byte) codespace ranges of the CMap.
+
+    A GlyphTable keeps the GlyphRun of the Strings it decoded most recently,
+    in a bounded (least recently used) cache.
+    """
+
+    GLYPH_RUN_CACHE_SIZE = 1024
+
+    def __init__(self, font: "Font"):
+
+        # bounded cache of GlyphRun objects
+        self._glyph_runs: "OrderedDict[Tuple[bool, str], GlyphRun]" = OrderedDict()
+        self._number_of_glyph_run_hits: int = 0
+        self._number_of_glyph_run_misses: int = 0
+
+        # glyphs of the Encoding
+        # (widths are looked up once per character code)
+        widths: Dict[int, Optional[typing.Any]] = {}
+
+        def get_width(code: int):
+            if code not in widths:
+                widths[code] = font.get_single_character_width(code)
+            return widths[code]
+
+        encoding = font._font_encoding
+        self._one_byte_glyphs: typing.List[Optional[Glyph]] = [None] * 256
+        if encoding is not None:
+            for code in range(0, 256):
+                if encoding.can_encode_character_code(code):
+                    self._one_byte_glyphs[code] = Glyph(
+                        code, encoding.code_to_unicode(code), get_width(code)
+                    )
+
+        # glyphs of the ToUnicode CMap (in hexadecimal strings)
+        # (2-byte glyphs are looked up in the CMap when they are first needed)
+        to_unicode_map = font._to_unicode_map
+        self._to_unicode_map = to_unicode_map
+        self._get_width = get_width
+
+        # a predefined CMap is the encoding of the font, it is used for all strings
+        self._decodes_literal_strings_with_cmap = isinstance(
+            to_unicode_map, PredefinedCMap
+        )
+        self._one_byte_hexadecimal_glyphs: typing.List[Optional[Glyph]] = [
+            g for g in self._one_byte_glyphs
+        ]
+        self._two_byte_glyphs: Dict[int, Optional[Glyph]] = {}
+        self._two_byte_codespace_ranges: typing.List[Tuple[int, int]] = []
+        self._starts_two_byte_code: typing.List[bool] = [False] * 256
+        self._long_glyphs: Dict[Tuple[int, int], Optional[Glyph]] = {}
+        self._long_codespace_ranges: typing.List[Tuple[int, int, int]] = []
+        self._starts_long_code: typing.List[bool] = [False] * 256
+        if to_unicode_map is not None:
+            for code in range(0, 256):
+                unicode = to_unicode_map.code_to_unicode(code)
+                if unicode is None or unicode == 0:
+                    continue
+                self._one_byte_hexadecimal_glyphs[code] = Glyph(
+                    code, unicode, get_width(code)
+                )
+
+            # resolve which bytes (may) start a 2-byte character code
+            # if the CMap defines codespace ranges, only its 2-byte ranges contain 2-byte codes,
+            # otherwise any 2-byte code the CMap maps is considered
+            code_ranges = [
+                (max(low, 0), min(high, 65535))
+                for low, high in to_unicode_map.get_character_code_ranges()
+                if low <= 65535 and high >= 0
+            ]
+            codespace_ranges = to_unicode_map.get_codespace_ranges()
+            if len(codespace_ranges) > 0:
+                self._two_byte_codespace_ranges = [
+                    (low, high) for low, high, n in codespace_ranges if n == 2
+                ]
+                code_ranges = [
+                    (max(low_0, low_1), min(high_0, high_1))
+                    for low_0, high_0 in code_ranges
+                    for low_1, high_1 in self._two_byte_codespace_ranges
+                    if max(low_0, low_1) <= min(high_0, high_1)
+                ]
+            for low, high in code_ranges:
+                for b in range(low >> 8, (high >> 8) + 1):
+                    self._starts_two_byte_code[b] = True
+
+            # 3-byte and 4-byte codes (longest first)
+            self._long_codespace_ranges = sorted(
+                [(low, high, n) for low, high, n in codespace_ranges if n in [3, 4]],
+                key=lambda x: -x[2],
+            )
+            for low, high, n in self._long_codespace_ranges:
+                shift = 8 * (n - 1)
+                for b in range(low >> shift, min(high >> shift, 255) + 1):
+                    self._starts_long_code[b] = True
+
+    def _get_two_byte_glyph(self, code: int) -> Optional[Glyph]:
+        if code in self._two_byte_glyphs:
+            return self._two_byte_glyphs[code]
+        g: Optional[Glyph] = None
+        if len(self._two_byte_codespace_ranges) == 0 or any(
+            [low <= code <= high for low, high in self._two_byte_codespace_ranges]
+        ):
+            unicode = self._to_unicode_map.code_to_unicode(code)
+            if unicode is not None and unicode != 0:
+                g = Glyph(code, unicode, self._get_width(code))
+        self._two_byte_glyphs[code] = g
+        return g
+
+    def _get_long_glyph(
+        self, value_bytes: bytes, i: int
+    ) -> Tuple[Optional[Glyph], int]:
+        for low, high, n in self._long_codespace_ranges:
+            if i + n > len(value_bytes):
+                continue
+            code = int.from_bytes(value_bytes[i : i + n], "big")
+            if not low <= code <= high:
+                continue
+            key = (n, code)
+            if key not in self._long_glyphs:
+                g: Optional[Glyph] = None
+                unicode = self._to_unicode_map.code_to_unicode(code)
+                if unicode is not None and unicode != 0:
+                    g = Glyph(code, unicode, self._get_width(code))
+                self._long_glyphs[key] = g
+            if self._long_glyphs[key] is not None:
+                return self._long_glyphs[key], n
+        return None, 1
+
+    def get_number_of_glyph_run_hits(self) -> int:
+        """
+        Get the number of times build_glyph_run found its GlyphRun in the cache
+        """
+        return self._number_of_glyph_run_hits
+
+    def get_number_of_glyph_run_misses(self) -> int:
+        """
+        Get the number of times build_glyph_run had to decode its String
+        """
+        return self._number_of_glyph_run_misses
+
+    def build_glyph_run(self, content: String) -> GlyphRun:
+        """
+        This function decodes a String into a GlyphRun,
+        Strings that were decoded before are looked up in the cache
+        """
+        # Strings with an explicit encoding are not decoded by the GlyphTable
+        if content.encoding is not None:
+            return GlyphRun(self.build_glyph_line(content))
+
+        # lookup in cache
+        # (the same characters may be a literal, or a hexadecimal, string)
+        key = (isinstance(content, HexadecimalString), str(content))
+        glyph_run = self._glyph_runs.get(key)
+        if glyph_run is not None:
+            self._glyph_runs.move_to_end(key)
+            self._number_of_glyph_run_hits += 1
+            return glyph_run
+
+        # decode
+        self._number_of_glyph_run_misses += 1
+        glyph_run = GlyphRun(self.build_glyph_line(content))
+
+        # update cache
+        self._glyph_runs[key] = glyph_run
+        if len(self._glyph_runs) > GlyphTable.GLYPH_RUN_CACHE_SIZE:
+            self._glyph_runs.popitem(last=False)
+        return glyph_run
+
+    def build_glyph_line(self, content: String) -> GlyphLine:
+        """
+        This function decodes a String into a GlyphLine
+        """
+        value_bytes = content.get_value_bytes()
+
+        # simple strings only use the Encoding
+        if (
+            not isinstance(content, HexadecimalString)
+            and not self._decodes_literal_strings_with_cmap
+        ):
+            one_byte_glyphs = self._one_byte_glyphs
+            return GlyphLine(
+                [
+                    one_byte_glyphs[b]
+                    for b in value_bytes
+                    if one_byte_glyphs[b] is not None
+                ]
+            )
+
+        # hexadecimal strings (and strings in a predefined CMap) may contain multi-byte codes
+        glyphs: typing.List[Glyph] = []
+        i = 0
+        n = len(value_bytes)
+        while i < n:
+            b = value_bytes[i]
+            if self._starts_long_code[b]:
+                g, k = self._get_long_glyph(value_bytes, i)
+                if g is not None:
+                    glyphs.append(g)
+                    i += k
+                    continue
+            if i + 1 < n and self._starts_two_byte_code[b]:
+                g = self._get_two_byte_glyph(b * 256 + value_bytes[i + 1])
+                if g is not None:
+                    glyphs.append(g)
+                    i += 2
+                    continue
+            g = self._one_byte_hexadecimal_glyphs[b]
+            if g is not None:
+                glyphs.append(g)
+            i += 1
+        return GlyphLine(glyphs)
@@ -10,7 +10,11 @@ class LineSegment:
         self.y1 = y1
 
     def length(self) -> Decimal:
-        return Decimal(sqrt((self.x0 - self.x1) ** 2 + (self.y0 - self.y1) ** 2))
+        d = sqrt((self.x0 - self.x1) ** 2 + (self.y0 - self.y1) ** 2)
+        # a line segment with float coordinates (fast math) has a float length
+        if isinstance(self.x0, float):
+            return d
+        return Decimal(d)
 
     def get_start(self) -> (Decimal, Decimal):
         return (self.x0, self.y0)
@@ -1,5 +1,6 @@
+import copy
 from decimal import Decimal
-from typing import List
+from typing import List, Tuple
 
 
 class Matrix:
@@ -41,6 +42,26 @@ class Matrix:
         m.mtx = [[a, b, Decimal(0)], [c, d, Decimal(0)], [e, f, Decimal(1)]]
         return m
 
+    @staticmethod
+    def translation_matrix(tx: Decimal, ty: Decimal) -> "Matrix":
+        """
+        This method returns the matrix [[1, 0, 0], [0, 1, 0], [tx, ty, 1]]
+        """
+        m = Matrix.identity_matrix()
+        m.mtx[2][0] = tx
+        m.mtx[2][1] = ty
+        return m
+
+    def add_to_translation(self, tx: Decimal, ty: Decimal) -> "Matrix":
+        """
+        This method returns a copy of this matrix, with tx (and ty) added to its translation (e, and f) components.
+        This matrix itself is left unchanged (it may be shared with a saved graphics state).
+        """
+        m = copy.deepcopy(self)
+        m.mtx[2][0] += tx
+        m.mtx[2][1] += ty
+        return m
+
     def mul(self, y: "Matrix") -> "Matrix":
         m_vals = [
             [Decimal(0), Decimal(0), Decimal(0)],
@@ -85,3 +106,99 @@ class Matrix:
             [self.mtx[2][0], self.mtx[2][1], self.mtx[2][2]],
         ]
         return m
+
+
+class FloatMatrix:
+    """
+    A FloatMatrix is the (fast math) counterpart of Matrix. It holds an affine transformation
+    [[a, b, 0], [c, d, 0], [e, f, 1]] as six floats, and multiplies (and transforms points) in closed form.
+    A FloatMatrix is immutable, every operation returns a new FloatMatrix.
+    """
+
+    __slots__ = ("a", "b", "c", "d", "e", "f")
+
+    def __init__(
+        self,
+        a: float = 1.0,
+        b: float = 0.0,
+        c: float = 0.0,
+        d: float = 1.0,
+        e: float = 0.0,
+        f: float = 0.0,
+    ):
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+        self.e = e
+        self.f = f
+
+    @staticmethod
+    def identity_matrix() -> "FloatMatrix":
+        """
+        This method returns the matrix [[1, 0, 0], [0, 1, 0], [0, 0, 1]]
+        """
+        return FloatMatrix()
+
+    @staticmethod
+    def matrix_from_six_values(
+        a: float, b: float, c: float, d: float, e: float, f: float
+    ) -> "FloatMatrix":
+        """
+        This method returns the matrix [[a, b, 0], [c, d, 0], [e, f, 1]]
+        """
+        return FloatMatrix(a, b, c, d, e, f)
+
+    @staticmethod
+    def translation_matrix(tx: float, ty: float) -> "FloatMatrix":
+        """
+        This method returns the matrix [[1, 0, 0], [0, 1, 0], [tx, ty, 1]]
+        """
+        return FloatMatrix(1.0, 0.0, 0.0, 1.0, tx, ty)
+
+    def add_to_translation(self, tx: float, ty: float) -> "FloatMatrix":
+        """
+        This method returns a copy of this matrix, with tx (and ty) added to its translation (e, and f) components
+        """
+        return FloatMatrix(self.a, self.b, self.c, self.d, self.e + tx, self.f + ty)
+
+    def mul(self, y: "FloatMatrix") -> "FloatMatrix":
+        return FloatMatrix(
+            self.a * y.a + self.b * y.c,
+            self.a * y.b + self.b * y.d,
+            self.c * y.a + self.d * y.c,
+            self.c * y.b + self.d * y.d,
+            self.e * y.a + self.f * y.c + y.e,
+            self.e * y.b + self.f * y.d + y.f,
+        )
+
+    def cross(self, x: float, y: float, z: float) -> Tuple[float, float, float]:
+        return (
+            x * self.a + y * self.c + z * self.e,
+            x * self.b + y * self.d + z * self.f,
+            z,
+        )
+
+    def __getitem__(self, item) -> List[float]:
+        # rows are computed, changing them does not change this FloatMatrix
+        return [
+            [self.a, self.b, 0.0],
+            [self.c, self.d, 0.0],
+            [self.e, self.f, 1.0],
+        ][item]
+
+    def __str__(self):
+        return "[[%f %f %f]\n [%f %f %f]\n [%f %f %f]]" % (
+            self.a,
+            self.b,
+            0.0,
+            self.c,
+            self.d,
+            0.0,
+            self.e,
+            self.f,
+            1.0,
+        )
+
+    def __deepcopy__(self, memodict={}):
+        return self
@@ -1,7 +1,11 @@
+from decimal import Decimal
 from typing import List
 
 from ptext.io.transform.types import AnyPDFType
 
+# number operands are Decimal objects, or float objects (when a Canvas is read using fast math)
+NUMBER_TYPES = (Decimal, float)
+
 
 class CanvasOperator:
     def __init__(self, text: str, number_of_operands: int):
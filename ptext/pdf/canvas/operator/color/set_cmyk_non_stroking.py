@@ -1,9 +1,8 @@
-from decimal import Decimal
 from typing import List
 
 from ptext.io.transform.types import AnyPDFType
 from ptext.pdf.canvas.color.color import CMYKColor
-from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
+from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator, NUMBER_TYPES
 
 
 class SetCMYKNonStroking(CanvasOperator):
@@ -15,10 +14,10 @@ class SetCMYKNonStroking(CanvasOperator):
         super().__init__("k", 4)
 
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType]):
-        assert isinstance(operands[0], Decimal)
-        assert isinstance(operands[1], Decimal)
-        assert isinstance(operands[2], Decimal)
-        assert isinstance(operands[3], Decimal)
+        assert isinstance(operands[0], NUMBER_TYPES)
+        assert isinstance(operands[1], NUMBER_TYPES)
+        assert isinstance(operands[2], NUMBER_TYPES)
+        assert isinstance(operands[3], NUMBER_TYPES)
         c = operands[0]
         m = operands[1]
         y = operands[2]
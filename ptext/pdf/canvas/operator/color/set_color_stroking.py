@@ -1,9 +1,8 @@
-from decimal import Decimal
 from typing import List
 
 from ptext.io.transform.types import AnyPDFType
 from ptext.pdf.canvas.color.color import GrayColor, RGBColor, CMYKColor
-from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
+from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator, NUMBER_TYPES
 
 
 class SetColorStroking(CanvasOperator):
@@ -40,10 +39,10 @@ class SetColorStroking(CanvasOperator):
 
         non_stroke_color_space = self.canvas.graphics_state.non_stroke_color_space
         if non_stroke_color_space == "DeviceCMYK":
-            assert isinstance(operands[0], Decimal)
-            assert isinstance(operands[1], Decimal)
-            assert isinstance(operands[2], Decimal)
-            assert isinstance(operands[3], Decimal)
+            assert isinstance(operands[0], NUMBER_TYPES)
+            assert isinstance(operands[1], NUMBER_TYPES)
+            assert isinstance(operands[2], NUMBER_TYPES)
+            assert isinstance(operands[3], NUMBER_TYPES)
             canvas.graphics_state.stroke_color = CMYKColor(
                 operands[0],
                 operands[1],
@@ -53,14 +52,14 @@ class SetColorStroking(CanvasOperator):
             return
 
         if non_stroke_color_space == "DeviceGray":
-            assert isinstance(operands[0], Decimal)
+            assert isinstance(operands[0], NUMBER_TYPES)
             canvas.graphics_state.stroke_color = GrayColor(operands[0])
             return
 
         if non_stroke_color_space == "DeviceRGB":
-            assert isinstance(operands[0], Decimal)
-            assert isinstance(operands[1], Decimal)
-            assert isinstance(operands[2], Decimal)
+            assert isinstance(operands[0], NUMBER_TYPES)
+            assert isinstance(operands[1], NUMBER_TYPES)
+            assert isinstance(operands[2], NUMBER_TYPES)
             canvas.graphics_state.stroke_color = RGBColor(
                 operands[0],
                 operands[1],
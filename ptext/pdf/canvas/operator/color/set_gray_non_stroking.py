@@ -4,7 +4,7 @@ from typing import List
 from ptext.exception.pdf_exception import PDFTypeError
 from ptext.io.transform.types import AnyPDFType
 from ptext.pdf.canvas.color.color import GrayColor
-from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
+from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator, NUMBER_TYPES
 
 
 class SetGrayNonStroking(CanvasOperator):
@@ -16,7 +16,7 @@ class SetGrayNonStroking(CanvasOperator):
         super().__init__("g", 1)
 
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType]):
-        if not isinstance(operands[0], Decimal):
+        if not isinstance(operands[0], NUMBER_TYPES):
             raise PDFTypeError(
                 expected_type=Decimal, received_type=operands[0].__class__
             )
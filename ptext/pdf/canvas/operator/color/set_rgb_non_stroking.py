@@ -1,9 +1,8 @@
-from decimal import Decimal
 from typing import List
 
 from ptext.io.transform.types import AnyPDFType
 from ptext.pdf.canvas.color.color import RGBColor
-from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
+from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator, NUMBER_TYPES
 
 
 class SetRGBNonStroking(CanvasOperator):
@@ -15,9 +14,9 @@ class SetRGBNonStroking(CanvasOperator):
         super().__init__("rg", 3)
 
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType]):
-        assert isinstance(operands[0], Decimal)
-        assert isinstance(operands[1], Decimal)
-        assert isinstance(operands[2], Decimal)
+        assert isinstance(operands[0], NUMBER_TYPES)
+        assert isinstance(operands[1], NUMBER_TYPES)
+        assert isinstance(operands[2], NUMBER_TYPES)
         r = operands[0]
         g = operands[1]
         b = operands[2]
@@ -1,9 +1,7 @@
-from decimal import Decimal
 from typing import List
 
 from ptext.io.transform.types import AnyPDFType
-from ptext.pdf.canvas.geometry.matrix import Matrix
-from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
+from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator, NUMBER_TYPES
 
 
 class ModifyTransformationMatrix(CanvasOperator):
@@ -18,13 +16,14 @@ class ModifyTransformationMatrix(CanvasOperator):
         super().__init__("cm", 6)
 
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType] = []):
-        assert isinstance(operands[0], Decimal)
-        assert isinstance(operands[1], Decimal)
-        assert isinstance(operands[2], Decimal)
-        assert isinstance(operands[3], Decimal)
-        assert isinstance(operands[4], Decimal)
-        assert isinstance(operands[5], Decimal)
-        mtx = Matrix.matrix_from_six_values(
+        assert isinstance(operands[0], NUMBER_TYPES)
+        assert isinstance(operands[1], NUMBER_TYPES)
+        assert isinstance(operands[2], NUMBER_TYPES)
+        assert isinstance(operands[3], NUMBER_TYPES)
+        assert isinstance(operands[4], NUMBER_TYPES)
+        assert isinstance(operands[5], NUMBER_TYPES)
+        # the matrix is of the same kind (Matrix, or FloatMatrix) as the CTM
+        mtx = canvas.graphics_state.ctm.matrix_from_six_values(
             operands[0],
             operands[1],
             operands[2],
@@ -15,4 +15,4 @@ class PushGraphicsState(CanvasOperator):
         super().__init__("q", 0)
 
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType] = []):
-        canvas.graphics_state_stack.append(copy.deepcopy(canvas.graphics_state))
+        canvas.graphics_state_stack.append(copy.copy(canvas.graphics_state))
@@ -2,7 +2,6 @@ from typing import List
 
 from ptext.io.transform.types import AnyPDFType
 from ptext.pdf.canvas.event.begin_text_event import BeginTextEvent
-from ptext.pdf.canvas.geometry.matrix import Matrix
 from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
 
 
@@ -17,6 +16,9 @@ class BeginTextObject(CanvasOperator):
         super().__init__("BT", 0)
 
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType] = []):
-        canvas.graphics_state.text_matrix = Matrix.identity_matrix()
-        canvas.graphics_state.text_line_matrix = Matrix.identity_matrix()
+        # the matrices are of the same kind (Matrix, or FloatMatrix) as the CTM
+        canvas.graphics_state.text_matrix = canvas.graphics_state.ctm.identity_matrix()
+        canvas.graphics_state.text_line_matrix = (
+            canvas.graphics_state.ctm.identity_matrix()
+        )
         canvas.event_occurred(BeginTextEvent())
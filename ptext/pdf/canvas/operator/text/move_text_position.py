@@ -4,8 +4,7 @@ from typing import List
 
 from ptext.exception.pdf_exception import PDFTypeError
 from ptext.io.transform.types import AnyPDFType
-from ptext.pdf.canvas.geometry.matrix import Matrix
-from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
+from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator, NUMBER_TYPES
 
 
 class MoveTextPosition(CanvasOperator):
@@ -21,11 +20,11 @@ class MoveTextPosition(CanvasOperator):
 
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType] = []):
 
-        if not isinstance(operands[0], Decimal):
+        if not isinstance(operands[0], NUMBER_TYPES):
             raise PDFTypeError(
                 expected_type=Decimal, received_type=operands[0].__class__
             )
-        if not isinstance(operands[1], Decimal):
+        if not isinstance(operands[1], NUMBER_TYPES):
             raise PDFTypeError(
                 expected_type=Decimal, received_type=operands[1].__class__
             )
@@ -33,9 +32,7 @@ class MoveTextPosition(CanvasOperator):
         tx = operands[0]
         ty = operands[1]
 
-        m = Matrix.identity_matrix()
-        m[2][0] = tx
-        m[2][1] = ty
+        m = canvas.graphics_state.ctm.translation_matrix(tx, ty)
 
         canvas.graphics_state.text_matrix = m.mul(
             canvas.graphics_state.text_line_matrix
@@ -3,7 +3,7 @@ from typing import List
 
 from ptext.exception.pdf_exception import PDFTypeError
 from ptext.io.transform.types import AnyPDFType
-from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
+from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator, NUMBER_TYPES
 from ptext.pdf.canvas.operator.text.move_text_position import MoveTextPosition
 from ptext.pdf.canvas.operator.text.set_text_leading import SetTextLeading
 
@@ -22,11 +22,11 @@ class MoveTextPositionSetLeading(CanvasOperator):
 
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType] = []):
 
-        if not isinstance(operands[0], Decimal):
+        if not isinstance(operands[0], NUMBER_TYPES):
             raise PDFTypeError(
                 expected_type=Decimal, received_type=operands[0].__class__
             )
-        if not isinstance(operands[1], Decimal):
+        if not isinstance(operands[1], NUMBER_TYPES):
             raise PDFTypeError(
                 expected_type=Decimal, received_type=operands[1].__class__
             )
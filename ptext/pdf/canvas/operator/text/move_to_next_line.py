@@ -21,5 +21,6 @@ class MoveToNextLine(CanvasOperator):
         super().__init__("T*", 0)
 
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType] = []):
-        operands = [Decimal(0), -canvas.graphics_state.leading]
+        zero = 0.0 if canvas.graphics_state.fast_math else Decimal(0)
+        operands = [zero, -canvas.graphics_state.leading]
         MoveTextPosition().invoke(canvas, operands)
@@ -3,7 +3,7 @@ from typing import List
 
 from ptext.exception.pdf_exception import PDFTypeError
 from ptext.io.transform.types import AnyPDFType
-from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
+from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator, NUMBER_TYPES
 
 
 class SetCharacterSpacing(CanvasOperator):
@@ -18,7 +18,7 @@ class SetCharacterSpacing(CanvasOperator):
 
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType] = []):
 
-        if not isinstance(operands[0], Decimal):
+        if not isinstance(operands[0], NUMBER_TYPES):
             raise PDFTypeError(
                 expected_type=Decimal, received_type=operands[0].__class__
             )
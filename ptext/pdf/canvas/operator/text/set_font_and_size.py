@@ -4,6 +4,7 @@ from ptext.exception.pdf_exception import PDFTypeError
 from ptext.io.transform.types import AnyPDFType
 from ptext.pdf.canvas.font.font import Font
 from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
+from ptext.pdf.document import Document
 
 
 class SetFontAndSize(CanvasOperator):
@@ -36,6 +37,11 @@ class SetFontAndSize(CanvasOperator):
         if not isinstance(font_ref, Font):
             raise PDFTypeError(expected_type=Font, received_type=font_ref.__class__)
 
+        # share the GlyphTable of the font with every page of the Document that uses it
+        document = page.get_root()
+        if isinstance(document, Document):
+            document.get_font_registry().get_glyph_table(font_ref)
+
         # font size
         font_size = operands[1]
 
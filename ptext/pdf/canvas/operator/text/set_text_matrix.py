@@ -1,10 +1,8 @@
 import copy
-from decimal import Decimal
 from typing import List
 
 from ptext.io.transform.types import AnyPDFType
-from ptext.pdf.canvas.geometry.matrix import Matrix
-from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
+from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator, NUMBER_TYPES
 
 
 class SetTextMatrix(CanvasOperator):
@@ -24,14 +22,15 @@ class SetTextMatrix(CanvasOperator):
 
     def invoke(self, canvas: "Canvas", operands: List[AnyPDFType] = []):
 
-        assert isinstance(operands[0], Decimal)
-        assert isinstance(operands[1], Decimal)
-        assert isinstance(operands[2], Decimal)
-        assert isinstance(operands[3], Decimal)
-        assert isinstance(operands[4], Decimal)
-        assert isinstance(operands[5], Decimal)
+        assert isinstance(operands[0], NUMBER_TYPES)
+        assert isinstance(operands[1], NUMBER_TYPES)
+        assert isinstance(operands[2], NUMBER_TYPES)
+        assert isinstance(operands[3], NUMBER_TYPES)
+        assert isinstance(operands[4], NUMBER_TYPES)
+        assert isinstance(operands[5], NUMBER_TYPES)
 
-        mtx = Matrix.matrix_from_six_values(
+        # the matrix is of the same kind (Matrix, or FloatMatrix) as the CTM
+        mtx = canvas.graphics_state.ctm.matrix_from_six_values(
             operands[0],
             operands[1],
             operands[2],
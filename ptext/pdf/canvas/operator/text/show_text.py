@@ -19,8 +19,17 @@ class ShowText(CanvasOperator):
             raise PDFTypeError(
                 expected_type=String, received_type=operands[0].__class__
             )
+        # the position of (the next) text is only ever observed through TextRenderEvent(s),
+        # if no EventListener consumes them, neither the glyphs, nor their width, are calculated
+        if not canvas.has_event_listener_for(TextRenderEvent):
+            return
         tri = TextRenderEvent(canvas.graphics_state, operands[0])
         # render
         canvas.event_occurred(tri)
         # update text rendering location
-        canvas.graphics_state.text_matrix[2][0] += tri.get_baseline().length()
+        # (the text matrix may be shared with a saved graphics state, so it is replaced rather than changed)
+        canvas.graphics_state.text_matrix = (
+            canvas.graphics_state.text_matrix.add_to_translation(
+                tri.get_baseline().length(), 0
+            )
+        )
@@ -4,7 +4,7 @@ from typing import List
 from ptext.exception.pdf_exception import PDFTypeError
 from ptext.io.transform.types import AnyPDFType
 from ptext.pdf.canvas.event.text_render_event import TextRenderEvent
-from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
+from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator, NUMBER_TYPES
 
 
 class ShowTextWithGlyphPositioning(CanvasOperator):
@@ -30,6 +30,11 @@ class ShowTextWithGlyphPositioning(CanvasOperator):
         if not isinstance(operands[0], list):
             raise PDFTypeError(expected_type=list, received_type=operands[0].__class__)
 
+        # the position of (the next) text is only ever observed through TextRenderEvent(s),
+        # if no EventListener consumes them, neither the glyphs, nor their width, are calculated
+        if not canvas.has_event_listener_for(TextRenderEvent):
+            return
+
         for i in range(0, len(operands[0])):
             obj = operands[0][i]
 
@@ -39,17 +44,22 @@ class ShowTextWithGlyphPositioning(CanvasOperator):
                 # render
                 canvas.event_occurred(tri)
                 # update text rendering location
-                canvas.graphics_state.text_matrix[2][0] += tri.get_baseline().length()
+                # (the text matrix may be shared with a saved graphics state, so it is replaced rather than changed)
+                canvas.graphics_state.text_matrix = (
+                    canvas.graphics_state.text_matrix.add_to_translation(
+                        tri.get_baseline().length(), 0
+                    )
+                )
                 continue
 
             # adjust
-            if isinstance(obj, Decimal):
+            if isinstance(obj, NUMBER_TYPES):
                 gs = canvas.graphics_state
                 adjust_unscaled = obj
                 adjust_scaled = (
                     -adjust_unscaled
-                    * Decimal(0.001)
+                    * (0.001 if gs.fast_math else Decimal(0.001))
                     * gs.font_size
                     * (gs.horizontal_scaling / 100)
                 )
-                gs.text_matrix[2][0] -= adjust_scaled
+                gs.text_matrix = gs.text_matrix.add_to_translation(-adjust_scaled, 0)
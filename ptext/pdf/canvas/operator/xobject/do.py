@@ -39,7 +39,9 @@ class Do(CanvasOperator):
             else None
         )
 
-        if isinstance(xobject, PIL.Image.Image):
+        if isinstance(xobject, PIL.Image.Image) and canvas.has_event_listener_for(
+            ImageRenderEvent
+        ):
             canvas.event_occurred(
                 ImageRenderEvent(graphics_state=canvas.graphics_state, image=xobject)
             )
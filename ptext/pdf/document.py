@@ -1,10 +1,180 @@
-from ptext.io.transform.types import Dictionary
+import io
+import typing
+from typing import Optional, Tuple, Any, Iterator
+
+from ptext.io.transform.types import Dictionary, List, Reference, ReferenceProxy
+from ptext.pdf.canvas.font.font_registry import FontRegistry
 from ptext.pdf.trailer.document_info import DocumentInfo
 
 
 class Document(Dictionary):
+    def __init__(self):
+        super(Document, self).__init__()
+        self._io_source: Optional[io.IOBase] = None
+        self._tokenizer: Optional["HighLevelTokenizer"] = None
+        self._decode_budget: Optional["DecodeBudget"] = None
+        self._page_index: typing.List[Tuple[List, int, Any]] = []
+        self._page_tree_walker: Optional[Iterator[Tuple[List, int, Any]]] = None
+        self._is_page_index_complete: bool = False
+        # object number of a (lazily loaded) page -> page number
+        self._page_numbers: typing.Dict[int, int] = {}
+        self._font_registry: FontRegistry = FontRegistry()
+
     def get_document_info(self) -> "DocumentInfo":
         return DocumentInfo(self)
 
-    def get_page(self, page_number) -> "Page":
-        return self.get(["XRef", "Trailer", "Root", "Pages", "Kids", page_number])
+    def get_number_of_pages(self) -> int:
+        """
+        Return the number of pages in this Document.
+        The pages are counted by walking the page tree (the Count of its root may not match the actual pages).
+        """
+        self._extend_page_index()
+        return len(self._page_index)
+
+    def has_page(self, page_number: int) -> bool:
+        """
+        Return True if this Document has a Page at a given (0-based) page number, False otherwise.
+        The page tree is only walked as far as needed to find the Page.
+        """
+        self._extend_page_index(page_number)
+        return 0 <= page_number < len(self._page_index)
+
+    def get_page(self, page_number: int) -> "Page":
+        """
+        Return the Page at a given (0-based) page number.
+        If this Document was loaded lazily, only this Page is read (and processed).
+        """
+        kids, index, _ = self._get_page_index_entry(page_number)
+        return kids[index]
+
+    def get_page_number(self, object_number: int) -> Optional[int]:
+        """
+        Return the (0-based) page number of the Page with a given object number,
+        or None if the page tree does not refer to such a Page.
+        The page tree is only walked as far as needed to find the Page.
+        """
+        while (
+            object_number not in self._page_numbers and not self._is_page_index_complete
+        ):
+            self._extend_page_index(len(self._page_index))
+        return self._page_numbers.get(object_number)
+
+    def release_page(self, page_number: int) -> "Document":
+        """
+        Release the Page at a given (0-based) page number.
+        If this Document was loaded lazily, the Page is replaced by its (unresolved) reference again,
+        so that its content can be reclaimed. The Page is read (and processed) again when it is next accessed.
+        """
+        kids, index, kid = self._get_page_index_entry(page_number)
+        if isinstance(kid, ReferenceProxy):
+            list.__setitem__(kids, index, kid)
+        return self
+
+    def get_font_registry(self) -> FontRegistry:
+        """
+        Return the FontRegistry (holding the GlyphTable of each font) of this Document
+        """
+        return self._font_registry
+
+    def set_tokenizer(self, tokenizer: "HighLevelTokenizer") -> "Document":
+        """
+        Set the tokenizer this Document was read with.
+        This tokenizer is used to read (untransformed) objects from the XREF
+        """
+        self._tokenizer = tokenizer
+        return self
+
+    def get_decode_budget(self) -> Optional["DecodeBudget"]:
+        """
+        Return the DecodeBudget shared by all streams of this Document
+        """
+        return self._decode_budget
+
+    def set_decode_budget(self, decode_budget: "DecodeBudget") -> "Document":
+        """
+        Set the DecodeBudget shared by all streams of this Document
+        """
+        self._decode_budget = decode_budget
+        return self
+
+    def _get_page_index_entry(self, page_number: int) -> Tuple[List, int, Any]:
+        """
+        The page tree index maps every page number to its position (a Kids array, and an index in that array)
+        in the page tree, and the (possibly unresolved) object at that position.
+        It is built once, walking the page tree only as far as needed to find a given page.
+        """
+        if page_number < 0:
+            page_number += self.get_number_of_pages()
+        self._extend_page_index(page_number)
+        return self._page_index[page_number]
+
+    def _extend_page_index(self, page_number: Optional[int] = None) -> None:
+        if self._page_tree_walker is None:
+            self._page_tree_walker = self._walk_page_tree(
+                self["XRef"]["Trailer"]["Root"]["Pages"], set()
+            )
+        while not self._is_page_index_complete and (
+            page_number is None or len(self._page_index) <= page_number
+        ):
+            try:
+                kids, index, kid = next(self._page_tree_walker)
+            except StopIteration:
+                self._is_page_index_complete = True
+                break
+            if isinstance(kid, Reference) and kid.object_number is not None:
+                self._page_numbers.setdefault(kid.object_number, len(self._page_index))
+            self._page_index.append((kids, index, kid))
+
+    def _walk_page_tree(
+        self, node: Dictionary, visited: typing.Set[int]
+    ) -> Iterator[Tuple[List, int, Any]]:
+
+        # avoid circular reference
+        if id(node) in visited:
+            return
+        visited.add(id(node))
+
+        kids = node.get("Kids")
+        if not isinstance(kids, list):
+            return
+        for i in range(0, len(kids)):
+            kid = list.__getitem__(kids, i)
+            if kid is None:
+                continue
+
+            # determine the type of a kid without resolving it
+            kid_dictionary = kid
+            if isinstance(kid, ReferenceProxy):
+                assert self._tokenizer is not None
+                kid_dictionary = self["XRef"].get(
+                    kid, self._tokenizer.io_source, self._tokenizer
+                )
+            if not isinstance(kid_dictionary, dict):
+                continue
+            kid_type = kid_dictionary.get("Type")
+            if kid_type == "Pages" or (kid_type is None and "Kids" in kid_dictionary):
+                yield from self._walk_page_tree(kids[i], visited)
+            else:
+                yield kids, i, kid
+
+    def set_io_source(self, io_source: io.IOBase) -> "Document":
+        """
+        Set the io source owned by this Document.
+        This io source (e.g. a memory-mapped file) is closed when this Document is closed.
+        """
+        self._io_source = io_source
+        return self
+
+    def close(self) -> None:
+        """
+        Close this Document, releasing the io source it owns (if any)
+        """
+        if self._io_source is not None:
+            self._io_source.close()
+            self._io_source = None
+
+    def __enter__(self) -> "Document":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
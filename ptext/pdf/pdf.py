@@ -1,11 +1,24 @@
 import io
-from typing import List
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Union, Iterator, Optional, Type
 
+from ptext.io.filter.decode_pipeline import DecodeBudget
+from ptext.io.filter.stream_prefetcher import StreamPrefetcher
+from ptext.io.transform.base_transformer import TransformerContext
+from ptext.io.transform.types import StreamDecodePolicy
 from ptext.io.transform.default_low_level_object_transformer import (
     DefaultLowLevelObjectTransformer,
 )
-from ptext.pdf.canvas.event.event_listener import EventListener
+from ptext.io.source.buffer_source import MemoryMappedSource
+from ptext.io.transform.reference.default_reference_transformer import (
+    DefaultReferenceTransformer,
+)
+from ptext.pdf.canvas.event.event_listener import EventListener, Event
+from ptext.pdf.canvas.event.image_render_event import ImageRenderEvent
 from ptext.pdf.document import Document
+from ptext.pdf.page.page import Page
 
 
 class PDF:
@@ -25,7 +38,309 @@ class PDF:
     """
 
     @staticmethod
-    def loads(file: io.IOBase, event_listeners: List[EventListener] = []) -> Document:
-        return DefaultLowLevelObjectTransformer().transform(
-            file, parent_object=None, context=None, event_listeners=event_listeners
+    def loads(
+        file: io.IOBase,
+        event_listeners: List[EventListener] = [],
+        lazy: bool = False,
+        number_of_processes: Optional[int] = None,
+        decode_budget: Optional[DecodeBudget] = None,
+        stream_decode_policy: StreamDecodePolicy = StreamDecodePolicy.KEEP_BOTH,
+        number_of_threads: Optional[int] = None,
+        fast_math: bool = False,
+    ) -> Document:
+        """
+        This function reads a Document from an io source.
+        If lazy is set, indirect objects (pages, fonts, images, ..) are only read (and pages only processed)
+        when they are first accessed, rather than when the Document is loaded.
+        If number_of_processes is set, pages are processed in parallel by that many worker processes,
+        each working on its own copy of the EventListener(s). Their results are merged (in page order)
+        into the given EventListener(s), which must implement EventListener.merge and set can_be_merged
+        (a TypeError is raised otherwise).
+        The Document is returned as if it were loaded lazily.
+        If decode_budget is set, it limits the number of bytes a single stream (and all streams together) may decode to.
+        When pages are processed in parallel, each worker process reads the Document once, with its own copy of
+        decode_budget, so that the limit on all streams together applies to each worker process (rather than to the Document).
+        Streams are decoded when their DecodedBytes are first accessed, stream_decode_policy determines which
+        bytes (raw, decoded, both or neither) they keep afterwards.
+        If number_of_threads is set, the content stream(s) of each page are decoded (ahead of being processed)
+        by that many threads, while the fonts and images of the page are being read.
+        If fast_math is set, content streams are processed using floats (rather than exact, but slower, Decimal objects),
+        the numbers in the events that are sent out (e.g. TextRenderEvent, ImageRenderEvent) are then floats as well.
+        Events that none of the EventListener(s) consume (see EventListener.get_event_types) are not built.
+        If EventListener(s) are given, but none of them consumes ImageRenderEvent(s),
+        images are not read (nor decoded), they are kept as Stream objects.
+        """
+        if number_of_processes is not None and number_of_processes > 1:
+            return PDF._loads_in_parallel(
+                file,
+                event_listeners,
+                number_of_processes,
+                {
+                    "decode_budget": decode_budget,
+                    "stream_decode_policy": stream_decode_policy,
+                    "number_of_threads": number_of_threads,
+                    "fast_math": fast_math,
+                },
+            )
+        stream_prefetcher = PDF._get_stream_prefetcher(number_of_threads)
+        try:
+            return DefaultLowLevelObjectTransformer().transform(
+                file,
+                parent_object=None,
+                context=TransformerContext(
+                    resolve_references_lazily=lazy,
+                    decode_budget=decode_budget,
+                    stream_decode_policy=stream_decode_policy,
+                    stream_prefetcher=stream_prefetcher,
+                    fast_math=fast_math,
+                    read_images=PDF._reads_images(event_listeners),
+                ),
+                event_listeners=event_listeners,
+            )
+        finally:
+            # (lazily loaded) pages that are processed later on start new threads
+            if stream_prefetcher is not None:
+                stream_prefetcher.shutdown()
+
+    @staticmethod
+    def _reads_images(event_listeners: List[EventListener]) -> bool:
+        # a Document that is loaded without EventListener(s) is (presumably) used for its content, images included
+        return len(event_listeners) == 0 or any(
+            [l.consumes(ImageRenderEvent) for l in event_listeners]
+        )
+
+    @staticmethod
+    def _get_stream_prefetcher(
+        number_of_threads: Optional[int],
+    ) -> Optional[StreamPrefetcher]:
+        if number_of_threads is None or number_of_threads < 1:
+            return None
+        return StreamPrefetcher(number_of_threads)
+
+    @staticmethod
+    def open(
+        path: Union[str, "os.PathLike"],
+        event_listeners: List[EventListener] = [],
+        lazy: bool = False,
+        number_of_processes: Optional[int] = None,
+        decode_budget: Optional[DecodeBudget] = None,
+        stream_decode_policy: StreamDecodePolicy = StreamDecodePolicy.KEEP_BOTH,
+        number_of_threads: Optional[int] = None,
+        fast_math: bool = False,
+    ) -> Document:
+        """
+        This function memory-maps the file at the given path and reads it as a Document.
+        The raw bytes of streams are (zero-copy) views on the memory-mapped file,
+        the file is unmapped when the Document is closed:
+
+            with PDF.open("input.pdf") as doc:
+                ...
+        """
+        source = MemoryMappedSource(path)
+        try:
+            doc = PDF.loads(
+                source,
+                event_listeners,
+                lazy,
+                number_of_processes,
+                decode_budget,
+                stream_decode_policy,
+                number_of_threads,
+                fast_math,
+            )
+        except Exception as e:
+            source.close()
+            raise e
+        return doc.set_io_source(source)
+
+    @staticmethod
+    def _loads_in_parallel(
+        file: io.IOBase,
+        event_listeners: List[EventListener],
+        number_of_processes: int,
+        options: Dict[str, Any],
+    ) -> Document:
+
+        # check whether all EventListener(s) can be merged
+        for l in event_listeners:
+            if not l.can_be_merged:
+                raise TypeError(
+                    "%s can not be used to process pages in parallel" % type(l).__name__
+                )
+
+        # worker processes re-open files by name, and receive a copy of any other io source
+        source = getattr(file, "name", None)
+        if not isinstance(source, str) or not os.path.isfile(source):
+            file.seek(0)
+            source = bytes(file.read())
+
+        doc = PDF.loads(
+            file,
+            [],
+            lazy=True,
+            decode_budget=options["decode_budget"],
+            stream_decode_policy=options["stream_decode_policy"],
         )
+
+        # split the pages in ranges
+        number_of_pages = doc.get_number_of_pages()
+        number_of_ranges = max(1, min(number_of_pages, number_of_processes * 4))
+        first_pages = [
+            int(i * number_of_pages / number_of_ranges)
+            for i in range(0, number_of_ranges + 1)
+        ]
+
+        # each worker process reads the Document once,
+        # each range starts from a copy of the EventListener(s), as they are now
+        pickled_event_listeners = pickle.dumps(event_listeners)
+
+        # process ranges
+        with ProcessPoolExecutor(
+            max_workers=number_of_processes,
+            initializer=_initialize_worker,
+            initargs=(source, options, pickled_event_listeners),
+        ) as executor:
+            futures = [
+                executor.submit(_process_pages, first_pages[i], first_pages[i + 1])
+                for i in range(0, number_of_ranges)
+            ]
+            # merge (in page order)
+            for i in range(0, number_of_ranges):
+                for l, other in zip(event_listeners, futures[i].result()):
+                    l.merge(other, first_pages[i])
+
+        return doc
+
+    @staticmethod
+    def iter_pages(
+        file: io.IOBase,
+        event_listeners: List[EventListener] = [],
+        decode_budget: Optional[DecodeBudget] = None,
+        stream_decode_policy: StreamDecodePolicy = StreamDecodePolicy.KEEP_BOTH,
+        number_of_threads: Optional[int] = None,
+        fast_math: bool = False,
+    ) -> Iterator[Page]:
+        """
+        This function reads a Document from an io source, and yields its pages one at a time.
+        Each Page is processed (sending out its BeginPageEvent, EndPageEvent, etc) when it is yielded,
+        and released (along with its content, and images) when the next Page is requested.
+        Memory use does not grow with the number of pages.
+        """
+        transformer = DefaultLowLevelObjectTransformer()
+        stream_prefetcher = PDF._get_stream_prefetcher(number_of_threads)
+        doc = transformer.transform(
+            file,
+            parent_object=None,
+            context=TransformerContext(
+                resolve_references_lazily=True,
+                decode_budget=decode_budget,
+                stream_decode_policy=stream_decode_policy,
+                stream_prefetcher=stream_prefetcher,
+                fast_math=fast_math,
+                read_images=PDF._reads_images(event_listeners),
+            ),
+            event_listeners=event_listeners,
+        )
+        reference_transformer = next(
+            h
+            for h in transformer.handlers
+            if isinstance(h, DefaultReferenceTransformer)
+        )
+        try:
+            page_number = 0
+            while doc.has_page(page_number):
+                number_of_cached_objects = len(reference_transformer.cache)
+                try:
+                    yield doc.get_page(page_number)
+                finally:
+                    doc.release_page(page_number)
+                    reference_transformer.release(number_of_cached_objects)
+                page_number += 1
+        finally:
+            if stream_prefetcher is not None:
+                stream_prefetcher.shutdown()
+
+
+class _WorkerEventListener(EventListener):
+    """
+    This EventListener forwards the events of the Document of a worker process
+    to the EventListener(s) of the range of pages it is processing
+    """
+
+    def __init__(self, event_types: List[Type[Event]]):
+        self.event_types = event_types
+        self.listeners: List[EventListener] = []
+
+    def get_event_types(self) -> List[Type[Event]]:
+        return self.event_types
+
+    def event_occurred(self, event: Event) -> None:
+        for l in self.listeners:
+            l.event_occurred(event)
+
+
+# the Document of a worker process (read once, and shared by every range of pages the worker processes),
+# its io source, the EventListener that forwards its events, and the (pickled) EventListener(s) each range starts from
+_worker_document: Optional[Document] = None
+_worker_source: Optional[io.IOBase] = None
+_worker_event_listener: Optional[_WorkerEventListener] = None
+_worker_reference_transformer: Optional[DefaultReferenceTransformer] = None
+_worker_pickled_event_listeners: bytes = b""
+
+
+def _initialize_worker(
+    source: Union[str, bytes], options: Dict[str, Any], pickled_event_listeners: bytes
+) -> None:
+    global _worker_document, _worker_source, _worker_event_listener
+    global _worker_reference_transformer, _worker_pickled_event_listeners
+    if isinstance(source, str):
+        _worker_source = MemoryMappedSource(source)
+    else:
+        _worker_source = io.BytesIO(source)
+
+    # the worker consumes whatever the EventListener(s) consume
+    event_types: List[Type[Event]] = []
+    for l in pickle.loads(pickled_event_listeners):
+        event_types += [x for x in l.get_event_types() if x not in event_types]
+    _worker_event_listener = _WorkerEventListener(event_types)
+    _worker_pickled_event_listeners = pickled_event_listeners
+
+    transformer = DefaultLowLevelObjectTransformer()
+    _worker_document = transformer.transform(
+        _worker_source,
+        parent_object=None,
+        context=TransformerContext(
+            resolve_references_lazily=True,
+            decode_budget=options["decode_budget"],
+            stream_decode_policy=options["stream_decode_policy"],
+            stream_prefetcher=PDF._get_stream_prefetcher(options["number_of_threads"]),
+            fast_math=options["fast_math"],
+            read_images=PDF._reads_images([_worker_event_listener]),
+        ),
+        event_listeners=[_worker_event_listener],
+    )
+    _worker_reference_transformer = next(
+        h for h in transformer.handlers if isinstance(h, DefaultReferenceTransformer)
+    )
+
+
+def _process_pages(first_page: int, last_page: int) -> List[EventListener]:
+    """
+    This function processes a range of pages in a worker process,
+    returning (a copy of) the EventListener(s) that processed them
+    """
+    assert _worker_document is not None
+    assert _worker_event_listener is not None
+    assert _worker_reference_transformer is not None
+    event_listeners = pickle.loads(_worker_pickled_event_listeners)
+    _worker_event_listener.listeners = event_listeners
+    try:
+        for page_number in range(first_page, last_page):
+            # objects (other than fonts) that were read for a page are released along with it
+            number_of_cached_objects = len(_worker_reference_transformer.cache)
+            _worker_document.get_page(page_number)
+            _worker_document.release_page(page_number)
+            _worker_reference_transformer.release(number_of_cached_objects)
+    finally:
+        _worker_event_listener.listeners = []
+    return event_listeners
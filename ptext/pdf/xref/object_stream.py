@@ -0,0 +1,52 @@
+import io
+from typing import Optional, List
+
+from ptext.exception.pdf_exception import PDFTypeError
+from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
+from ptext.io.transform.types import AnyPDFType, Stream
+
+
+class ObjectStream:
+    """
+    An object stream, is a stream object in which a sequence of indirect objects may be stored, as an alternative to
+    their being stored at the outermost file level.
+    The stream data in an object stream shall contain the following items:
+    • N pairs of integers separated by white space, where the first integer in each pair shall represent the object
+    number of a compressed object and the second integer shall represent the byte offset in the decoded stream of
+    that object, relative to the first object stored in the object stream, the value of the stream’s First entry.
+    The offsets shall be in increasing order.
+    • The value of the First entry in the stream dictionary shall be the byte offset (in the decoded stream) of the
+    first compressed object.
+
+    This class reads the N pairs once, and parses each embedded object directly from its offset.
+    """
+
+    def __init__(self, stream_object: Stream):
+        if "DecodedBytes" not in stream_object:
+            raise PDFTypeError(expected_type=bytes, received_type=None)
+        decoded_bytes = stream_object["DecodedBytes"]
+        first_byte = int(stream_object.get("First", 0))
+
+        # read (object number, offset) pairs
+        header = bytes(decoded_bytes[0:first_byte]).split()
+        if "N" in stream_object:
+            header = header[0 : 2 * int(stream_object["N"])]
+        self.object_numbers: List[int] = [int(x) for x in header[0::2]]
+        self.byte_offsets: List[int] = [
+            first_byte + int(x) for x in header[1 : 2 * len(self.object_numbers) : 2]
+        ]
+
+        self._tokenizer = HighLevelTokenizer(io.BytesIO(decoded_bytes))
+
+    def get_object(self, index: int) -> Optional[AnyPDFType]:
+        """
+        This function returns the object at a given index in this ObjectStream,
+        or None if the index is out of bounds
+        """
+        if index < 0 or index >= len(self.byte_offsets):
+            return None
+        self._tokenizer.seek(self.byte_offsets[index])
+        return self._tokenizer.read_object()
+
+    def __len__(self):
+        return len(self.byte_offsets)
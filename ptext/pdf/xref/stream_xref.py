@@ -74,6 +74,7 @@ class StreamXREF(XREF):
                 document=document,
             )
         ]
+        indirect_references_by_object_number = {0: indirect_references[0]}
 
         # check size
         if "Size" not in xref_stream:
@@ -104,7 +105,7 @@ class StreamXREF(XREF):
             index = [Decimal(0), Decimal(number_of_objects)]
 
         # apply filters
-        xref_stream = decode_stream(xref_stream)
+        xref_stream = decode_stream(xref_stream, self._get_decode_budget())
 
         # read every range specified in \Index
         xref_stream_decoded_bytes = xref_stream["DecodedBytes"]
@@ -189,16 +190,8 @@ class StreamXREF(XREF):
                     )
 
                 # append
-                existing_indirect_ref = next(
-                    iter(
-                        [
-                            x
-                            for x in indirect_references
-                            if x.object_number is not None
-                            and x.object_number == Decimal(object_number)
-                        ]
-                    ),
-                    None,
+                existing_indirect_ref = indirect_references_by_object_number.get(
+                    object_number
                 )
                 ref_is_in_reading_state = (
                     existing_indirect_ref is not None
@@ -213,6 +206,9 @@ class StreamXREF(XREF):
 
                 if ref_is_first_encountered:
                     indirect_references.append(pdf_indirect_reference)
+                    indirect_references_by_object_number[object_number] = (
+                        pdf_indirect_reference
+                    )
                 elif ref_is_in_reading_state:
                     assert existing_indirect_ref is not None
                     assert pdf_indirect_reference is not None
@@ -1,25 +1,41 @@
 import io
 import logging
+from collections import OrderedDict
 from decimal import Decimal
-from typing import Union, Optional
+from typing import Union, Optional, Dict, Tuple
 
 from ptext.exception.pdf_exception import (
     StartXREFTokenNotFoundError,
     PDFTypeError,
     PDFSyntaxError,
 )
+from ptext.io.filter.decode_pipeline import DecodeBudget
 from ptext.io.filter.stream_decode_util import decode_stream
 from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
 from ptext.io.tokenize.low_level_tokenizer import TokenType
 from ptext.io.transform.types import Dictionary, Reference, AnyPDFType
+from ptext.pdf.document import Document
+from ptext.pdf.xref.object_stream import ObjectStream
 
 logger = logging.getLogger(__name__)
 
 
 class XREF(Dictionary):
+
+    OBJECT_STREAM_CACHE_SIZE = 16
+    OBJECT_CACHE_SIZE = 4096
+
     def __init__(self):
         super(XREF, self).__init__()
         self.entries = []
+        # indices on entries, the first entry for a given key wins
+        self._entries_by_object_number: Dict[int, Reference] = {}
+        self._entries_by_parent_stream: Dict[Tuple[int, int], Reference] = {}
+        # bounded caches for object streams and the objects parsed from them
+        self._object_streams: "OrderedDict[int, ObjectStream]" = OrderedDict()
+        self._objects_in_object_streams: "OrderedDict[Tuple[int, int], AnyPDFType]" = (
+            OrderedDict()
+        )
 
     ##
     ## LOWLEVEL IO
@@ -89,23 +105,33 @@ class XREF(Dictionary):
 
     def append(self, r: Reference) -> "XREF":
         self.entries.append(r)
+        if r.object_number is not None:
+            self._entries_by_object_number.setdefault(int(r.object_number), r)
+        if r.parent_stream_object_number is not None:
+            self._entries_by_parent_stream.setdefault(
+                (
+                    int(r.parent_stream_object_number),
+                    int(r.index_in_parent_stream),
+                ),
+                r,
+            )
         return self
 
     def merge(self, other_xref: "XREF") -> "XREF":
+        """
+        This function merges an (older) XREF section into this XREF.
+        Entries in this XREF take precedence over entries (with the same object number) in other_xref.
+        """
         for r in other_xref.entries:
-            duplicate_entries = []
+            is_duplicate = False
             if r.object_number is not None:
-                duplicate_entries = [
-                    x for x in self.entries if x.object_number == r.object_number
-                ]
+                is_duplicate = int(r.object_number) in self._entries_by_object_number
             elif r.parent_stream_object_number is not None:
-                duplicate_entries = [
-                    x
-                    for x in self.entries
-                    if x.parent_stream_object_number == r.parent_stream_object_number
-                    and x.index_in_parent_stream == r.index_in_parent_stream
-                ]
-            if len(duplicate_entries) == 0:
+                is_duplicate = (
+                    int(r.parent_stream_object_number),
+                    int(r.index_in_parent_stream),
+                ) in self._entries_by_parent_stream
+            if not is_duplicate:
                 self.append(r)
         return self
 
@@ -123,23 +149,21 @@ class XREF(Dictionary):
         if isinstance(indirect_reference, int) or isinstance(
             indirect_reference, Decimal
         ):
-            refs = [
-                x for x in self.entries if x.object_number == int(indirect_reference)
-            ]
-            if len(refs) == 0:
+            indirect_reference = self._entries_by_object_number.get(
+                int(indirect_reference)
+            )
+            if indirect_reference is None:
                 return None
-            indirect_reference = refs[0]
 
         # lookup Reference (in self) for Reference
         elif isinstance(indirect_reference, Reference):
-            refs = [
-                x
-                for x in self.entries
-                if x.object_number == indirect_reference.object_number
-            ]
-            if len(refs) == 0:
+            if indirect_reference.object_number is None:
+                return None
+            indirect_reference = self._entries_by_object_number.get(
+                int(indirect_reference.object_number)
+            )
+            if indirect_reference is None:
                 return None
-            indirect_reference = refs[0]
 
         # reference points to an object that is not in use
         assert isinstance(indirect_reference, Reference)
@@ -156,56 +180,94 @@ class XREF(Dictionary):
 
         # entry specifies a parent object
         if indirect_reference.parent_stream_object_number is not None:
+            obj = self._get_object_from_object_stream(
+                int(indirect_reference.parent_stream_object_number),
+                int(indirect_reference.index_in_parent_stream),
+                src,
+                tok,
+            )
+
+        # return
+        return obj
+
+    def _get_decode_budget(self) -> Optional[DecodeBudget]:
+        document = self.get_root()
+        if isinstance(document, Document):
+            return document.get_decode_budget()
+        return None
+
+    def _get_object_stream(
+        self,
+        object_stream_number: int,
+        src: io.IOBase,
+        tok: HighLevelTokenizer,
+    ) -> ObjectStream:
+
+        # lookup in cache
+        if object_stream_number in self._object_streams:
+            self._object_streams.move_to_end(object_stream_number)
+            return self._object_streams[object_stream_number]
+
+        stream_object = self.get(object_stream_number, src, tok)
+        assert isinstance(stream_object, dict)
+        if "Length" not in stream_object:
+            raise PDFTypeError(
+                expected_type=Union[Decimal, Reference], received_type=None
+            )
 
-            stream_object = self.get(
-                indirect_reference.parent_stream_object_number, src, tok
+        if "First" not in stream_object:
+            raise PDFTypeError(
+                expected_type=Union[Decimal, Reference], received_type=None
             )
-            assert isinstance(stream_object, dict)
-            if "Length" not in stream_object:
-                raise PDFTypeError(
-                    expected_type=Union[Decimal, Reference], received_type=None
-                )
 
-            if "First" not in stream_object:
-                raise PDFTypeError(
-                    expected_type=Union[Decimal, Reference], received_type=None
-                )
+        # Length may be Reference
+        if isinstance(stream_object["Length"], Reference):
+            stream_object["Length"] = self.get(
+                stream_object["Length"], src=src, tok=tok
+            )
 
-            # Length may be Reference
-            if isinstance(stream_object["Length"], Reference):
-                stream_object["Length"] = self.get(
-                    stream_object["Length"], src=src, tok=tok
-                )
+        # First may be Reference
+        if isinstance(stream_object["First"], Reference):
+            stream_object["First"] = self.get(stream_object["First"], src=src, tok=tok)
 
-            # First may be Reference
-            if isinstance(stream_object["First"], Reference):
-                stream_object["First"] = self.get(
-                    stream_object["First"], src=src, tok=tok
+        if "DecodedBytes" not in stream_object:
+            try:
+                stream_object = decode_stream(stream_object, self._get_decode_budget())
+            except Exception as ex:
+                logger.debug(
+                    "unable to inflate stream for object %d" % object_stream_number
                 )
+                raise ex
 
-            first_byte = int(stream_object.get("First", 0))
-            if "DecodedBytes" not in stream_object:
-                try:
-                    stream_object = decode_stream(stream_object)
-                except Exception as ex:
-                    logger.debug(
-                        "unable to inflate stream for object %d"
-                        % indirect_reference.parent_stream_object_number
-                    )
-                    raise ex
-            stream_bytes = stream_object["DecodedBytes"][first_byte:]
-
-            # tokenize parent stream
-            index = int(indirect_reference.index_in_parent_stream)
-            length = int(stream_object["Length"])
-            if index < length:
-                tok = HighLevelTokenizer(io.BytesIO(stream_bytes))
-                obj = [tok.read_object() for x in range(0, index + 1)]
-                obj = obj[-1]
-            else:
-                obj = None
+        # update cache
+        object_stream = ObjectStream(stream_object)
+        self._object_streams[object_stream_number] = object_stream
+        if len(self._object_streams) > XREF.OBJECT_STREAM_CACHE_SIZE:
+            self._object_streams.popitem(last=False)
+        return object_stream
 
-        # return
+    def _get_object_from_object_stream(
+        self,
+        object_stream_number: int,
+        index: int,
+        src: io.IOBase,
+        tok: HighLevelTokenizer,
+    ) -> Optional[AnyPDFType]:
+
+        # lookup in cache
+        key = (object_stream_number, index)
+        if key in self._objects_in_object_streams:
+            self._objects_in_object_streams.move_to_end(key)
+            return self._objects_in_object_streams[key]
+
+        # parse object from its offset
+        obj = self._get_object_stream(object_stream_number, src, tok).get_object(index)
+
+        # update cache
+        if obj is not None:
+            self._objects_in_object_streams[key] = obj
+            if len(self._objects_in_object_streams) > XREF.OBJECT_CACHE_SIZE:
+                self._objects_in_object_streams.popitem(last=False)
         return obj
 
     ##
@@ -0,0 +1,70 @@
+import os
+import unittest
+from collections import OrderedDict
+from decimal import Decimal
+from unittest import mock
+
+from ptext.pdf.canvas.font.afm.adobe_font_metrics import AdobeFontMetrics
+
+
+class TestAdobeFontMetrics(unittest.TestCase):
+    def test_afm_files_are_indexed_once(self):
+        with mock.patch.object(
+            AdobeFontMetrics, "_font_file_index", None
+        ), mock.patch.object(
+            AdobeFontMetrics, "_fonts_by_name", OrderedDict()
+        ), mock.patch.object(
+            AdobeFontMetrics, "_fonts_by_raw_name", {}
+        ), mock.patch.object(
+            os, "listdir", wraps=os.listdir
+        ) as listdir:
+            helvetica = AdobeFontMetrics.get("Helvetica")
+            for _ in range(0, 100):
+                AdobeFontMetrics.get("Helvetica")
+                AdobeFontMetrics.get("Times-Roman")
+                AdobeFontMetrics.get("ABCDEF+Arial")
+
+            # asserts
+            self.assertEqual(listdir.call_count, 1)
+            self.assertEqual(len(AdobeFontMetrics._get_font_file_index()), 14)
+
+        # asserts
+        self.assertIs(AdobeFontMetrics.get("helvetica"), helvetica)
+        self.assertEqual(helvetica["FontDescriptor"]["FontName"], "Helvetica")
+        self.assertEqual(helvetica["Widths"][ord("H") - 32], Decimal(722))
+        self.assertIsNone(AdobeFontMetrics.get("ABCDEF+Arial"))
+
+    def test_fonts_by_name_are_bounded(self):
+        with mock.patch.object(
+            AdobeFontMetrics, "_fonts_by_name", OrderedDict()
+        ), mock.patch.object(
+            AdobeFontMetrics, "_fonts_by_raw_name", {}
+        ), mock.patch.object(
+            AdobeFontMetrics, "FONTS_BY_NAME_CACHE_SIZE", 4
+        ):
+            helvetica = AdobeFontMetrics.get("Helvetica")
+            for i in range(0, 100):
+                AdobeFontMetrics.get("Helvetica")
+                AdobeFontMetrics.get("Arial" + chr(65 + i % 26) + chr(65 + i // 26))
+
+            # asserts
+            self.assertEqual(len(AdobeFontMetrics._fonts_by_name), 4)
+            self.assertLessEqual(len(AdobeFontMetrics._fonts_by_raw_name), 4)
+            self.assertIs(AdobeFontMetrics._fonts_by_name["HELVETICA"], helvetica)
+            self.assertIs(AdobeFontMetrics.get("HELVETICA"), helvetica)
+
+    def test_known_names_are_not_canonicalized(self):
+        with mock.patch.object(AdobeFontMetrics, "_fonts_by_raw_name", {}):
+            helvetica_bold = AdobeFontMetrics.get("Helvetica-Bold")
+            with mock.patch.object(
+                AdobeFontMetrics,
+                "_get_canonical_name",
+                wraps=AdobeFontMetrics._get_canonical_name,
+            ) as get_canonical_name:
+                for _ in range(0, 100):
+                    self.assertIs(
+                        AdobeFontMetrics.get("Helvetica-Bold"), helvetica_bold
+                    )
+
+            # asserts
+            self.assertEqual(get_canonical_name.call_count, 0)
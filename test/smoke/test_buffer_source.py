@@ -0,0 +1,40 @@
+import io
+import os
+import tempfile
+import unittest
+
+from ptext.io.source.buffer_source import BufferSource, MemoryMappedSource
+
+
+class TestBufferSource(unittest.TestCase):
+    def test_offset_is_applied_without_copy(self):
+
+        buffer = b"garbage%PDF-1.7\n1 0 obj"
+        src = BufferSource(buffer, offset=7)
+
+        # asserts
+        self.assertEqual(src.read(8), b"%PDF-1.7")
+        self.assertEqual(src.tell(), 8)
+        self.assertEqual(src.seek(0, io.SEEK_END), len(buffer) - 7)
+        self.assertEqual(src.read(), b"")
+        self.assertEqual(src.getvalue()[0:4].tobytes(), b"%PDF")
+        self.assertIsInstance(src.getvalue(), memoryview)
+
+    def test_memory_mapped_source_is_closed(self):
+
+        fd, path = tempfile.mkstemp(suffix=".pdf")
+        with os.fdopen(fd, "wb") as file_handle:
+            file_handle.write(b"%PDF-1.7\n")
+
+        try:
+            src = MemoryMappedSource(path)
+            view = src.getvalue()[0:4]
+            self.assertEqual(view.tobytes(), b"%PDF")
+
+            # views obtained before closing remain valid
+            src.close()
+            self.assertTrue(src.closed)
+            self.assertEqual(view.tobytes(), b"%PDF")
+            view.release()
+        finally:
+            os.remove(path)
@@ -0,0 +1,51 @@
+import io
+import typing
+import unittest
+
+from ptext.io.transform.types import AnyPDFType, CanvasOperatorName
+from ptext.pdf.canvas.canvas import Canvas
+from ptext.pdf.canvas.operator.canvas_operator import CanvasOperator
+
+
+class AppendRectangle(CanvasOperator):
+    def __init__(self):
+        super().__init__("re", 4)
+        self.rectangles = []
+
+    def invoke(self, canvas: "Canvas", operands: typing.List[AnyPDFType] = []):
+        self.rectangles.append([int(x) for x in operands])
+
+
+class Shade(CanvasOperator):
+    def __init__(self):
+        super().__init__("xsh", 1)
+        self.operands = []
+
+    def invoke(self, canvas: "Canvas", operands: typing.List[AnyPDFType] = []):
+        self.operands.append(operands[0])
+
+
+class TestCanvasOperatorRegistry(unittest.TestCase):
+    def test_user_registered_operator_is_invoked(self):
+
+        operator = AppendRectangle()
+        canvas = Canvas().add_canvas_operator(operator)
+        canvas.read(io.BytesIO(b"1 2 3 4 re 0 0 10 20 re q Q"))
+
+        # asserts
+        self.assertEqual(operator.rectangles, [[1, 2, 3, 4], [0, 0, 10, 20]])
+        self.assertEqual(len(canvas["Instructions"]), 4)
+
+    def test_added_operator_is_local_to_its_canvas(self):
+
+        operator = Shade()
+        canvas = Canvas().add_canvas_operator(operator)
+        canvas.read(io.BytesIO(b"/Sh0 xsh"))
+        other_canvas = Canvas()
+        other_canvas.read(io.BytesIO(b"q Q /Sh0 xsh"))
+
+        # asserts
+        self.assertEqual(operator.operands, ["Sh0"])
+        self.assertNotIn("xsh", CanvasOperatorName.VALID_NAMES)
+        self.assertNotIn("xsh", other_canvas.canvas_operator_names)
+        self.assertEqual(len(other_canvas["Instructions"]), 2)
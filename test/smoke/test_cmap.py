@@ -0,0 +1,120 @@
+import copy
+import pickle
+import unittest
+
+from ptext.pdf.canvas.font.cmap.cmap import CMap
+
+
+class TestCMap(unittest.TestCase):
+    def test_bfrange_is_not_expanded(self):
+        cmap = CMap().read(
+            "1 begincodespacerange <0000> <FFFF> endcodespacerange\n"
+            "1 beginbfchar <0001> <0041> endbfchar\n"
+            "2 beginbfrange <1000> <5FFF> <4E00> <6000> <6002> [<0061> <0062> <0063>] endbfrange"
+        )
+
+        # asserts
+        self.assertEqual(len(cmap._code_to_unicode), 1)
+        self.assertEqual(cmap.code_to_unicode(0x0001), 0x41)
+        self.assertEqual(cmap.code_to_unicode(0x1000), 0x4E00)
+        self.assertEqual(cmap.code_to_unicode(0x5FFF), 0x4E00 + 0x4FFF)
+        self.assertEqual(cmap.code_to_unicode(0x6001), 0x62)
+        self.assertIsNone(cmap.code_to_unicode(0x0FFF))
+        self.assertIsNone(cmap.code_to_unicode(0x6003))
+        self.assertEqual(cmap.unicode_to_code(0x4E01), 0x1001)
+        self.assertTrue(cmap.can_encode_character_code(0x2000))
+        self.assertFalse(cmap.can_encode_unicode(0x20))
+        self.assertEqual(cmap.get_codespace_ranges(), [(0x0000, 0xFFFF, 2)])
+
+    def test_later_mappings_take_precedence(self):
+        cmap = CMap().read(
+            "1 beginbfchar <0010> <0041> endbfchar\n"
+            "1 beginbfrange <0000> <00FF> <0100> endbfrange\n"
+            "1 beginbfchar <0020> <0042> endbfchar\n"
+            "1 beginbfrange <0080> <0081> <0200> endbfrange"
+        )
+
+        # asserts
+        self.assertEqual(cmap.code_to_unicode(0x10), 0x110)
+        self.assertEqual(cmap.code_to_unicode(0x20), 0x42)
+        self.assertEqual(cmap.code_to_unicode(0x80), 0x200)
+        self.assertEqual(cmap.code_to_unicode(0x82), 0x182)
+
+    def test_overlapping_ranges_are_split(self):
+        cmap = CMap().read(
+            "1 beginbfrange <0000> <00FF> <0100> endbfrange\n"
+            "1 beginbfrange <0080> <0081> <0200> endbfrange\n"
+            "1 beginbfrange <0010> <0013> [<0041> <0042> <0043> <0044>] endbfrange\n"
+            "1 beginbfrange <0012> <0020> <0300> endbfrange\n"
+            "1 beginbfrange <00F0> <0110> <D83D DE00> endbfrange"
+        )
+
+        # asserts
+        self.assertEqual(len(cmap._code_to_unicode), 0)
+        self.assertEqual(
+            [(low, high) for low, high, _ in cmap._ranges],
+            [
+                (0x00, 0x0F),
+                (0x10, 0x11),
+                (0x12, 0x20),
+                (0x21, 0x7F),
+                (0x80, 0x81),
+                (0x82, 0xEF),
+                (0xF0, 0x110),
+            ],
+        )
+        self.assertEqual(cmap.code_to_unicode(0x0F), 0x10F)
+        self.assertEqual(cmap.code_to_unicode(0x11), 0x42)
+        self.assertEqual(cmap.code_to_unicode(0x13), 0x301)
+        self.assertEqual(cmap.code_to_unicode(0x21), 0x121)
+        self.assertEqual(cmap.code_to_unicode(0x81), 0x201)
+        self.assertEqual(cmap.code_to_unicode(0x82), 0x182)
+        self.assertEqual(cmap.code_to_unicode(0xF1), (0xD83D, 0xDE01))
+        self.assertIsNone(cmap.code_to_unicode(0x111))
+
+    def test_comments_and_names_are_ignored(self):
+        cmap = CMap().read(
+            "% 1 beginbfchar <0001> <0058> endbfchar\n"
+            "2 beginbfchar <0020> /space <0021> <0021> endbfchar"
+        )
+
+        # asserts
+        self.assertIsNone(cmap.code_to_unicode(0x01))
+        self.assertIsNone(cmap.code_to_unicode(0x20))
+        self.assertEqual(cmap.code_to_unicode(0x21), 0x21)
+
+    def test_identical_cmaps_are_parsed_once(self):
+        cmap_bytes = "1 beginbfrange <0000> <00FF> <0300> endbfrange"
+        cmap_0 = CMap().read(cmap_bytes)
+        cmap_1 = CMap().read(cmap_bytes)
+
+        # asserts
+        self.assertIs(cmap_0._ranges, cmap_1._ranges)
+        self.assertEqual(cmap_1.code_to_unicode(0x41), 0x341)
+
+    def test_cached_cmaps_are_read_only(self):
+        cmap_bytes = "1 beginbfchar <0041> <0061> endbfchar"
+        cmap_0 = CMap().read(cmap_bytes)
+        cmap_1 = CMap().read(cmap_bytes)
+
+        # asserts
+        with self.assertRaises(TypeError):
+            cmap_0._code_to_unicode[0x42] = 0x62
+        cmap_0.read("1 beginbfchar <0042> <0062> endbfchar")
+        self.assertEqual(cmap_0.code_to_unicode(0x42), 0x62)
+        self.assertIsNone(cmap_1.code_to_unicode(0x42))
+        self.assertIsNone(CMap().read(cmap_bytes).code_to_unicode(0x42))
+        self.assertEqual(pickle.loads(pickle.dumps(cmap_1)).code_to_unicode(0x41), 0x61)
+        self.assertEqual(copy.deepcopy(cmap_1).code_to_unicode(0x41), 0x61)
+
+    def test_long_character_codes(self):
+        cmap = CMap().read(
+            "1 begincodespacerange <000000> <FFFFFF> endcodespacerange\n"
+            "1 beginbfchar <010203> <D83DDE00> endbfchar\n"
+            "1 beginbfrange <020000> <0200FF> <0041> endbfrange"
+        )
+
+        # asserts
+        self.assertEqual(cmap.code_to_unicode(0x010203), (0xD83D, 0xDE00))
+        self.assertEqual(cmap.code_to_unicode(0x020001), 0x42)
+        self.assertEqual(cmap.get_codespace_ranges(), [(0x000000, 0xFFFFFF, 3)])
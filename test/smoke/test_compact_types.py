@@ -0,0 +1,66 @@
+import copy
+import io
+import pickle
+import unittest
+
+from ptext.action.text.simple_text_extraction import SimpleTextExtraction
+from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
+from ptext.io.transform.types import (
+    CanvasOperatorName,
+    Decimal,
+    Dictionary,
+    Name,
+    Reference,
+)
+
+
+class TestCompactTypes(unittest.TestCase):
+    def test_names_are_interned(self):
+        obj = HighLevelTokenizer(io.BytesIO(b"[/Type /Page /Type]")).read_object()
+
+        # asserts
+        self.assertIs(obj[0], obj[2])
+        self.assertIs(obj[0], Name("Type"))
+        self.assertIs(pickle.loads(pickle.dumps(obj[0])), Name("Type"))
+        self.assertIs(copy.deepcopy(obj[1]), Name("Page"))
+        self.assertIs(CanvasOperatorName("Tj"), CanvasOperatorName("Tj"))
+
+    def test_primitives_keep_no_parent(self):
+        parent = Dictionary()
+        n = Name("Font").set_parent(parent)
+        d = Decimal("1.5").set_parent(parent)
+
+        # asserts
+        self.assertFalse(hasattr(n, "__dict__"))
+        self.assertFalse(hasattr(d, "__dict__"))
+        self.assertIsNone(n.get_parent())
+        self.assertIsNone(d.get_parent())
+        self.assertEqual(d, Decimal("1.5"))
+
+    def test_primitives_keep_no_event_listeners(self):
+        l = SimpleTextExtraction()
+        n = Name("Font").add_event_listener(l)
+        d = Decimal("1.5").add_event_listener(l)
+
+        # asserts
+        self.assertEqual(n.get_event_listeners(), [])
+        self.assertEqual(d.get_event_listeners(), [])
+        self.assertIs(n.remove_event_listener(l), n)
+
+    def test_containers_keep_parent(self):
+        parent = Dictionary()
+        child = Dictionary().set_parent(parent)
+
+        # asserts
+        self.assertIs(child.get_parent(), parent)
+        self.assertIs(child.get_root(), parent)
+
+    def test_references_are_slotted(self):
+        ref = Reference(object_number=12, generation_number=0)
+        ref.set_parent(Dictionary())
+
+        # asserts
+        self.assertFalse(hasattr(ref, "__dict__"))
+        self.assertIsNotNone(ref.get_parent())
+        self.assertEqual(pickle.loads(pickle.dumps(ref)).object_number, 12)
+        self.assertEqual(copy.deepcopy(ref).object_number, 12)
@@ -0,0 +1,87 @@
+import unittest
+import zlib
+from decimal import Decimal
+
+from ptext.exception.pdf_exception import DecodeBudgetExceededError
+from ptext.io.filter.decode_pipeline import DecodeBudget
+from ptext.io.filter.flate_decode import FlateDecode
+from ptext.io.filter.stream_decode_util import (
+    decode_stream,
+    iter_decoded_bytes,
+    open_decoded_stream,
+)
+from ptext.io.transform.types import Dictionary, Name, Stream
+
+
+def _build_flate_stream(bytes_in: bytes) -> Stream:
+    stream = Stream()
+    stream[Name("Filter")] = Name("FlateDecode")
+    stream[Name("Bytes")] = zlib.compress(bytes_in)
+    return stream
+
+
+class TestDecodePipeline(unittest.TestCase):
+    def test_decoded_bytes_are_yielded_in_chunks(self):
+
+        stream = _build_flate_stream(b"\x00" * (1 << 20))
+        chunks = [x for x in iter_decoded_bytes(stream, chunk_size=1 << 12)]
+
+        # asserts
+        self.assertTrue(all([len(x) <= 1 << 12 for x in chunks]))
+        self.assertEqual(b"".join(chunks), b"\x00" * (1 << 20))
+
+    def test_stream_budget_is_enforced(self):
+
+        stream = _build_flate_stream(b"\x00" * (1 << 24))
+        with self.assertRaises(DecodeBudgetExceededError):
+            decode_stream(stream, DecodeBudget(maximum_stream_size=1 << 20))
+        self.assertNotIn("DecodedBytes", stream)
+
+    def test_document_budget_is_shared_by_streams(self):
+
+        decode_budget = DecodeBudget(maximum_document_size=1 << 20)
+        decode_stream(_build_flate_stream(b"\x00" * (1 << 19)), decode_budget)
+        with self.assertRaises(DecodeBudgetExceededError):
+            decode_stream(
+                _build_flate_stream(b"\x00" * (1 << 19) + b"\x00"), decode_budget
+            )
+
+    def test_predictor_is_undone_across_chunks(self):
+
+        # PNG Up predictor, 4 columns
+        rows = b"".join([b"\x02\x01\x00\x10\x00" for _ in range(0, 1000)])
+        stream = _build_flate_stream(rows)
+        stream[Name("DecodeParms")] = Dictionary()
+        stream["DecodeParms"][Name("Predictor")] = Decimal(12)
+        stream["DecodeParms"][Name("Columns")] = Decimal(4)
+
+        # asserts
+        self.assertEqual(
+            b"".join(iter_decoded_bytes(stream, chunk_size=7)),
+            FlateDecode.decode(stream["Bytes"], predictor=12, columns=4),
+        )
+
+    def test_decoded_stream_can_be_read(self):
+
+        stream = _build_flate_stream(b"BT /F1 12 Tf (Hello) Tj ET")
+        with open_decoded_stream(stream) as decoded_stream:
+            self.assertEqual(decoded_stream.read(2), b"BT")
+            self.assertEqual(decoded_stream.read(), b" /F1 12 Tf (Hello) Tj ET")
+
+    def test_decoded_streams_are_read_one_after_the_other(self):
+
+        streams = [
+            _build_flate_stream(b"BT /F1 12 Tf"),
+            _build_flate_stream(b"(Hello) Tj ET"),
+        ]
+        with open_decoded_stream(streams) as decoded_stream:
+            self.assertEqual(decoded_stream.read(), b"BT /F1 12 Tf (Hello) Tj ET")
+
+        # streams that were decoded before are not decoded again
+        decode_budget = DecodeBudget(maximum_document_size=1 << 10)
+        decode_stream(streams[0], decode_budget)
+        with open_decoded_stream(streams, decode_budget) as decoded_stream:
+            decoded_stream.read()
+        self.assertEqual(
+            decode_budget.document_size, len(b"BT /F1 12 Tf") + len(b"(Hello) Tj ET")
+        )
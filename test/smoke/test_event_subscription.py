@@ -0,0 +1,109 @@
+import io
+import typing
+import unittest
+from unittest import mock
+
+from PIL import Image  # type: ignore [import]
+
+from ptext.action.image.simple_image_extraction import SimpleImageExtraction
+from ptext.action.location.location_filter import LocationFilter
+from ptext.action.text.font_extraction import FontExtraction
+from ptext.action.text.simple_text_extraction import SimpleTextExtraction
+from ptext.io.transform.types import Stream
+from ptext.pdf.canvas.event.begin_page_event import BeginPageEvent
+from ptext.pdf.canvas.event.event_listener import Event, EventListener
+from ptext.pdf.canvas.event.image_render_event import ImageRenderEvent
+from ptext.pdf.canvas.event.text_render_event import TextRenderEvent
+from ptext.pdf.pdf import PDF
+from test.util import build_single_page_pdf, build_stream
+
+
+def _build_pdf_with_text_and_image() -> bytes:
+    return build_single_page_pdf(
+        b"q 100 0 0 100 10 10 cm /Im1 Do Q BT /F1 12 Tf 72 700 Td (Hello) Tj ET",
+        resources=b"/Font << /F1 3 0 R >> /XObject << /Im1 6 0 R >>",
+        other_objects={
+            6: build_stream(
+                bytes([0, 64, 128, 255]),
+                b"/Type /XObject /Subtype /Image /Width 2 /Height 2 "
+                b"/ColorSpace /DeviceGray /BitsPerComponent 8 ",
+                compress=True,
+            )
+        },
+    )
+
+
+class EventCounter(EventListener):
+    def __init__(self, event_types: typing.List[typing.Type[Event]] = [Event]):
+        self.event_types = event_types
+        self.number_of_events = 0
+
+    def get_event_types(self) -> typing.List[typing.Type[Event]]:
+        return self.event_types
+
+    def event_occurred(self, event: Event) -> None:
+        self.number_of_events += 1
+
+
+class TestEventSubscription(unittest.TestCase):
+    def test_event_listener_consumes(self):
+        l = EventCounter([BeginPageEvent, TextRenderEvent])
+
+        # asserts
+        self.assertTrue(EventListener().consumes(ImageRenderEvent))
+        self.assertTrue(l.consumes(TextRenderEvent))
+        self.assertFalse(l.consumes(ImageRenderEvent))
+        self.assertEqual(
+            LocationFilter(0, 0, 100, 100)
+            .add_listener(l)
+            .add_listener(SimpleImageExtraction())
+            .get_event_types(),
+            [BeginPageEvent, TextRenderEvent, ImageRenderEvent],
+        )
+
+    def test_unconsumed_events_are_not_built(self):
+        pdf = _build_pdf_with_text_and_image()
+        with mock.patch.object(
+            TextRenderEvent, "__init__", autospec=True, return_value=None
+        ) as text_render_event_init, mock.patch.object(
+            ImageRenderEvent, "__init__", autospec=True, return_value=None
+        ) as image_render_event_init:
+            l = FontExtraction()
+            doc = PDF.loads(io.BytesIO(pdf), [l])
+
+            # asserts
+            self.assertEqual(text_render_event_init.call_count, 0)
+            self.assertEqual(image_render_event_init.call_count, 0)
+            self.assertEqual(l.get_font_names_per_page(0), ["Helvetica"])
+
+        # images are not read when no EventListener consumes them
+        image = doc.get_page(0)["Resources"]["XObject"]["Im1"]
+        self.assertIsInstance(image, Stream)
+
+    def test_consumed_events_are_built(self):
+        pdf = _build_pdf_with_text_and_image()
+        l0 = SimpleImageExtraction()
+        l1 = SimpleTextExtraction()
+        PDF.loads(io.BytesIO(pdf), [l0, l1])
+
+        # asserts
+        self.assertEqual(len(l0.get_images_per_page(0)), 1)
+        self.assertIsInstance(l0.get_images_per_page(0)[0], Image.Image)
+        self.assertEqual(l1.get_text(0), "Hello")
+
+    def test_images_are_read_without_event_listeners(self):
+        doc = PDF.loads(io.BytesIO(_build_pdf_with_text_and_image()))
+
+        # asserts
+        image = doc.get_page(0)["Resources"]["XObject"]["Im1"]
+        self.assertIsInstance(image, Image.Image)
+
+    def test_event_listeners_only_receive_events_of_their_document(self):
+        pdf = _build_pdf_with_text_and_image()
+        l0 = EventCounter()
+        PDF.loads(io.BytesIO(pdf), [l0])
+        l1 = EventCounter()
+        PDF.loads(io.BytesIO(pdf), [l1])
+
+        # asserts
+        self.assertEqual(l0.number_of_events, l1.number_of_events)
@@ -0,0 +1,68 @@
+import io
+import unittest
+from decimal import Decimal
+
+from ptext.pdf.canvas.event.event_listener import Event, EventListener
+from ptext.pdf.canvas.event.text_render_event import TextRenderEvent
+from ptext.pdf.canvas.geometry.matrix import FloatMatrix, Matrix
+from ptext.pdf.pdf import PDF
+from test.util import build_single_page_pdf
+
+
+def _build_pdf() -> bytes:
+    return build_single_page_pdf(
+        b"q 2 0 0 2 10 20 cm BT /F1 12 Tf 14 TL 72 350 Td (Hello) Tj T* "
+        b"[(Wor) -250 (ld)] TJ 0.5 0 0 0.5 20 40 Tm 1.5 Tc (Again) Tj ET Q"
+    )
+
+
+class TextRenderEventCollector(EventListener):
+    def __init__(self):
+        self.events = []
+
+    def event_occurred(self, event: Event) -> None:
+        if isinstance(event, TextRenderEvent):
+            self.events.append(event)
+
+
+class TestFastMath(unittest.TestCase):
+    def test_float_matrix_matches_matrix(self):
+        values = ["1.5", "0.25", "-0.5", "2", "72.5", "700.25"]
+        other_values = ["0", "1", "-1", "0", "10", "-20"]
+        m0 = Matrix.matrix_from_six_values(*[Decimal(x) for x in values])
+        m1 = Matrix.matrix_from_six_values(*[Decimal(x) for x in other_values])
+        f0 = FloatMatrix.matrix_from_six_values(*[float(x) for x in values])
+        f1 = FloatMatrix.matrix_from_six_values(*[float(x) for x in other_values])
+
+        # asserts
+        m2 = m0.mul(m1)
+        f2 = f0.mul(f1)
+        for i in range(0, 3):
+            for j in range(0, 3):
+                self.assertAlmostEqual(float(m2[i][j]), f2[i][j])
+        for p, q in zip(m2.cross(Decimal(3), Decimal(4), 1), f2.cross(3.0, 4.0, 1.0)):
+            self.assertAlmostEqual(float(p), q)
+
+    def test_fast_math_events(self):
+        events = {}
+        for fast_math in [False, True]:
+            l = TextRenderEventCollector()
+            PDF.loads(io.BytesIO(_build_pdf()), [l], fast_math=fast_math)
+            events[fast_math] = l.events
+
+        # asserts
+        self.assertEqual(len(events[False]), 4)
+        self.assertEqual(len(events[True]), 4)
+        for e0, e1 in zip(events[False], events[True]):
+            self.assertEqual(e0.get_text(), e1.get_text())
+            self.assertIsInstance(e1.get_font_size(), float)
+            self.assertIsInstance(e1.get_baseline().x0, float)
+            self.assertIsInstance(e1.get_space_character_width_in_text_space(), float)
+            for a, b in [
+                (e0.get_baseline().x0, e1.get_baseline().x0),
+                (e0.get_baseline().y0, e1.get_baseline().y0),
+                (e0.get_baseline().x1, e1.get_baseline().x1),
+                (e0.get_baseline().y1, e1.get_baseline().y1),
+            ]:
+                self.assertIsInstance(a, Decimal)
+                self.assertAlmostEqual(float(a), b, places=6)
@@ -0,0 +1,95 @@
+import unittest
+import zlib
+
+from ptext.exception.pdf_exception import PDFSyntaxError, PDFValueError
+from ptext.io.filter.ascii_hex_decode import ASCIIHexDecode
+from ptext.io.filter.decode_pipeline import BufferedFilterStage
+from ptext.io.filter.run_length_decode import RunLengthDecode
+from ptext.io.filter.stream_decode_util import (
+    _FILTER_STAGE_FACTORIES,
+    decode_stream,
+    register_filter,
+)
+from ptext.io.transform.types import Dictionary, List, Name, Stream
+
+
+def _build_stream(filters, bytes_in: bytes, decode_params=None) -> Stream:
+    stream = Stream()
+    if isinstance(filters, list):
+        stream[Name("Filter")] = List()
+        for f in filters:
+            stream["Filter"].append(Name(f))
+    else:
+        stream[Name("Filter")] = Name(filters)
+    if decode_params is not None:
+        stream[Name("DecodeParms")] = decode_params
+    stream[Name("Bytes")] = bytes_in
+    return stream
+
+
+class TestFilterRegistry(unittest.TestCase):
+    def test_ascii_hex_decode(self):
+        self.assertEqual(ASCIIHexDecode.decode(b"48 65\n6C\t6c 6F>"), b"Hello")
+        self.assertEqual(ASCIIHexDecode.decode(b"4865 6>00"), b"He`")
+        self.assertEqual(ASCIIHexDecode.decode(b">"), b"")
+        with self.assertRaises(PDFSyntaxError):
+            ASCIIHexDecode.decode(b"4X>")
+
+    def test_run_length_decode(self):
+        # 3 literal bytes, a run of 4 "z", 1 literal byte, EOD (and trailing garbage)
+        bytes_in = b"\x02abc\xfdz\x00d\x80garbage"
+        self.assertEqual(RunLengthDecode.decode(bytes_in), b"abczzzzd")
+        # longest run, and longest literal
+        bytes_in = b"\x81-\x7f" + bytes(range(0, 128)) + b"\x80"
+        self.assertEqual(
+            RunLengthDecode.decode(bytes_in), b"-" * 128 + bytes(range(0, 128))
+        )
+
+    def test_abbreviations(self):
+        for f, bytes_in in [
+            ("AHx", b"48656C6C6F>"),
+            ("A85", b"87cURDZ~>"),
+            ("RL", b"\x04Hello\x80"),
+            ("Fl", zlib.compress(b"Hello")),
+        ]:
+            stream = decode_stream(_build_stream(f, bytes_in))
+
+            # asserts
+            self.assertEqual(stream["DecodedBytes"], b"Hello")
+
+    def test_filter_chain_with_crypt_passthrough(self):
+        decode_params = List()
+        decode_params.append(Dictionary())
+        decode_params[0][Name("Name")] = Name("Identity")
+        decode_params.append(None)
+        stream = decode_stream(
+            _build_stream(
+                ["Crypt", "ASCIIHexDecode", "FlateDecode"],
+                zlib.compress(b"Hello").hex().encode("latin1") + b">",
+                decode_params,
+            )
+        )
+
+        # asserts
+        self.assertEqual(stream["DecodedBytes"], b"Hello")
+
+    def test_unknown_filter(self):
+        with self.assertRaises(PDFValueError):
+            decode_stream(_build_stream("JBIG3Decode", b""))
+
+    def test_register_filter(self):
+        previous_factory = _FILTER_STAGE_FACTORIES["ASCIIHexDecode"]
+        try:
+            register_filter(
+                "ASCIIHexDecode",
+                lambda decode_params, chunk_size: [
+                    BufferedFilterStage(lambda b: b.upper())
+                ],
+                ["AHx"],
+            )
+            stream = decode_stream(_build_stream("AHx", b"hello"))
+
+            # asserts
+            self.assertEqual(stream["DecodedBytes"], b"HELLO")
+        finally:
+            register_filter("ASCIIHexDecode", previous_factory, ["AHx"])
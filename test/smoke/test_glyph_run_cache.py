@@ -0,0 +1,77 @@
+import unittest
+from decimal import Decimal
+
+from ptext.io.transform.types import HexadecimalString, Name, Reference, String
+from ptext.pdf.canvas.canvas_graphics_state import CanvasGraphicsState
+from ptext.pdf.canvas.event.text_render_event import TextRenderEvent
+from ptext.pdf.canvas.font.font_registry import FontRegistry
+from ptext.pdf.canvas.font.glyph_table import GlyphTable
+from test.util import build_helvetica_font
+
+
+class TestGlyphRunCache(unittest.TestCase):
+    def test_glyph_runs_are_shared(self):
+        glyph_table = build_helvetica_font().get_glyph_table()
+        glyph_run = glyph_table.build_glyph_run(String("48"))
+        self.assertEqual(glyph_run.glyph_line.get_text(), "48")
+        glyph_run = glyph_table.build_glyph_run(String("Hi!"))
+
+        # asserts
+        self.assertEqual(glyph_run.glyph_line.get_text(), "Hi!")
+        self.assertEqual(glyph_run.width, Decimal(722 + 222 + 278))
+        self.assertIs(glyph_table.build_glyph_run(String("Hi!")), glyph_run)
+        self.assertEqual(
+            glyph_table.build_glyph_run(HexadecimalString("48")).glyph_line.get_text(),
+            "H",
+        )
+        self.assertEqual(glyph_table.get_number_of_glyph_run_hits(), 1)
+        self.assertEqual(glyph_table.get_number_of_glyph_run_misses(), 3)
+
+    def test_glyph_run_cache_is_bounded(self):
+        glyph_table = build_helvetica_font().get_glyph_table()
+        for i in range(0, GlyphTable.GLYPH_RUN_CACHE_SIZE + 1):
+            glyph_table.build_glyph_run(String(str(i)))
+
+        # the least recently used GlyphRun is evicted
+        glyph_table.build_glyph_run(String("1"))
+        glyph_table.build_glyph_run(String("0"))
+
+        # asserts
+        self.assertEqual(glyph_table.get_number_of_glyph_run_hits(), 1)
+        self.assertEqual(
+            glyph_table.get_number_of_glyph_run_misses(),
+            GlyphTable.GLYPH_RUN_CACHE_SIZE + 2,
+        )
+
+    def test_text_render_events_apply_their_own_font_size(self):
+        font = build_helvetica_font()
+        widths = {}
+        for fast_math in [False, True]:
+            for font_size in [10, 20]:
+                graphics_state = CanvasGraphicsState(fast_math=fast_math)
+                graphics_state.font = font
+                graphics_state.font_size = (
+                    float(font_size) if fast_math else Decimal(font_size)
+                )
+                graphics_state.character_spacing = 1.0 if fast_math else Decimal(1)
+                event = TextRenderEvent(graphics_state, String("Hi!"))
+                widths[(fast_math, font_size)] = float(event.get_baseline().x1)
+
+        # asserts
+        # (1222 units of glyph space, and 2 character spacings)
+        self.assertAlmostEqual(widths[(False, 10)], 14.22)
+        self.assertAlmostEqual(widths[(False, 20)], 26.44)
+        self.assertAlmostEqual(widths[(True, 10)], 14.22)
+        self.assertAlmostEqual(widths[(True, 20)], 26.44)
+        self.assertEqual(font.get_glyph_table().get_number_of_glyph_run_hits(), 3)
+
+    def test_font_registry_counts_glyph_run_hits(self):
+        registry = FontRegistry()
+        font = build_helvetica_font().set_reference(Reference(object_number=12))
+        glyph_table = registry.get_glyph_table(font)
+        glyph_table.build_glyph_run(String("Hi!"))
+        glyph_table.build_glyph_run(String("Hi!"))
+
+        # asserts
+        self.assertEqual(registry.get_number_of_glyph_run_hits(), 1)
+        self.assertEqual(registry.get_number_of_glyph_run_misses(), 1)
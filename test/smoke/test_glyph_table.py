@@ -0,0 +1,71 @@
+import unittest
+from decimal import Decimal
+
+from ptext.io.transform.types import HexadecimalString, Name, Reference, String
+from ptext.pdf.canvas.font.cmap.cmap import CMap
+from ptext.pdf.canvas.font.font_registry import FontRegistry
+from ptext.pdf.canvas.font.glyph_table import GlyphTable
+from test.util import build_helvetica_font
+
+
+class TestGlyphTable(unittest.TestCase):
+    def test_simple_string(self):
+        glyph_line = build_helvetica_font().build_glyph_line(String("Hi!"))
+
+        # asserts
+        self.assertEqual(glyph_line.get_text(), "Hi!")
+        self.assertEqual([g.code for g in glyph_line], [72, 105, 33])
+        self.assertEqual([g.width for g in glyph_line], [722, 222, 278])
+
+    def test_hexadecimal_string(self):
+        font = build_helvetica_font(
+            "1 begincodespacerange <0000> <FFFF> endcodespacerange "
+            "2 beginbfchar <0102> <0041> <41> <0042> endbfchar"
+        )
+        glyph_line = font.build_glyph_line(HexadecimalString("01024143"))
+
+        # asserts
+        self.assertEqual(glyph_line.get_text(), "ABC")
+        self.assertEqual([g.code for g in glyph_line], [0x0102, 0x41, 0x43])
+
+    def test_codespace_ranges(self):
+        cmap = CMap().read(
+            "2 begincodespacerange <00> <80> <8140> <9FFC> endcodespacerange "
+            "2 beginbfchar <0041> <0058> <8140> <3000> endbfchar"
+        )
+        font = build_helvetica_font()
+        font._to_unicode_map = cmap
+        glyph_line = font.build_glyph_line(HexadecimalString("00418140"))
+
+        # asserts
+        self.assertEqual(
+            cmap.get_codespace_ranges(), [(0x00, 0x80, 1), (0x8140, 0x9FFC, 2)]
+        )
+        # <0041> is not a 2-byte code, <00> and <41> are 1-byte codes
+        self.assertEqual(glyph_line.get_text(), "X　")
+        self.assertEqual([g.code for g in glyph_line], [0x00, 0x41, 0x8140])
+
+    def test_long_codespace_ranges(self):
+        font = build_helvetica_font(
+            "2 begincodespacerange <00> <7F> <01000000> <01FFFFFF> endcodespacerange "
+            "2 beginbfchar <01000041> <0058> <41> <0042> endbfchar"
+        )
+        glyph_line = font.build_glyph_line(HexadecimalString("4101000041"))
+
+        # asserts
+        self.assertEqual(glyph_line.get_text(), "BX")
+        self.assertEqual([g.code for g in glyph_line], [0x41, 0x01000041])
+
+    def test_font_registry_shares_glyph_tables(self):
+        registry = FontRegistry()
+        font_0 = build_helvetica_font().set_reference(Reference(object_number=12))
+        font_1 = build_helvetica_font().set_reference(Reference(object_number=12))
+        font_2 = build_helvetica_font()
+
+        # asserts
+        glyph_table = registry.get_glyph_table(font_0)
+        self.assertIsInstance(glyph_table, GlyphTable)
+        self.assertIs(registry.get_glyph_table(font_1), glyph_table)
+        self.assertIs(font_1.get_glyph_table(), glyph_table)
+        self.assertIsNot(registry.get_glyph_table(font_2), glyph_table)
+        self.assertEqual(len(registry), 1)
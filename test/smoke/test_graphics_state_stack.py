@@ -0,0 +1,31 @@
+import io
+import unittest
+from decimal import Decimal
+
+from ptext.pdf.canvas.canvas import Canvas
+
+
+class TestGraphicsStateStack(unittest.TestCase):
+    def test_push_shares_font_by_reference(self):
+
+        font = object()
+        canvas = Canvas()
+        canvas.graphics_state.font = font
+        canvas.read(io.BytesIO(b"q"))
+
+        # asserts
+        self.assertEqual(len(canvas.graphics_state_stack), 1)
+        self.assertIsNot(canvas.graphics_state_stack[-1], canvas.graphics_state)
+        self.assertIs(canvas.graphics_state_stack[-1].font, font)
+
+    def test_pop_restores_saved_state(self):
+
+        canvas = Canvas()
+        canvas.read(io.BytesIO(b"q 2 0 0 2 10 20 cm 0.5 g 3 w Q"))
+
+        # asserts
+        self.assertEqual(len(canvas.graphics_state_stack), 0)
+        self.assertEqual(canvas.graphics_state.ctm[0][0], Decimal(1))
+        self.assertEqual(canvas.graphics_state.ctm[2][1], Decimal(0))
+        self.assertEqual(canvas.graphics_state.line_width, Decimal(1))
+        self.assertEqual(canvas.graphics_state.non_stroke_color.red, Decimal(0))
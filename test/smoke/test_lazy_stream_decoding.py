@@ -0,0 +1,125 @@
+import io
+import unittest
+from unittest import mock
+
+from ptext.action.text.simple_text_extraction import SimpleTextExtraction
+from ptext.io.filter.decode_pipeline import DecodeBudget
+from ptext.io.tokenize.high_level_tokenizer import HighLevelTokenizer
+from ptext.io.transform.types import Name, Stream, StreamDecodePolicy
+from ptext.pdf.pdf import PDF
+from test.util import build_single_page_pdf, build_stream
+
+
+def _build_pdf_with_font_program() -> bytes:
+    return build_single_page_pdf(
+        b"BT /F1 12 Tf 72 700 Td (Hello) Tj ET",
+        other_objects={
+            3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /FontDescriptor 6 0 R >>",
+            6: b"<< /Type /FontDescriptor /FontName /Helvetica /Flags 32 /ItalicAngle 0 "
+            b"/Ascent 718 /Descent -207 /CapHeight 718 /StemV 88 /FontFile2 7 0 R >>",
+            # not valid zlib data, reading this font program would fail
+            7: build_stream(b"not a font program", b"/Filter /FlateDecode "),
+        },
+    )
+
+
+class TestLazyStreamDecoding(unittest.TestCase):
+    def test_font_program_is_not_decoded(self):
+
+        l = SimpleTextExtraction()
+        doc = PDF.loads(io.BytesIO(_build_pdf_with_font_program()), [l])
+
+        # asserts
+        self.assertEqual(l.get_text(0), "Hello")
+        page = doc.get_page(0)
+        self.assertNotIn("DecodedBytes", dict.keys(page["Contents"]))
+        font_program = page["Resources"]["Font"]["F1"]["FontDescriptor"]["FontFile2"]
+        self.assertNotIn("DecodedBytes", dict.keys(font_program))
+
+    def test_content_stream_is_not_materialized(self):
+
+        content = b"BT /F1 12 Tf 72 700 Td (Hello) Tj ET " + b"q Q " * 100000
+        window_sizes = []
+
+        def tokenizer(io_source, *args, **kwargs):
+            window_sizes.append(len(io_source.getvalue()))
+            return HighLevelTokenizer(io_source, *args, **kwargs)
+
+        l = SimpleTextExtraction()
+        with mock.patch(
+            "ptext.pdf.canvas.canvas.HighLevelTokenizer", side_effect=tokenizer
+        ), mock.patch.object(
+            Stream, "_decode", side_effect=AssertionError("content stream decoded")
+        ):
+            doc = PDF.loads(io.BytesIO(build_single_page_pdf(content)), [l])
+
+        # asserts
+        self.assertEqual(l.get_text(0), "Hello")
+        self.assertGreater(len(window_sizes), 1)
+        self.assertLess(max(window_sizes), len(content) // 2)
+        self.assertNotIn("DecodedBytes", dict.keys(doc.get_page(0)["Contents"]))
+
+    def test_decode_policies(self):
+
+        for decode_policy, keeps_raw_bytes, keeps_decoded_bytes in [
+            (StreamDecodePolicy.KEEP_BOTH, True, True),
+            (StreamDecodePolicy.KEEP_RAW_BYTES, True, False),
+            (StreamDecodePolicy.KEEP_DECODED_BYTES, False, True),
+            (StreamDecodePolicy.KEEP_NEITHER, False, False),
+        ]:
+            number_of_calls = [0]
+
+            def decoder(s, bytes_in):
+                number_of_calls[0] += 1
+                return bytes(bytes_in).upper()
+
+            stream = Stream()
+            stream[Name("Bytes")] = b"abc"
+            stream.set_decoder(decoder, decode_policy)
+
+            # asserts
+            self.assertEqual(stream["DecodedBytes"], b"ABC")
+            self.assertEqual(stream["DecodedBytes"], b"ABC")
+            self.assertEqual("Bytes" in stream, keeps_raw_bytes)
+            self.assertEqual("DecodedBytes" in dict.keys(stream), keeps_decoded_bytes)
+            self.assertEqual(number_of_calls[0], 1 if keeps_decoded_bytes else 2)
+
+    def test_raw_bytes_are_read_again(self):
+
+        stream = Stream()
+        stream[Name("Bytes")] = b"abc"
+        stream.set_decoder(
+            lambda s, bytes_in: bytes(bytes_in).upper(),
+            StreamDecodePolicy.KEEP_NEITHER,
+        )
+        stream.set_raw_bytes_reader(lambda: b"abc")
+
+        # asserts
+        self.assertEqual(stream["DecodedBytes"], b"ABC")
+        self.assertIsNone(stream._raw_bytes)
+        self.assertEqual(stream["DecodedBytes"], b"ABC")
+
+    def test_decode_budget_is_charged_once(self):
+
+        for decode_policy in [
+            StreamDecodePolicy.KEEP_RAW_BYTES,
+            StreamDecodePolicy.KEEP_NEITHER,
+        ]:
+            decode_budget = DecodeBudget()
+            doc = PDF.loads(
+                io.BytesIO(_build_pdf_with_font_program()),
+                [SimpleTextExtraction()],
+                decode_budget=decode_budget,
+                stream_decode_policy=decode_policy,
+            )
+            document_size = decode_budget.document_size
+            contents = doc.get_page(0)["Contents"]
+
+            # asserts
+            self.assertEqual(
+                contents["DecodedBytes"], b"BT /F1 12 Tf 72 700 Td (Hello) Tj ET"
+            )
+            self.assertEqual(decode_budget.document_size, document_size)
+            if decode_policy == StreamDecodePolicy.KEEP_NEITHER:
+                self.assertNotIn("Bytes", dict.keys(contents))
+                self.assertIsNone(contents._raw_bytes)
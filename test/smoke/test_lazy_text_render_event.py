@@ -0,0 +1,87 @@
+import unittest
+from decimal import Decimal
+
+from ptext.io.transform.types import String
+from ptext.pdf.canvas.canvas_graphics_state import CanvasGraphicsState
+from ptext.pdf.canvas.color.color import RGBColor
+from ptext.pdf.canvas.event.text_render_event import TextRenderEvent
+from ptext.pdf.canvas.font.glyph_line import Glyph, GlyphLine
+from ptext.pdf.canvas.font.glyph_table import GlyphRun
+from ptext.pdf.canvas.geometry.matrix import Matrix
+
+
+class CountingFont:
+    def __init__(self):
+        self.number_of_calls = {}
+
+    def _count(self, method_name: str) -> None:
+        self.number_of_calls[method_name] = self.number_of_calls.get(method_name, 0) + 1
+
+    def build_glyph_run(self, content) -> GlyphRun:
+        self._count("build_glyph_run")
+        return GlyphRun(
+            GlyphLine([Glyph(ord(c), ord(c), Decimal(500)) for c in content])
+        )
+
+    def get_font_name(self) -> str:
+        self._count("get_font_name")
+        return "Counting"
+
+    def get_ascent(self):
+        self._count("get_ascent")
+        return None
+
+    def get_space_character_width_estimate(self) -> Decimal:
+        self._count("get_space_character_width_estimate")
+        return Decimal(250)
+
+
+class TestLazyTextRenderEvent(unittest.TestCase):
+    def test_derived_properties_are_calculated_when_needed(self):
+        font = CountingFont()
+        graphics_state = CanvasGraphicsState()
+        graphics_state.font = font
+        graphics_state.font_size = Decimal(10)
+        event = TextRenderEvent(graphics_state, String("Hi"))
+
+        # asserts
+        self.assertEqual(font.number_of_calls, {})
+        self.assertIsNone(event.get_font_ascent())
+        self.assertIsNone(event.get_font_ascent())
+        self.assertEqual(font.number_of_calls, {"get_ascent": 1})
+        self.assertAlmostEqual(float(event.get_baseline().x1), 10)
+        self.assertEqual(event.get_text(), "Hi")
+        self.assertEqual(event.get_font_family(), "Counting")
+        self.assertEqual(event.get_font_family(), "Counting")
+        self.assertAlmostEqual(
+            float(event.get_space_character_width_in_text_space()), 2.5
+        )
+        self.assertAlmostEqual(
+            float(event.get_space_character_width_in_text_space()), 2.5
+        )
+        self.assertEqual(
+            font.number_of_calls,
+            {
+                "get_ascent": 1,
+                "build_glyph_run": 1,
+                "get_font_name": 1,
+                "get_space_character_width_estimate": 1,
+            },
+        )
+
+    def test_graphics_state_is_kept_as_it_was(self):
+        graphics_state = CanvasGraphicsState()
+        graphics_state.font = CountingFont()
+        graphics_state.font_size = Decimal(10)
+        event = TextRenderEvent(graphics_state, String("Hi"))
+
+        # operators replace (rather than change) the matrices and color of the graphics state
+        graphics_state.text_matrix = Matrix.translation_matrix(Decimal(100), 0)
+        graphics_state.non_stroke_color = RGBColor(Decimal(1), Decimal(0), Decimal(0))
+        graphics_state.font_size = Decimal(20)
+
+        # asserts
+        self.assertEqual(event.get_baseline().x0, Decimal(0))
+        self.assertAlmostEqual(float(event.get_baseline().x1), 10)
+        self.assertEqual(event.get_font_size(), Decimal(10))
+        self.assertEqual(event.get_font_color().to_rgb().red, Decimal(0))
@@ -0,0 +1,53 @@
+import io
+import unittest
+
+from ptext.exception.pdf_exception import PDFEOFError
+from ptext.io.tokenize.low_level_tokenizer import LowLevelTokenizer, TokenType
+
+
+class TestLowLevelTokenizer(unittest.TestCase):
+    def test_tokenize_content_stream(self):
+
+        src = io.BytesIO(
+            b"%comment\n<< /Type /Page >> [1 -2.5 +.3] (a (nested) \\) string) <48656C6C6F> <> BT Tj"
+        )
+        tok = LowLevelTokenizer(src)
+
+        tokens = []
+        t = tok.next_token()
+        while t is not None:
+            tokens.append((t.byte_offset, t.token_type, t.text))
+            t = tok.next_token()
+
+        # asserts
+        self.assertEqual(tokens[0], (0, TokenType.COMMENT, "%comment"))
+        self.assertEqual(tokens[1], (9, TokenType.START_DICT, "<<"))
+        self.assertEqual(tokens[2], (12, TokenType.NAME, "/Type"))
+        self.assertEqual(tokens[3], (18, TokenType.NAME, "/Page"))
+        self.assertEqual(tokens[4], (24, TokenType.END_DICT, ">>"))
+        self.assertEqual([x[2] for x in tokens[5:10]], ["[", "1", "-2.5", "+.3", "]"])
+        self.assertEqual(tokens[10][1:], (TokenType.STRING, "(a (nested) \\) string)"))
+        self.assertEqual(tokens[11][1:], (TokenType.HEX_STRING, "<48656C6C6F>"))
+        self.assertEqual(tokens[12][1:], (TokenType.HEX_STRING, "<>"))
+        self.assertEqual(tokens[13][1:], (TokenType.OTHER, "BT"))
+        self.assertEqual(tokens[14][1:], (TokenType.OTHER, "Tj"))
+
+    def test_io_source_position_is_kept_in_sync(self):
+
+        src = io.BytesIO(b"1 0 obj stream")
+        tok = LowLevelTokenizer(src)
+
+        # reading moves the io source
+        self.assertEqual(tok.next_token().text, "1")
+        self.assertEqual(src.tell(), 1)
+
+        # seeking the io source moves the tokenizer
+        src.seek(8)
+        self.assertEqual(tok.next_token().text, "stream")
+        self.assertEqual(src.tell(), 14)
+        self.assertIsNone(tok.next_token())
+
+    def test_unterminated_string_raises_eof(self):
+        tok = LowLevelTokenizer(io.BytesIO(b"(abc (def)"))
+        with self.assertRaises(PDFEOFError):
+            tok.next_token()
@@ -0,0 +1,78 @@
+import random
+import unittest
+from decimal import Decimal
+
+from ptext.io.filter.lzw_decode import LZWDecode
+from ptext.io.filter.stream_decode_util import decode_stream
+from ptext.io.transform.types import Dictionary, Name, Stream
+
+
+def _lzw_encode(bytes_in: bytes, early_change: int = 1) -> bytes:
+    bytes_out = bytearray()
+    bit_buffer = 0
+    number_of_bits = 0
+
+    def write(code: int, code_length: int):
+        nonlocal bit_buffer, number_of_bits
+        bit_buffer = (bit_buffer << code_length) | code
+        number_of_bits += code_length
+        while number_of_bits >= 8:
+            number_of_bits -= 8
+            bytes_out.append((bit_buffer >> number_of_bits) & 0xFF)
+
+    table = {bytes([i]): i for i in range(0, 256)}
+    code_length = 9
+    write(256, code_length)
+    w = b""
+    for b in bytes_in:
+        if w + bytes([b]) in table:
+            w += bytes([b])
+            continue
+        write(table[w], code_length)
+        if len(table) + 2 < 4000:
+            table[w + bytes([b])] = len(table) + 2
+            if len(table) + 1 + early_change >= (1 << code_length):
+                code_length += 1
+        else:
+            write(256, code_length)
+            table = {bytes([i]): i for i in range(0, 256)}
+            code_length = 9
+        w = bytes([b])
+    write(table[w], code_length)
+    write(257, code_length)
+    if number_of_bits > 0:
+        bytes_out.append((bit_buffer << (8 - number_of_bits)) & 0xFF)
+    return bytes(bytes_out)
+
+
+class TestLZWDecode(unittest.TestCase):
+    def test_example_from_specification(self):
+        # ISO 32000-1, 7.4.4.2, Example of LZW encoding
+        bytes_in = bytes([0x80, 0x0B, 0x60, 0x50, 0x22, 0x0C, 0x0C, 0x85, 0x01])
+        self.assertEqual(LZWDecode.decode(bytes_in), b"-----A---B")
+
+    def test_variable_code_length(self):
+        # enough distinct sequences to use 9, 10, 11 and 12 bit codes
+        random.seed(0)
+        bytes_in = bytes([random.choice(b"abc \n") for _ in range(0, 20000)])
+        for early_change in [0, 1]:
+            self.assertEqual(
+                LZWDecode.decode(_lzw_encode(bytes_in, early_change), early_change),
+                bytes_in,
+            )
+
+    def test_decode_params_in_stream(self):
+        # PNG Up predictor, 3 columns, EarlyChange 0
+        rows = b"".join([b"\x02\x01\x02\x03" for _ in range(0, 100)])
+        stream = Stream()
+        stream[Name("Filter")] = Name("LZWDecode")
+        stream[Name("Bytes")] = _lzw_encode(rows, early_change=0)
+        stream[Name("DecodeParms")] = Dictionary()
+        stream["DecodeParms"][Name("EarlyChange")] = Decimal(0)
+        stream["DecodeParms"][Name("Predictor")] = Decimal(12)
+        stream["DecodeParms"][Name("Columns")] = Decimal(3)
+        decode_stream(stream)
+
+        # asserts
+        self.assertEqual(stream["DecodedBytes"][0:6], bytes([1, 2, 3, 2, 4, 6]))
+        self.assertEqual(len(stream["DecodedBytes"]), 300)
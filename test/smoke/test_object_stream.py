@@ -0,0 +1,25 @@
+import unittest
+from decimal import Decimal
+
+from ptext.io.transform.types import Stream, Name
+from ptext.pdf.xref.object_stream import ObjectStream
+
+
+class TestObjectStream(unittest.TestCase):
+    def test_objects_are_parsed_from_their_offset(self):
+
+        header = b"10 0 11 11 12 17 "
+        body = b"<< /A 1 >>\n[1 2]\n(last)"
+        stream = Stream()
+        stream[Name("N")] = Decimal(3)
+        stream[Name("First")] = Decimal(len(header))
+        stream[Name("DecodedBytes")] = header + body
+        object_stream = ObjectStream(stream)
+
+        # asserts
+        self.assertEqual(len(object_stream), 3)
+        self.assertEqual(object_stream.object_numbers, [10, 11, 12])
+        self.assertEqual(str(object_stream.get_object(2)), "last")
+        self.assertEqual(len(object_stream.get_object(1)), 2)
+        self.assertEqual(object_stream.get_object(0)["A"], Decimal(1))
+        self.assertIsNone(object_stream.get_object(3))
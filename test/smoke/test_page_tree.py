@@ -0,0 +1,95 @@
+import io
+import unittest
+
+from ptext.action.text.simple_text_extraction import SimpleTextExtraction
+from ptext.io.transform.types import ReferenceProxy
+from ptext.pdf.pdf import PDF
+from test.util import build_multi_page_pdf, build_pdf, build_stream
+
+
+def _build_nested_pdf() -> bytes:
+    return build_pdf(
+        {
+            1: b"<< /Type /Catalog /Pages 2 0 R >>",
+            2: b"<< /Type /Pages /Kids [3 0 R 6 0 R] /Count 3 /MediaBox [0 0 500 700] >>",
+            3: b"<< /Type /Pages /Parent 2 0 R /Kids [4 0 R 5 0 R] /Count 2 /Rotate 90 >>",
+            4: b"<< /Type /Page /Parent 3 0 R /Contents 7 0 R >>",
+            5: b"<< /Type /Page /Parent 3 0 R /Contents 7 0 R /MediaBox [0 0 100 100] >>",
+            6: b"<< /Type /Page /Parent 2 0 R /Contents 7 0 R >>",
+            7: build_stream(b""),
+        }
+    )
+
+
+def _build_pdf_with_count(count: int) -> bytes:
+    # a (flat) page tree with 3 pages, and a root that claims to have count pages
+    return build_pdf(
+        {
+            1: b"<< /Type /Catalog /Pages 2 0 R >>",
+            2: b"<< /Type /Pages /Kids [3 0 R 4 0 R 5 0 R] /Count %d >>" % count,
+            3: b"<< /Type /Page /Parent 2 0 R /Contents 6 0 R >>",
+            4: b"<< /Type /Page /Parent 2 0 R /Contents 6 0 R >>",
+            5: b"<< /Type /Page /Parent 2 0 R /Contents 6 0 R >>",
+            6: build_stream(b""),
+        }
+    )
+
+
+class TestPageTree(unittest.TestCase):
+    def test_get_page_in_nested_page_tree(self):
+
+        for lazy in [False, True]:
+            doc = PDF.loads(io.BytesIO(_build_nested_pdf()), [], lazy=lazy)
+
+            # asserts
+            self.assertEqual(doc.get_number_of_pages(), 3)
+            self.assertEqual(
+                [int(x) for x in doc.get_page(0)["MediaBox"]], [0, 0, 500, 700]
+            )
+            self.assertEqual(int(doc.get_page(0)["Rotate"]), 90)
+            self.assertEqual(
+                [int(x) for x in doc.get_page(1)["MediaBox"]], [0, 0, 100, 100]
+            )
+            self.assertEqual(int(doc.get_page(1)["Rotate"]), 90)
+            self.assertNotIn("Rotate", doc.get_page(2))
+
+    def test_iter_pages_releases_pages(self):
+
+        pages = []
+        for page in PDF.iter_pages(io.BytesIO(_build_nested_pdf()), []):
+            pages.append(page)
+
+        # asserts
+        self.assertEqual(len(pages), 3)
+        kids = pages[2].get_parent()
+        self.assertIsInstance(list.__getitem__(kids, 1), ReferenceProxy)
+
+    def test_pages_are_counted_in_page_tree(self):
+
+        for count in [1, 5]:
+            pdf = _build_pdf_with_count(count)
+            for lazy in [False, True]:
+                doc = PDF.loads(io.BytesIO(pdf), [], lazy=lazy)
+
+                # asserts
+                self.assertEqual(doc.get_number_of_pages(), 3)
+                self.assertIsNotNone(doc.get_page(2))
+                self.assertFalse(doc.has_page(3))
+
+            # asserts
+            self.assertEqual(len(list(PDF.iter_pages(io.BytesIO(pdf), []))), 3)
+
+    def test_lazy_pages_accessed_out_of_order(self):
+
+        l = SimpleTextExtraction()
+        doc = PDF.loads(io.BytesIO(build_multi_page_pdf(3)), [l], lazy=True)
+        doc.get_page(2)
+        doc.get_page(0)
+
+        # a released page is processed again when it is next accessed
+        doc.release_page(2)
+        doc.get_page(2)
+
+        # asserts
+        self.assertEqual(l.text_per_page, {0: "Page 0", 2: "Page 2"})
+        self.assertEqual(len(l.text_render_info_per_page[2]), 1)
@@ -0,0 +1,66 @@
+import io
+import pickle
+import unittest
+
+from ptext.action.text.simple_text_extraction import SimpleTextExtraction
+from ptext.action.text.tf_idf_keyword_extraction import TFIDFKeywordExtraction
+from ptext.io.transform.types import StreamDecodePolicy
+from ptext.pdf import pdf
+from ptext.pdf.canvas.event.event_listener import EventListener
+from ptext.pdf.pdf import PDF
+from test.util import build_multi_page_pdf
+
+
+class TestParallelPageProcessing(unittest.TestCase):
+    def test_parallel_run_matches_serial_run(self):
+
+        pdf_bytes = build_multi_page_pdf(7)
+
+        l0 = SimpleTextExtraction()
+        PDF.loads(io.BytesIO(pdf_bytes), [l0])
+
+        l1 = SimpleTextExtraction()
+        PDF.loads(io.BytesIO(pdf_bytes), [l1], number_of_processes=2)
+
+        # asserts
+        self.assertEqual(l1.current_page, 6)
+        self.assertEqual(l1.get_text(6), "Page 6")
+        self.assertEqual(l0.text_per_page, l1.text_per_page)
+
+    def test_listener_without_merge_is_rejected(self):
+        with self.assertRaises(TypeError):
+            PDF.loads(
+                io.BytesIO(build_multi_page_pdf(2)),
+                [TFIDFKeywordExtraction()],
+                number_of_processes=2,
+            )
+
+    def test_only_listeners_that_implement_merge_can_be_merged(self):
+        self.assertTrue(SimpleTextExtraction().can_be_merged)
+        self.assertFalse(TFIDFKeywordExtraction().can_be_merged)
+        self.assertFalse(EventListener().can_be_merged)
+        with self.assertRaises(TypeError):
+            EventListener().merge(EventListener(), 0)
+
+    def test_worker_reads_document_once(self):
+
+        pdf._initialize_worker(
+            build_multi_page_pdf(7),
+            {
+                "decode_budget": None,
+                "stream_decode_policy": StreamDecodePolicy.KEEP_BOTH,
+                "number_of_threads": None,
+                "fast_math": False,
+            },
+            pickle.dumps([SimpleTextExtraction()]),
+        )
+        doc = pdf._worker_document
+        l0 = pdf._process_pages(0, 3)[0]
+        l1 = pdf._process_pages(3, 7)[0]
+
+        # asserts
+        self.assertIs(pdf._worker_document, doc)
+        self.assertEqual(l0.get_text(2), "Page 2")
+        self.assertNotIn(3, l0.text_per_page)
+        self.assertEqual(l1.get_text(3), "Page 3")
+        self.assertNotIn(2, l1.text_per_page)
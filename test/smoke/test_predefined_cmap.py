@@ -0,0 +1,94 @@
+import io
+import unittest
+from decimal import Decimal
+
+from ptext.action.text.simple_text_extraction import SimpleTextExtraction
+from ptext.pdf.canvas.font.cmap.predefined_cmap import PredefinedCMap
+from ptext.pdf.pdf import PDF
+from test.util import build_pdf, build_stream
+
+
+def _build_pdf_with_cjk_text(
+    encoding: bytes, content: bytes, widths: bytes = b""
+) -> bytes:
+    return build_pdf(
+        {
+            1: b"<< /Type /Catalog /Pages 2 0 R >>",
+            2: b"<< /Type /Pages /Kids [4 0 R] /Count 1 >>",
+            3: b"<< /Type /Font /Subtype /Type0 /BaseFont /MSGothic /Encoding /%s "
+            b"/DescendantFonts [6 0 R] >>" % encoding,
+            4: b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents 5 0 R >>",
+            5: build_stream(content),
+            6: b"<< /Type /Font /Subtype /CIDFontType2 /BaseFont /MSGothic "
+            b"/CIDSystemInfo << /Registry (Adobe) /Ordering (Japan1) /Supplement 2 >> "
+            b"/DW 1000 %s>>" % widths,
+        }
+    )
+
+
+class TestPredefinedCMap(unittest.TestCase):
+    def test_get_predefined_cmap(self):
+        cmap = PredefinedCMap.get("90ms-RKSJ-H")
+
+        # asserts
+        self.assertIs(PredefinedCMap.get("90ms-RKSJ-H"), cmap)
+        self.assertIs(PredefinedCMap.get("90ms-RKSJ-V")._lows.obj, cmap._lows.obj)
+        self.assertIsNone(PredefinedCMap.get("Identity-H"))
+        self.assertIsNone(PredefinedCMap.get("WinAnsiEncoding"))
+        self.assertEqual(cmap.get_name(), "90ms-RKSJ-H")
+        self.assertIn((0x8140, 0x9FFC, 2), cmap.get_codespace_ranges())
+        self.assertEqual(cmap.code_to_unicode(0x41), ord("A"))
+        self.assertEqual(cmap.code_to_unicode(0x82A0), ord("あ"))
+        self.assertEqual(cmap.code_to_unicode(0x889F), ord("亜"))
+        self.assertIsNone(cmap.code_to_unicode(0x8100))
+        self.assertEqual(cmap.unicode_to_code(ord("あ")), 0x82A0)
+        self.assertEqual(
+            PredefinedCMap.get("UniGB-UCS2-H").code_to_unicode(0x4E2D), 0x4E2D
+        )
+
+    def test_extract_text_in_shift_jis(self):
+        pdf = _build_pdf_with_cjk_text(
+            b"90ms-RKSJ-H", b"BT /F1 12 Tf 72 700 Td (\x82\xa0\x82\xa2A) Tj ET"
+        )
+        l = SimpleTextExtraction()
+        PDF.loads(io.BytesIO(pdf), [l])
+
+        # asserts
+        self.assertEqual(l.get_text(0), "あいA")
+
+    def test_extract_text_in_ucs2(self):
+        pdf = _build_pdf_with_cjk_text(
+            b"UniGB-UCS2-H", b"BT /F1 12 Tf 72 700 Td <4E2D6587> Tj ET"
+        )
+        l = SimpleTextExtraction()
+        PDF.loads(io.BytesIO(pdf), [l])
+
+        # asserts
+        self.assertEqual(l.get_text(0), "中文")
+
+    def test_predefined_cmap_can_not_be_read(self):
+        with self.assertRaises(TypeError):
+            PredefinedCMap.get("90ms-RKSJ-H").read("")
+
+    def test_widths_are_looked_up_by_cid(self):
+
+        for encoding, expected_widths in [
+            # a CID that is not in W gets the default width
+            (b"Identity-H", [500, 600, 700, 1000]),
+            # the CIDs of a predefined CMap are not known, its glyphs get the default width
+            (b"90ms-RKSJ-H", [1000, 1000, 1000, 1000]),
+        ]:
+            pdf = _build_pdf_with_cjk_text(
+                encoding,
+                b"BT /F1 12 Tf 72 700 Td <0001> Tj ET",
+                b"/W [1 [500 600] 10 20 700] ",
+            )
+            doc = PDF.loads(io.BytesIO(pdf))
+            font = doc.get_page(0)["Resources"]["Font"]["F1"]
+
+            # asserts
+            self.assertEqual(
+                [font.get_single_character_width(c) for c in [1, 2, 15, 30]],
+                [Decimal(w) for w in expected_widths],
+            )
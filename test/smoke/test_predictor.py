@@ -0,0 +1,84 @@
+import random
+import unittest
+import zlib
+
+import ptext.io.filter.predictor
+from ptext.io.filter.flate_decode import FlateDecode
+from ptext.io.filter.predictor import Predictor
+
+
+def _paeth(a: int, b: int, c: int) -> int:
+    p = a + b - c
+    if abs(p - a) <= abs(p - b) and abs(p - a) <= abs(p - c):
+        return a
+    if abs(p - b) <= abs(p - c):
+        return b
+    return c
+
+
+def _encode_png(rows, bpp, filter_type):
+    bytes_out = bytearray()
+    prior_row = [0] * len(rows[0])
+    for row in rows:
+        bytes_out.append(filter_type)
+        for i in range(0, len(row)):
+            a = row[i - bpp] if i >= bpp else 0
+            b = prior_row[i]
+            c = prior_row[i - bpp] if i >= bpp else 0
+            prediction = [0, a, b, (a + b) // 2, _paeth(a, b, c)][filter_type]
+            bytes_out.append((row[i] - prediction) % 256)
+        prior_row = row
+    return bytes(bytes_out)
+
+
+class TestPredictor(unittest.TestCase):
+    def setUp(self) -> None:
+        random.seed(0)
+        self.numpy = ptext.io.filter.predictor.numpy
+
+    def tearDown(self) -> None:
+        ptext.io.filter.predictor.numpy = self.numpy
+
+    def _decode_with_and_without_numpy(self, *args):
+        ptext.io.filter.predictor.numpy = self.numpy
+        bytes_with_numpy = Predictor.decode(*args)
+        ptext.io.filter.predictor.numpy = None
+        bytes_without_numpy = Predictor.decode(*args)
+        self.assertEqual(bytes_with_numpy, bytes_without_numpy)
+        return bytes_without_numpy
+
+    def test_png_predictors(self):
+        # 16 pixels, 3 colors, 8 bits per component
+        rows = [[random.randrange(0, 256) for _ in range(0, 48)] for _ in range(0, 10)]
+        for filter_type in range(0, 5):
+            bytes_in = _encode_png(rows, 3, filter_type)
+            bytes_out = self._decode_with_and_without_numpy(bytes_in, 15, 3, 8, 16)
+            self.assertEqual(bytes_out, bytes([x for row in rows for x in row]))
+
+    def test_png_predictors_mixed_in_bands(self):
+        # 16 pixels, 3 colors, 8 bits per component, every row using its own filter type
+        rows = [[random.randrange(0, 256) for _ in range(0, 48)] for _ in range(0, 10)]
+        bytes_in = b"".join(
+            [_encode_png(rows[0 : i + 1], 3, i % 5)[-49:] for i in range(0, len(rows))]
+        )
+        max_skewed_band_size = Predictor.MAX_SKEWED_BAND_SIZE
+        try:
+            Predictor.MAX_SKEWED_BAND_SIZE = 256
+            bytes_out = self._decode_with_and_without_numpy(bytes_in, 15, 3, 8, 16)
+        finally:
+            Predictor.MAX_SKEWED_BAND_SIZE = max_skewed_band_size
+        self.assertEqual(bytes_out, bytes([x for row in rows for x in row]))
+
+    def test_png_up_predictor_in_flate_stream(self):
+        # rows as they occur in an XREF stream (\W [1 2 1])
+        rows = [[1, 0, 16 * i, 0] for i in range(0, 12)]
+        bytes_in = zlib.compress(_encode_png(rows, 1, 2))
+        bytes_out = FlateDecode.decode(bytes_in, predictor=12, columns=4)
+        self.assertEqual(bytes_out, bytes([x for row in rows for x in row]))
+
+    def test_tiff_predictor(self):
+        # 2 colors, 4 bits per component, 3 columns
+        # samples (1, 2), (3, 4), (5, 6) are stored as differences (1, 2), (2, 2), (2, 2)
+        bytes_in = bytes([0x12, 0x22, 0x22])
+        bytes_out = self._decode_with_and_without_numpy(bytes_in, 2, 2, 4, 3)
+        self.assertEqual(bytes_out, bytes([0x12, 0x34, 0x56]))
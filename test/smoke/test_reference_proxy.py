@@ -0,0 +1,43 @@
+import unittest
+
+from ptext.io.transform.types import Dictionary, List, Name, Reference, ReferenceProxy
+
+
+class TestReferenceProxy(unittest.TestCase):
+    def test_proxy_is_resolved_once_on_access(self):
+
+        calls = []
+
+        def resolver():
+            calls.append(1)
+            return Name("Resolved")
+
+        d = Dictionary()
+        d[Name("Key")] = ReferenceProxy(Reference(object_number=1), resolver)
+
+        # asserts
+        self.assertEqual(len(calls), 0)
+        self.assertEqual(d["Key"], "Resolved")
+        self.assertEqual(d.get("Key"), "Resolved")
+        self.assertEqual(list(d.values()), ["Resolved"])
+        self.assertEqual(len(calls), 1)
+
+    def test_proxy_resolving_to_none_is_removed(self):
+
+        d = Dictionary()
+        d[Name("Key")] = ReferenceProxy(Reference(object_number=1), lambda: None)
+
+        # asserts
+        self.assertIsNone(d.get("Key"))
+        self.assertNotIn("Key", d)
+
+    def test_list_resolves_on_iteration(self):
+
+        l = List()
+        l.append(ReferenceProxy(Reference(object_number=1), lambda: Name("A")))
+        l.append(Name("B"))
+
+        # asserts
+        self.assertEqual([x for x in l], ["A", "B"])
+        self.assertEqual(l[0:1], ["A"])
+        self.assertNotIsInstance(list.__getitem__(l, 0), ReferenceProxy)
@@ -0,0 +1,51 @@
+import copy
+import io
+import os
+import pickle
+import tempfile
+import unittest
+
+from ptext.pdf.pdf import PDF
+from test.util import build_single_page_pdf
+
+
+class TestStreamCopy(unittest.TestCase):
+    def _check_page_can_be_copied(self, doc):
+        page = doc.get_page(0)
+        contents = page["Contents"]
+        font = page["Resources"]["Font"]["F1"]
+        decoded_bytes = contents["DecodedBytes"]
+
+        # asserts
+        for c in [copy.deepcopy(contents), pickle.loads(pickle.dumps(contents))]:
+            self.assertIsInstance(c["Bytes"], bytes)
+            self.assertEqual(c["DecodedBytes"], decoded_bytes)
+        for f in [copy.deepcopy(font), pickle.loads(pickle.dumps(font))]:
+            self.assertEqual(f["BaseFont"], "Helvetica")
+
+    def test_stream_bytes_are_copied_when_loaded(self):
+
+        pdf = build_single_page_pdf(b"BT /F1 12 Tf 72 720 Td (Hello) Tj ET")
+        doc = PDF.loads(io.BytesIO(pdf))
+
+        # asserts
+        self.assertIsInstance(doc.get_page(0)["Contents"]["Bytes"], bytes)
+        self._check_page_can_be_copied(doc)
+
+    def test_memory_mapped_stream_can_be_copied(self):
+
+        fd, path = tempfile.mkstemp(suffix=".pdf")
+        with os.fdopen(fd, "wb") as file_handle:
+            file_handle.write(
+                build_single_page_pdf(b"BT /F1 12 Tf 72 720 Td (Hello) Tj ET")
+            )
+
+        try:
+            doc = PDF.open(path)
+
+            # asserts
+            self.assertIsInstance(doc.get_page(0)["Contents"]["Bytes"], memoryview)
+            self._check_page_can_be_copied(doc)
+        finally:
+            doc = None
+            os.remove(path)
@@ -0,0 +1,188 @@
+import io
+import pickle
+import threading
+import unittest
+from unittest import mock
+
+from ptext.action.image.simple_image_extraction import SimpleImageExtraction
+from ptext.action.text.simple_text_extraction import SimpleTextExtraction
+from ptext.io.filter.decode_pipeline import DecodeBudget
+from ptext.io.filter.stream_prefetcher import StreamPrefetcher
+from ptext.io.transform.types import Name, Stream
+from ptext.pdf.pdf import PDF
+from test.util import (
+    build_multi_page_pdf,
+    build_pdf,
+    build_single_page_pdf,
+    build_stream,
+)
+
+
+def _build_pdf_with_content_streams(number_of_content_streams: int) -> bytes:
+    content_references = b" ".join(
+        [b"%d 0 R" % (5 + i) for i in range(0, number_of_content_streams)]
+    )
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: b"<< /Type /Pages /Kids [4 0 R] /Count 1 >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        4: b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 3 0 R >> >> /Contents [%s] >>"
+        % content_references,
+    }
+    for i in range(0, number_of_content_streams):
+        objects[5 + i] = build_stream(
+            b"BT /F1 12 Tf 72 %d Td (Line%d) Tj ET" % (700 - i * 14, i), compress=True
+        )
+    return build_pdf(objects)
+
+
+class TestStreamPrefetcher(unittest.TestCase):
+    def test_prefetched_stream_is_decoded_on_another_thread(self):
+
+        decoding_threads = []
+
+        def decoder(s, bytes_in):
+            decoding_threads.append(threading.current_thread())
+            return bytes(bytes_in).upper()
+
+        stream = Stream()
+        stream[Name("Bytes")] = b"abc"
+        stream.set_decoder(decoder)
+
+        prefetcher = StreamPrefetcher(2)
+        prefetcher.prefetch([stream, Name("not a stream")])
+        prefetcher.prefetch(stream)
+        prefetcher.shutdown()
+
+        # asserts
+        self.assertEqual(stream["DecodedBytes"], b"ABC")
+        self.assertEqual(stream["DecodedBytes"], b"ABC")
+        self.assertEqual(len(decoding_threads), 1)
+        self.assertIsNot(decoding_threads[0], threading.current_thread())
+
+    def test_prefetched_stream_raises_when_accessed(self):
+
+        def decoder(s, bytes_in):
+            raise ValueError("malformed stream")
+
+        stream = Stream()
+        stream[Name("Bytes")] = b"abc"
+        stream.set_decoder(decoder)
+
+        prefetcher = StreamPrefetcher(1)
+        prefetcher.prefetch(stream)
+        prefetcher.shutdown()
+
+        # asserts
+        with self.assertRaises(ValueError):
+            stream["DecodedBytes"]
+
+    def test_decode_budget_can_be_pickled(self):
+        budget = pickle.loads(pickle.dumps(DecodeBudget(maximum_document_size=10)))
+        budget.spend(8, 8)
+
+        # asserts
+        self.assertEqual(budget.document_size, 8)
+
+    def test_content_streams_are_prefetched(self):
+
+        pdf = _build_pdf_with_content_streams(32)
+        expected_text = "\n".join(["Line%d" % i for i in range(0, 32)])
+
+        for lazy in [False, True]:
+            l = SimpleTextExtraction()
+            doc = PDF.loads(io.BytesIO(pdf), [l], lazy=lazy, number_of_threads=4)
+            if lazy:
+                doc.get_page(0)
+
+            # asserts
+            self.assertEqual(l.get_text(0), expected_text)
+
+        l = SimpleTextExtraction()
+        for page in PDF.iter_pages(io.BytesIO(pdf), [l], number_of_threads=4):
+            pass
+
+        # asserts
+        self.assertEqual(l.get_text(0), expected_text)
+
+    def test_stream_is_prefetched_before_it_is_read(self):
+
+        prefetcher = StreamPrefetcher(1)
+        prefetcher.prefetch_object(12, lambda: b"ABC")
+        prefetched_bytes = prefetcher.pop_prefetched_object(12)
+
+        stream = Stream()
+        stream[Name("Bytes")] = b"abc"
+        stream.set_decoder(lambda s, bytes_in: self.fail("stream is decoded again"))
+        stream.set_prefetched_bytes(prefetched_bytes)
+        prefetcher.shutdown()
+
+        # asserts
+        self.assertEqual(stream["DecodedBytes"], b"ABC")
+        self.assertIsNone(prefetcher.pop_prefetched_object(12))
+
+    def test_next_page_is_prefetched(self):
+
+        pdf = build_multi_page_pdf(8)
+        document_sizes = []
+        for number_of_threads in [None, 2]:
+            l = SimpleTextExtraction()
+            decode_budget = DecodeBudget()
+            for page in PDF.iter_pages(
+                io.BytesIO(pdf),
+                [l],
+                decode_budget=decode_budget,
+                number_of_threads=number_of_threads,
+            ):
+                pass
+            document_sizes.append(decode_budget.document_size)
+
+            # asserts
+            self.assertEqual(
+                [l.get_text(i) for i in range(0, 8)],
+                ["Page %d" % i for i in range(0, 8)],
+            )
+
+        # asserts
+        # (content streams that are prefetched are charged to the DecodeBudget once)
+        self.assertEqual(document_sizes[0], document_sizes[1])
+
+    def test_images_are_prefetched(self):
+
+        pdf = build_single_page_pdf(
+            b"q 3 0 0 2 0 0 cm /Im0 Do Q",
+            resources=b"/XObject << /Im0 6 0 R >>",
+            other_objects={
+                6: build_stream(
+                    bytes(range(0, 60, 10)),
+                    b"/Type /XObject /Subtype /Image /Width 3 /Height 2 "
+                    b"/ColorSpace /DeviceGray /BitsPerComponent 8 ",
+                    compress=True,
+                )
+            },
+        )
+        images = []
+        document_sizes = []
+        for number_of_threads in [None, 2]:
+            l = SimpleImageExtraction()
+            decode_budget = DecodeBudget()
+            with mock.patch.object(
+                StreamPrefetcher,
+                "prefetch_object",
+                autospec=True,
+                side_effect=StreamPrefetcher.prefetch_object,
+            ) as prefetch_object:
+                PDF.loads(
+                    io.BytesIO(pdf),
+                    [l],
+                    decode_budget=decode_budget,
+                    number_of_threads=number_of_threads,
+                )
+            images.append(l.get_images_per_page(0)[0].tobytes())
+            document_sizes.append(decode_budget.document_size)
+
+        # asserts
+        self.assertEqual([c[0][1] for c in prefetch_object.call_args_list], [6])
+        self.assertEqual(images[0], images[1])
+        self.assertEqual(document_sizes[0], document_sizes[1])
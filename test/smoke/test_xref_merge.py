@@ -0,0 +1,31 @@
+import unittest
+
+from ptext.io.transform.types import Reference
+from ptext.pdf.xref.xref import XREF
+
+
+class TestXREFMerge(unittest.TestCase):
+    def test_most_recent_section_wins(self):
+
+        newest = XREF()
+        newest.append(Reference(object_number=1, byte_offset=100))
+        newest.append(
+            Reference(
+                object_number=2, parent_stream_object_number=5, index_in_parent_stream=0
+            )
+        )
+
+        oldest = XREF()
+        oldest.append(Reference(object_number=1, byte_offset=10))
+        oldest.append(Reference(object_number=3, byte_offset=30))
+
+        newest.merge(oldest)
+
+        # asserts
+        self.assertEqual(len(newest.entries), 3)
+        self.assertEqual(newest._entries_by_object_number[1].byte_offset, 100)
+        self.assertEqual(newest._entries_by_object_number[3].byte_offset, 30)
+        self.assertIs(
+            newest._entries_by_parent_stream[(5, 0)],
+            newest._entries_by_object_number[2],
+        )
@@ -0,0 +1,101 @@
+import typing
+import zlib
+
+from ptext.io.transform.types import Name
+from ptext.pdf.canvas.font.cmap.cmap import CMap
+from ptext.pdf.canvas.font.font_type_1 import FontType1
+
+
+def build_stream(data: bytes, entries: bytes = b"", compress: bool = False) -> bytes:
+    """
+    Build (the body of) a stream object with the given data,
+    the data is FlateDecode compressed if compress is True
+    """
+    if compress:
+        data = zlib.compress(data)
+        entries = b"/Filter /FlateDecode " + entries
+    return (
+        b"<< /Length %d %s>>\nstream\n" % (len(data), entries) + data + b"\nendstream"
+    )
+
+
+def build_pdf(objects: typing.Dict[int, bytes], trailer: bytes = b"") -> bytes:
+    """
+    Build a PDF (with a plaintext XREF) from the bodies of its objects, by object number.
+    Object 1 is the Catalog, object numbers that are not used are marked free.
+    """
+    out = b"%PDF-1.4\n"
+    offsets = {}
+    for n in sorted(objects):
+        offsets[n] = len(out)
+        out += b"%d 0 obj\n" % n + objects[n] + b"\nendobj\n"
+    xref_offset = len(out)
+    size = max(objects) + 1
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % size
+    for n in range(1, size):
+        if n in offsets:
+            out += b"%010d 00000 n \n" % offsets[n]
+        else:
+            out += b"0000000000 00000 f \n"
+    out += b"trailer\n<< /Size %d /Root 1 0 R %s>>\n" % (size, trailer)
+    out += b"startxref\n%d\n%%%%EOF\n" % xref_offset
+    return out
+
+
+def build_single_page_pdf(
+    content: bytes,
+    resources: bytes = b"/Font << /F1 3 0 R >>",
+    other_objects: typing.Dict[int, bytes] = {},
+) -> bytes:
+    """
+    Build a PDF with a single page, that shows the given (FlateDecode compressed) content.
+    Object 3 is the font F1 (Helvetica), object 4 the page, object 5 its content,
+    other objects should be numbered from 6 onwards.
+    """
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: b"<< /Type /Pages /Kids [4 0 R] /Count 1 >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        4: b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << %s >> /Contents 5 0 R >>" % resources,
+        5: build_stream(content, compress=True),
+    }
+    objects.update(other_objects)
+    return build_pdf(objects)
+
+
+def build_multi_page_pdf(number_of_pages: int) -> bytes:
+    """
+    Build a PDF with the given number of pages, each page shows the text "Page <page number>"
+    """
+    objects = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        2: b"<< /Type /Pages /Kids [%s] /Count %d >>"
+        % (
+            b" ".join([b"%d 0 R" % (10 + 2 * i) for i in range(number_of_pages)]),
+            number_of_pages,
+        ),
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    for i in range(number_of_pages):
+        objects[10 + 2 * i] = (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (11 + 2 * i)
+        )
+        objects[11 + 2 * i] = build_stream(
+            b"BT /F1 12 Tf 72 700 Td (Page %d) Tj ET" % i, compress=True
+        )
+    return build_pdf(objects)
+
+
+def build_helvetica_font(to_unicode_map: typing.Optional[str] = None) -> FontType1:
+    """
+    Build an (unembedded) Helvetica FontType1, with the given ToUnicode CMap (if any)
+    """
+    font = FontType1()
+    font[Name("Type")] = Name("Font")
+    font[Name("Subtype")] = Name("Type1")
+    font[Name("BaseFont")] = Name("Helvetica")
+    if to_unicode_map is not None:
+        font._to_unicode_map = CMap().read(to_unicode_map)
+    return font